@@ -2,12 +2,20 @@
 # Autor: GitHub Copilot
 # Un autómata celular que simula la evolución de la vida
 
-from sense_hat import SenseHat
+from headless_sense import create_sense_hat
+import argparse
+import threading
 import time
-import copy
 
-sense = SenseHat()
-sense.clear()
+from framebuffer import FrameBuffer
+from life_engines import HashLife, create_engine
+from life_patterns import PatternLibrary, pattern_size
+from frame_scheduler import FrameScheduler
+from intro_frames import FAST_INTRO_DURATION, INTRO_MODES, intro_mode, load_sequence
+from text_banner import BannerQueue
+
+sense = create_sense_hat(lazy=True)  # Se crea al primer uso
+display = FrameBuffer(sense)
 
 # 🎨 COLORES
 DEAD_COLOR = (0, 0, 0)           # Negro - célula muerta
@@ -15,16 +23,53 @@ ALIVE_COLOR = (0, 255, 0)        # Verde - célula viva
 CURSOR_COLOR = (255, 255, 0)     # Amarillo - cursor
 EDITING_COLOR = (255, 128, 0)    # Naranja - célula siendo editada
 
+# 🌍 MUNDO
+# La matriz LED muestra una ventana de 8x8 sobre un mundo que puede ser mucho mayor
+DISPLAY_SIZE = 8
+WORLD_WIDTH = 8
+WORLD_HEIGHT = 8
+WORLD_TOPOLOGY = 'bounded'       # bounded, torus o klein
+WORLD_ENGINE = 'auto'            # auto, bitboard, numpy o sparse
+HASHLIFE_MIN_MARGIN = 16         # 'j N' usa HashLife con esta distancia al borde (o este lado de toro)
+HASHLIFE_CELL_COST = 10e-6       # Segundos por célula y generación de HashLife hasta medirlo (pesimista)
+
+# 🔁 DETECCIÓN DE CICLOS
+CYCLE_HISTORY = 64               # Generaciones recordadas para buscar repeticiones
+CYCLE_ACTION = 'replay'          # stop: pausar al detectar un ciclo / replay: repetirlo sin recalcular
+
+# ⏱️ RITMO
+EVOLUTION_INTERVAL = 1.0         # Segundos entre generaciones
+RENDER_FPS = 20                  # Refrescos de la matriz por segundo
+
 # 🎮 ESTADO DEL JUEGO
 class ConwayGame:
-    def __init__(self):
-        # Grilla 8x8 para el juego
-        self.grid = [[False for _ in range(8)] for _ in range(8)]
-        self.cursor_x = 4
-        self.cursor_y = 4
+    def __init__(self, width=WORLD_WIDTH, height=WORLD_HEIGHT, topology=WORLD_TOPOLOGY,
+                 engine=WORLD_ENGINE):
+        # Mundo width x height (bitboard en Python puro, o numpy si está disponible)
+        self.engine = create_engine(width, height, topology, engine)
+        self.width = width
+        self.height = height
+        # Ventana visible en la matriz LED (esquina superior izquierda)
+        self.view_width = min(DISPLAY_SIZE, width)
+        self.view_height = min(DISPLAY_SIZE, height)
+        self.view_x = (width - self.view_width) // 2
+        self.view_y = (height - self.view_height) // 2
+        self.cursor_x = self.view_x + self.view_width // 2
+        self.cursor_y = self.view_y + self.view_height // 2
         self.editing_mode = True  # True = editando, False = simulando
         self.generation = 0
         self.paused = False
+        self.hashlife = None  # Se crea en el primer salto
+        self.library = PatternLibrary()  # Patrones del directorio patterns/
+        # Historial de estados {snapshot: generación} para detectar ciclos
+        self.history = {}
+        self.cycle_frames = []  # Estados del ciclo detectado (modo replay)
+        self.cycle_index = 0
+        self.known_cycle = set()  # Estados de un ciclo ya avisado (modo stop)
+        self.banners = BannerQueue()  # Textos que se desplazan sobre el tablero
+        # El salto 'j N' corre en el hilo de consola: evolve, render y las
+        # ediciones esperan a que termine en vez de ver el motor a medias
+        self.lock = threading.RLock()
         
         print("JUEGO DE LA VIDA DE CONWAY")
         print("CONTROLES:")
@@ -34,10 +79,21 @@ class ConwayGame:
         print("     y - Iniciar/pausar simulacion")
         print("     c - Limpiar grilla")
         print("     1-4 - Cargar patrones")
+        print("     s - Sopa aleatoria")
         print("     h - Ayuda")
         print("     q - Salir")
         print("\nCrea patrones y observa la evolucion!")
         
+    @property
+    def grid(self):
+        """Vista grid[y][x] del tablero (solo lectura, generada desde el motor)"""
+        return self.engine.to_grid()
+
+    @grid.setter
+    def grid(self, new_grid):
+        self.engine.load_grid(new_grid)
+        self.reset_history()
+
     def count_neighbors(self, x, y):
         """Cuenta los vecinos vivos de una célula"""
         count = 0
@@ -45,56 +101,282 @@ class ConwayGame:
             for dy in [-1, 0, 1]:
                 if dx == 0 and dy == 0:
                     continue
-                nx, ny = x + dx, y + dy
-                # Verificar límites
-                if 0 <= nx < 8 and 0 <= ny < 8:
-                    if self.grid[ny][nx]:
-                        count += 1
+                # Verificar límites (o dar la vuelta según la topología)
+                neighbor = self.engine.wrap(x + dx, y + dy)
+                if neighbor and self.engine.get(*neighbor):
+                    count += 1
         return count
     
     def evolve(self):
         """Aplica las reglas del Juego de la Vida para la siguiente generación"""
-        new_grid = [[False for _ in range(8)] for _ in range(8)]
-        
-        for y in range(8):
-            for x in range(8):
-                neighbors = self.count_neighbors(x, y)
-                
-                # Reglas del Juego de la Vida de Conway:
-                if self.grid[y][x]:  # Célula viva
-                    # 1. Cualquier célula viva con 2 o 3 vecinos vivos sobrevive
-                    if neighbors == 2 or neighbors == 3:
-                        new_grid[y][x] = True
-                    # 2. De lo contrario, muere por soledad o sobrepoblación
-                else:  # Célula muerta
-                    # 3. Cualquier célula muerta con exactamente 3 vecinos vivos nace
-                    if neighbors == 3:
-                        new_grid[y][x] = True
+        # Reglas del Juego de la Vida de Conway (calculadas por el motor):
+        # 1. Cualquier célula viva con 2 o 3 vecinos vivos sobrevive
+        # 2. De lo contrario, muere por soledad o sobrepoblación
+        # 3. Cualquier célula muerta con exactamente 3 vecinos vivos nace
+        if self.cycle_frames:
+            # Ciclo ya conocido: avanzar por los estados guardados sin recalcular
+            self.cycle_index = (self.cycle_index + 1) % len(self.cycle_frames)
+            self.engine.restore(self.cycle_frames[self.cycle_index])
+            self.generation += 1
+            print(f"Generacion {self.generation}")
+            return
         
-        self.grid = new_grid
+        if not self.history:
+            self.remember_state(self.engine.snapshot())
+        self.engine.step()
         self.generation += 1
         
         print(f"Generacion {self.generation}")
         
         # Verificar si hay células vivas
-        alive_count = sum(sum(row) for row in self.grid)
+        alive_count = self.engine.population()
         if alive_count == 0:
             print("Todas las celulas han muerto - simulacion detenida")
             self.editing_mode = True
             self.generation = 0
+            self.reset_history()
+            return
+        
+        self.check_cycle()
+    
+    def remember_state(self, snapshot):
+        """Guardar el estado en el historial acotado"""
+        self.history[snapshot] = self.generation
+        if len(self.history) > CYCLE_HISTORY:
+            # Los diccionarios conservan el orden de inserción: el primero es el más viejo
+            del self.history[next(iter(self.history))]
+    
+    def reset_history(self):
+        """Olvidar ciclos detectados (el tablero fue editado)"""
+        self.history = {}
+        self.cycle_frames = []
+        self.cycle_index = 0
+        self.known_cycle = set()
+    
+    def check_cycle(self):
+        """Buscar el estado actual en el historial y reportar el período"""
+        snapshot = self.engine.snapshot()
+        if snapshot in self.known_cycle:
+            # Ciclo ya avisado: al reanudar se deja correr sin volver a pausar
+            return
+        first_seen = self.history.get(snapshot)
+        if first_seen is None:
+            self.remember_state(snapshot)
+            return
+        
+        period = self.generation - first_seen
+        kind = "vida estatica (still life)" if period == 1 else f"oscilador p{period}"
+        
+        if CYCLE_ACTION == 'replay':
+            self.cycle_frames = [state for state, generation in self.history.items()
+                                 if generation >= first_seen]
+            self.cycle_index = 0
+            print(f"Ciclo detectado en la generacion {self.generation}: {kind} - repitiendo sin recalcular")
+        else:
+            self.paused = True
+            self.known_cycle = {state for state, generation in self.history.items()
+                                if generation >= first_seen}
+            self.history = {}
+            print(f"Ciclo detectado en la generacion {self.generation}: {kind} - simulacion pausada")
+    
+    def jump(self, generations):
+        """Avanzar muchas generaciones de golpe; equivale a llamar N veces a evolve
+
+        HashLife simula un plano infinito. En el toro y la botella de Klein el
+        mundo se repite en un mosaico de 3x3 copias: en g generaciones nada
+        viaja más de g células, así que si g no supera el lado del mundo la
+        copia central evoluciona igual que el mundo real. En un mundo acotado
+        no hay mosaico posible (lo que sale muere), así que HashLife solo se usa
+        mientras el patrón esté lejos de los bordes.
+
+        Cada tramo usa lo que salga más barato según lo medido: HashLife gana
+        con patrones ordenados (pistolas, naves, cenizas) y el motor normal con
+        sopas caóticas. Un tramo corto de HashLife se vuelve a probar cuando el
+        tiempo con el motor normal iguala lo que costó la última prueba, así que
+        las pruebas nunca suman más que el propio avance. Mientras HashLife
+        gane, cada tramo dobla al anterior si el anterior dejó libre al menos
+        tres cuartos de su memoria, y se reduce a la mitad si llenó más de la
+        mitad: al agotarla HashLife olvida lo calculado y recalcularlo puede
+        costar decenas de veces más. En mundos pequeños
+        (lado menor que HASHLIFE_MIN_MARGIN) o junto al borde de un mundo
+        acotado se avanza generación a generación; si el tablero entra en un
+        ciclo se saltan las vueltas que faltan.
+        """
+        if generations <= 0:
+            return
+        start = time.time()
+        clock = time.perf_counter
+        tiles = 1 if self.engine.topology == 'bounded' else 9
+        step_cost = None   # Segundos por generación del motor normal
+        cell_cost = None   # Segundos por célula y generación del último tramo de HashLife
+        trial_cost = None  # Lo que costó (o se estima que cuesta) probar HashLife
+        span = 0           # Generaciones del último tramo de HashLife
+        scale = 1          # Cuánto puede crecer el siguiente tramo según la memoria usada
+        stepping = 0.0     # Segundos con el motor normal desde el último tramo de HashLife
+        with self.lock:
+            remaining = generations
+            seen = {}  # estado -> generaciones que faltaban al verlo
+            while remaining > 0 and self.engine.population():
+                if self.engine.topology == 'bounded':
+                    chunk = min(remaining, self.edge_margin())
+                else:
+                    chunk = min(remaining, self.width, self.height)
+                if chunk >= HASHLIFE_MIN_MARGIN and step_cost is not None:
+                    cells = self.engine.population() * tiles
+                    if trial_cost is None:
+                        trial_cost = cells * HASHLIFE_MIN_MARGIN * HASHLIFE_CELL_COST
+                    explore = stepping >= trial_cost
+                    if explore or (cell_cost is not None and cells * cell_cost < step_cost):
+                        if explore:
+                            span = HASHLIFE_MIN_MARGIN
+                        else:
+                            span = max(HASHLIFE_MIN_MARGIN, min(chunk, int(span * scale)))
+                        started = clock()
+                        overflows = self.hashlife.overflows if self.hashlife else 0
+                        self.hashlife_advance(span)
+                        used = self.hashlife.cache_size()
+                        if self.hashlife.overflows != overflows or used * 2 > self.hashlife.max_nodes:
+                            scale = 0.5
+                        elif used * 4 <= self.hashlife.max_nodes:
+                            scale = 2
+                        else:
+                            scale = 1
+                        trial_cost = clock() - started
+                        cell_cost = trial_cost / (cells * span)
+                        stepping = 0.0
+                        remaining -= span
+                        seen = {}
+                        continue
+                snapshot = self.engine.snapshot()
+                if snapshot in seen:
+                    remaining %= seen[snapshot] - remaining
+                    seen = {}
+                    continue
+                seen[snapshot] = remaining
+                if len(seen) > CYCLE_HISTORY:
+                    del seen[next(iter(seen))]
+                started = clock()
+                self.engine.step()
+                step_cost = clock() - started
+                stepping += step_cost
+                remaining -= 1
+            self.generation += generations
+            self.reset_history()
+        print(f"Salto de {generations} generaciones en {time.time() - start:.2f}s - "
+              f"Generacion {self.generation}, {self.engine.population()} celulas vivas")
+    
+    def edge_margin(self):
+        """Generaciones que puede avanzar el patrón sin que nada llegue a salir del tablero"""
+        cells = list(self.engine.live_cells())
+        xs = [x for x, _ in cells]
+        ys = [y for _, y in cells]
+        return min(min(xs), min(ys), self.width - 1 - max(xs), self.height - 1 - max(ys))
+    
+    def tiled_cells(self):
+        """Células vivas del mosaico de 3x3 copias del mundo (toro o Klein)"""
+        cells = []
+        for x, y in self.engine.live_cells():
+            for tile_y in (-1, 0, 1):
+                # En Klein las copias de arriba y abajo están reflejadas en x
+                tile_x = self.width - 1 - x if tile_y and self.engine.topology == 'klein' else x
+                for offset_x in (-self.width, 0, self.width):
+                    cells.append((tile_x + offset_x, y + tile_y * self.height))
+        return cells
+    
+    def hashlife_advance(self, generations):
+        """Avanzar con HashLife sin que los bordes cambien el resultado (ver jump)"""
+        if self.hashlife is None:
+            self.hashlife = HashLife()
+        if self.engine.topology == 'bounded':
+            self.hashlife.load(self.engine.live_cells())
+        else:
+            self.hashlife.load(self.tiled_cells())
+        self.hashlife.advance(generations)
+        self.engine.clear()
+        for x, y in self.hashlife.live_cells():
+            if 0 <= x < self.width and 0 <= y < self.height:
+                self.engine.set(x, y, True)
     
     def toggle_cell(self, x, y):
         """Alternar el estado de una célula"""
-        self.grid[y][x] = not self.grid[y][x]
-        action = "colocada" if self.grid[y][x] else "eliminada"
+        alive = self.engine.toggle(x, y)
+        self.reset_history()
+        action = "colocada" if alive else "eliminada"
         print(f"Celula {action} en ({x}, {y})")
     
     def clear_grid(self):
         """Limpiar toda la grilla"""
-        self.grid = [[False for _ in range(8)] for _ in range(8)]
+        self.engine.clear()
         self.generation = 0
+        self.reset_history()
         print("Grilla limpiada")
     
+    def randomize(self, density=0.3):
+        """Llenar el mundo con una sopa aleatoria"""
+        import random
+        self.clear_grid()
+        cells = self.width * self.height
+        grid = [[random.random() < density for _ in range(self.width)] for _ in range(self.height)]
+        self.engine.load_grid(grid)
+        self.reset_history()
+        print(f"Sopa aleatoria: {self.engine.population()} de {cells} celulas vivas")
+    
+    def move_cursor(self, dx, dy):
+        """Mover el cursor por el mundo; la ventana lo sigue al llegar al borde"""
+        self.cursor_x = max(0, min(self.width - 1, self.cursor_x + dx))
+        self.cursor_y = max(0, min(self.height - 1, self.cursor_y + dy))
+        if self.cursor_x < self.view_x:
+            self.view_x = self.cursor_x
+        elif self.cursor_x >= self.view_x + self.view_width:
+            self.view_x = self.cursor_x - self.view_width + 1
+        if self.cursor_y < self.view_y:
+            self.view_y = self.cursor_y
+        elif self.cursor_y >= self.view_y + self.view_height:
+            self.view_y = self.cursor_y - self.view_height + 1
+    
+    def move_view(self, x, y):
+        """Colocar la ventana visible en (x, y) y llevar el cursor a su centro"""
+        self.view_x = max(0, min(self.width - self.view_width, x))
+        self.view_y = max(0, min(self.height - self.view_height, y))
+        self.cursor_x = self.view_x + self.view_width // 2
+        self.cursor_y = self.view_y + self.view_height // 2
+        print(f"Ventana en ({self.view_x}, {self.view_y})")
+    
+    def place_cell(self, x, y):
+        """Colocar una célula de un patrón, relativa a la ventana visible"""
+        x += self.view_x
+        y += self.view_y
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.engine.set(x, y, True)
+    
+    def load_library_pattern(self, name):
+        """Cargar un patrón de la biblioteca centrado en la ventana visible"""
+        try:
+            cells = self.library.get(name)
+        except KeyError:
+            print(f"Patron '{name}' no encontrado - escribe 'ls' para ver la lista")
+            return False
+        except (ValueError, OSError) as error:
+            print(f"No se pudo cargar el patron '{name}': {error}")
+            return False
+        pattern_width, pattern_height = pattern_size(cells)
+        if pattern_width > self.width or pattern_height > self.height:
+            # Recortado ya no sería el mismo patrón: mejor no cargarlo
+            print(f"Patron '{name}' demasiado grande ({pattern_width}x{pattern_height}) para un mundo de "
+                  f"{self.width}x{self.height} - aumenta WORLD_WIDTH y WORLD_HEIGHT")
+            return False
+        self.clear_grid()
+        # Centrado en la ventana visible, pero desplazado lo necesario para caber entero
+        origin_x = self.view_x + (self.view_width - pattern_width) // 2
+        origin_y = self.view_y + (self.view_height - pattern_height) // 2
+        origin_x = max(0, min(self.width - pattern_width, origin_x))
+        origin_y = max(0, min(self.height - pattern_height, origin_y))
+        for x, y in cells:
+            self.engine.set(origin_x + x, origin_y + y, True)
+        print(f"Patron '{name}' cargado ({pattern_width}x{pattern_height}, "
+              f"{self.engine.population()} celulas)")
+        return True
+    
     def load_pattern(self, pattern_name):
         """Cargar patrones predefinidos"""
         self.clear_grid()
@@ -103,56 +385,62 @@ class ConwayGame:
             # Glider clásico
             pattern = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]
             for x, y in pattern:
-                if 0 <= x < 8 and 0 <= y < 8:
-                    self.grid[y][x] = True
+                self.place_cell(x, y)
             print("Patron 'Glider' cargado")
             
         elif pattern_name == "blinker":
             # Oscilador simple
             pattern = [(3, 4), (4, 4), (5, 4)]
             for x, y in pattern:
-                if 0 <= x < 8 and 0 <= y < 8:
-                    self.grid[y][x] = True
+                self.place_cell(x, y)
             print("Patron 'Blinker' cargado")
             
         elif pattern_name == "block":
             # Bloque estático
             pattern = [(3, 3), (3, 4), (4, 3), (4, 4)]
             for x, y in pattern:
-                if 0 <= x < 8 and 0 <= y < 8:
-                    self.grid[y][x] = True
+                self.place_cell(x, y)
             print("Patron 'Block' cargado")
             
         elif pattern_name == "toad":
             # Oscilador toad
             pattern = [(2, 3), (3, 3), (4, 3), (1, 4), (2, 4), (3, 4)]
             for x, y in pattern:
-                if 0 <= x < 8 and 0 <= y < 8:
-                    self.grid[y][x] = True
+                self.place_cell(x, y)
             print("Patron 'Toad' cargado")
     
     def render(self):
-        """Renderizar la grilla en el Sense HAT"""
-        for y in range(8):
-            for x in range(8):
-                if self.editing_mode and x == self.cursor_x and y == self.cursor_y:
+        """Renderizar la ventana visible del mundo en el Sense HAT"""
+        view = self.engine.region(self.view_x, self.view_y, self.view_width, self.view_height)
+        cursor_x = self.cursor_x - self.view_x
+        cursor_y = self.cursor_y - self.view_y
+        for y in range(DISPLAY_SIZE):
+            for x in range(DISPLAY_SIZE):
+                alive = y < self.view_height and x < self.view_width and view[y][x]
+                if self.editing_mode and x == cursor_x and y == cursor_y:
                     # Mostrar cursor en modo edición
-                    if self.grid[y][x]:
+                    if alive:
                         color = EDITING_COLOR  # Naranja si hay célula
                     else:
                         color = CURSOR_COLOR   # Amarillo si está vacío
                 else:
                     # Mostrar célula normal
-                    color = ALIVE_COLOR if self.grid[y][x] else DEAD_COLOR
+                    color = ALIVE_COLOR if alive else DEAD_COLOR
                 
-                sense.set_pixel(x, y, color)
+                display.set_pixel(x, y, color)
         
         # Mostrar información en pantalla cada cierto tiempo
         if self.editing_mode:
             # Parpadeo suave del cursor
             cursor_brightness = 0.7 + 0.3 * abs(time.time() % 1 - 0.5) * 2
             cursor_color = tuple(int(c * cursor_brightness) for c in CURSOR_COLOR)
-            sense.set_pixel(self.cursor_x, self.cursor_y, cursor_color)
+            display.set_pixel(cursor_x, cursor_y, cursor_color)
+        
+        # Textos en curso por encima del tablero (sin parar la simulación)
+        self.banners.draw(display)
+        
+        # Solo se envían al Sense HAT los pixeles que cambiaron
+        display.flush()
 
 def handle_keyboard_input(game):
     """Maneja la entrada del teclado usando los eventos del joystick del Sense HAT"""
@@ -162,25 +450,26 @@ def handle_keyboard_input(game):
             return
             
         if event.direction == 'up':
-            game.cursor_y = max(0, game.cursor_y - 1)
+            game.move_cursor(0, -1)
             print(f"Cursor en ({game.cursor_x}, {game.cursor_y})")
             
         elif event.direction == 'down':
-            game.cursor_y = min(7, game.cursor_y + 1)
+            game.move_cursor(0, 1)
             print(f"Cursor en ({game.cursor_x}, {game.cursor_y})")
             
         elif event.direction == 'left':
-            game.cursor_x = max(0, game.cursor_x - 1)
+            game.move_cursor(-1, 0)
             print(f"Cursor en ({game.cursor_x}, {game.cursor_y})")
             
         elif event.direction == 'right':
-            game.cursor_x = min(7, game.cursor_x + 1)
+            game.move_cursor(1, 0)
             print(f"Cursor en ({game.cursor_x}, {game.cursor_y})")
             
         elif event.direction == 'middle':
             if game.editing_mode:
                 # ENTER - Colocar/quitar célula
-                game.toggle_cell(game.cursor_x, game.cursor_y)
+                with game.lock:
+                    game.toggle_cell(game.cursor_x, game.cursor_y)
             else:
                 # En modo simulación, pausar/reanudar
                 game.paused = not game.paused
@@ -191,7 +480,6 @@ def handle_keyboard_input(game):
 
 def handle_console_input(game):
     """Maneja comandos desde la consola de manera no bloqueante"""
-    import threading
     import sys
     import select
     
@@ -243,6 +531,35 @@ def handle_console_input(game):
             game.load_pattern(patterns[command])
             game.editing_mode = True
             
+        elif command.startswith('j '):
+            # Saltar N generaciones con HashLife: "j N"
+            try:
+                game.jump(int(command.split()[1]))
+            except ValueError:
+                print("Uso: j N")
+            
+        elif command == 'ls':
+            # Listar la biblioteca de patrones
+            show_patterns_menu(game.library)
+            
+        elif command.startswith('l '):
+            # Cargar un patrón de la biblioteca: "l NOMBRE"
+            if game.load_library_pattern(command[2:].strip()):
+                game.editing_mode = True
+            
+        elif command == 's':
+            # Sopa aleatoria en todo el mundo
+            game.randomize()
+            game.editing_mode = True
+            
+        elif command.startswith('v '):
+            # Mover la ventana visible: "v X Y"
+            try:
+                _, x, y = command.split()
+                game.move_view(int(x), int(y))
+            except ValueError:
+                print("Uso: v X Y")
+            
         elif command == 'q':
             print("Saliendo del juego...")
             exit()
@@ -265,26 +582,46 @@ def show_help():
     print("2 - Cargar Blinker")
     print("3 - Cargar Block")
     print("4 - Cargar Toad")
+    print("s - Sopa aleatoria")
+    print("v X Y - Mover la ventana visible")
+    print("j N - Saltar N generaciones (HashLife; en mundos pequenos o junto")
+    print("      al borde de un mundo acotado avanza generacion a generacion)")
+    print("ls - Listar patrones de la biblioteca")
+    print("l NOMBRE - Cargar patron de la biblioteca")
     print("h - Mostrar ayuda")
     print("q - Salir")
     print("==========================")
 
-def show_startup_animation():
-    """Animación de inicio"""
-    sense.show_message("CONWAY", text_colour=[0, 255, 0], scroll_speed=0.08)
-    sense.show_message("LIFE", text_colour=[255, 255, 0], scroll_speed=0.08)
-    
-    # Efecto de "células naciendo"
+INTRO_VERSION = 1  # Subir al cambiar la animación para regenerar el caché
+
+def build_startup_frames(recorder):
+    """Efecto de "células naciendo", dibujado sobre un IntroRecorder"""
+    recorder.clear()
     for frame in range(20):
         for x in range(8):
             for y in range(8):
                 if (x + y + frame) % 4 == 0:
                     intensity = min(255, frame * 13)
-                    sense.set_pixel(x, y, (0, intensity, 0))
-        time.sleep(0.1)
+                    recorder.set_pixel(x, y, (0, intensity, 0))
+        recorder.flush()
+        recorder.sleep(0.1)
     
-    time.sleep(0.5)
-    sense.clear()
+    recorder.sleep(0.5)
+    recorder.clear()
+    recorder.flush()
+
+STARTUP_MESSAGES = [("CONWAY", [0, 255, 0]), ("LIFE", [255, 255, 0])]
+
+def show_startup_animation(mode='full'):
+    """Animación de inicio (full: efecto / fast: efecto comprimido / skip: nada)
+
+    Los mensajes del modo full se desplazan sobre el tablero ya en marcha (ver main).
+    """
+    if mode == 'skip':
+        return
+    
+    frames = load_sequence('conway_startup', INTRO_VERSION, build_startup_frames)
+    frames.play(display, duration=FAST_INTRO_DURATION if mode == 'fast' else None)
 
 def show_menu():
     """Mostrar menú de patrones"""
@@ -295,15 +632,20 @@ def show_menu():
     print("   4: Toad (oscila)")
     print("   C: Continuar editando")
 
-def main():
+def main(intro=None):
     print("=" * 40)
     print("     JUEGO DE LA VIDA DE CONWAY")
     print("       Sense HAT Edition")
     print("=" * 40)
     
-    show_startup_animation()
+    sense.clear()
+    intro = intro_mode(intro)
+    show_startup_animation(intro)
     
     game = ConwayGame()
+    if intro == 'full':
+        for message, color in STARTUP_MESSAGES:
+            game.banners.show(message, text_colour=color, scroll_speed=0.08)
     handle_keyboard_input(game)
     handle_console_input(game)  # Agregar manejo de consola
     
@@ -315,42 +657,45 @@ def main():
     print("Modo: EDICION")
     print("Escribe 'h' + ENTER para ver comandos")
     
-    last_evolution = time.time()
-    evolution_speed = 1.0  # segundos entre generaciones
+    # Una generación por tick y la pantalla a su propio ritmo
+    scheduler = FrameScheduler(tick_rate=1.0 / EVOLUTION_INTERVAL, render_rate=RENDER_FPS,
+                               max_catch_up=1)
     
-    try:
-        while True:
-            current_time = time.time()
-            
-            # Renderizar siempre
-            game.render()
-            
-            # Evolución automática en modo simulación
+    def tick():
+        # Evolución automática en modo simulación
+        with game.lock:
             if not game.editing_mode and not game.paused:
-                if current_time - last_evolution >= evolution_speed:
-                    game.evolve()
-                    last_evolution = current_time
-            
-            time.sleep(0.05)  # 20 FPS
+                game.evolve()
+    
+    def render(alpha):
+        with game.lock:
+            game.render()
+    
+    try:
+        # Renderizar siempre
+        scheduler.run(tick, render)
             
     except KeyboardInterrupt:
         print("\nFin de la simulacion")
         print(f"Generaciones completadas: {game.generation}")
         
         # Animación de cierre
+        view = game.engine.region(game.view_x, game.view_y, game.view_width, game.view_height)
         for fade in range(255, 0, -15):
-            for x in range(8):
-                for y in range(8):
-                    if game.grid[y][x]:
+            for x in range(game.view_width):
+                for y in range(game.view_height):
+                    if view[y][x]:
                         color = (0, fade, 0)
-                        sense.set_pixel(x, y, color)
+                        display.set_pixel(x, y, color)
+            display.flush()
             time.sleep(0.05)
         
-        sense.show_message("BYE", text_colour=[255, 255, 0], scroll_speed=0.1)
-        sense.clear()
+        display.show_message("BYE", text_colour=[255, 255, 0], scroll_speed=0.1)
+        display.clear()
+        display.flush()
 
 # Función adicional para controles extendidos via input del terminal
-def show_patterns_menu():
+def show_patterns_menu(library=None):
     """Mostrar menu de patrones disponibles"""
     print("\nPATRONES DISPONIBLES:")
     print("1 - Glider (se mueve diagonalmente)")
@@ -358,6 +703,17 @@ def show_patterns_menu():
     print("3 - Block (patron estatico)")
     print("4 - Toad (oscilador periodo 2)")
     print("Escribe el numero + ENTER para cargar")
+    if library is not None:
+        names = library.names()
+        if names:
+            print("\nBIBLIOTECA:")
+            for name in names:
+                print(f"   {name}")
+            print("Escribe 'l NOMBRE' + ENTER para cargar")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Juego de la Vida de Conway")
+    parser.add_argument('--intro', choices=INTRO_MODES,
+                        help="animacion de arranque: full, fast o skip (por defecto SENSE_HAT_INTRO o full)")
+    args = parser.parse_args()
+    main(intro=args.intro)
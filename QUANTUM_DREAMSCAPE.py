@@ -2,11 +2,17 @@
 # Un ecosistema digital evolutivo que aprende, siente y transcende
 # Combina arte generativo, física cuántica simulada, IA adaptativa y resonancia cósmica
 
-from sense_hat import SenseHat
+from headless_sense import HeadlessSenseHat, create_sense_hat
+import argparse
 import random
 import math
 import time
 import threading
+import json
+import os
+import struct
+import sys
+import zlib
 from collections import deque
 try:
     import numpy as np
@@ -14,8 +20,22 @@ except ImportError:
     np = None
 from datetime import datetime
 
-sense = SenseHat()
-sense.clear()
+from framebuffer import FrameBuffer
+from sensor_sampler import SensorFeed, SensorSampler
+from session_recording import SessionRecorder, SessionReplay
+from frame_scheduler import FrameScheduler
+from instrumentation import Instrumentation
+from intro_frames import FAST_INTRO_DURATION, INTRO_MODES, intro_mode, load_sequence
+from text_banner import BannerQueue
+
+# El SenseHat se crea al primer uso: importar el módulo (o --replay) no toca la placa
+sense = create_sense_hat(lazy=True)
+display = FrameBuffer(sense)
+sensors = SensorSampler(sense)
+
+# Tiempos por fase y contadores de eventos (QUANTUM_PROFILE=1 o --profile)
+instruments = Instrumentation(enabled=os.environ.get('QUANTUM_PROFILE', '') not in ('', '0'),
+                              snapshot_path=os.environ.get('QUANTUM_PROFILE_SNAPSHOT'))
 
 # 🎨 PALETAS DE COLORES EVOLUTIVAS CON MEMORIA EMOCIONAL
 palettes = {
@@ -31,35 +51,164 @@ palettes = {
 
 # 🌌 CONFIGURACIONES AVANZADAS
 QUANTUM_ENTANGLEMENT_THRESHOLD = 1.5
+ENTANGLEMENT_PROBABILITY = 0.15  # Probabilidad por frame de entrelazar un par cercano
 CONSCIOUSNESS_LEVELS = ['dormant', 'awakening', 'aware', 'enlightened', 'transcendent']
 DIMENSIONAL_RESONANCE_FREQ = 0.618  # Golden ratio
 MEMORY_DECAY_RATE = 0.95
 
+# 📝 REGISTRO ASÍNCRONO
+# log() solo deja el evento en un buffer circular preasignado; un hilo aparte
+# los formatea y los escribe por lotes, así la consola nunca frena el render
+LOG_BUFFER_SIZE = 1024        # Eventos pendientes como máximo (si se llena, se descartan)
+LOG_BATCH_SIZE = 64           # Eventos pendientes que despiertan al hilo escritor
+LOG_FLUSH_INTERVAL = 0.25     # Segundos máximos que un evento espera en el buffer
+LOG_SAMPLE_EVERY = {          # Se registra 1 de cada N eventos del nivel
+    'QUANTUM': 2,
+}
+LOG_RATE_LIMITS = {           # Eventos por segundo como máximo (ráfaga = 1 segundo)
+    'QUANTUM': 4.0,
+    'BIRTH': 10.0,
+    'DEATH': 10.0,
+    'EVOLUTION': 10.0,
+}
+# Registro binario (activado con QUANTUM_LOG_BINARY=archivo): por evento una
+# cabecera (tiempo, nivel, longitud) y un JSON UTF-8 con mensaje y datos
+LOG_LEVELS = ('INFO', 'WARNING', 'ERROR', 'BIRTH', 'DEATH', 'EMOTION',
+              'EVOLUTION', 'QUANTUM', 'TRANSCEND')
+LOG_RECORD = struct.Struct('<dBH')
+
+
 class ConsciousnessLogger:
-    """Sistema de logging simple para consola"""
-    def __init__(self):
+    """Registro de eventos no bloqueante con muestreo y límite por nivel
+    
+    Los eventos van a un buffer circular de tamaño fijo y un hilo de fondo
+    los formatea y los imprime en lotes. Opcionalmente también se guardan
+    en binary_path (ver LOG_RECORD) para analizarlos después.
+    """
+    def __init__(self, stream=None, binary_path=None, capacity=LOG_BUFFER_SIZE,
+                 sample_every=LOG_SAMPLE_EVERY, rate_limits=LOG_RATE_LIMITS):
         self.session_start = datetime.now()
         self.event_history = deque(maxlen=100)
         self.mood_transitions = {}
         self.particle_births = 0
         self.quantum_events = 0
         
-    def log(self, level, message, data=None):
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        event = {
-            'time': timestamp,
-            'level': level,
-            'message': message,
-            'data': data or {}
-        }
-        self.event_history.append(event)
-        
-        # Solo imprimir en consola sin emojis
-        print(f"[{timestamp}] {level}: {message}")
+        self.stream = stream
+        self.binary = open(binary_path, 'ab') if binary_path else None
+        self.sample_every = dict(sample_every)
+        self.rate_limits = dict(rate_limits)
+        self.suppressed = {}  # Eventos descartados por muestreo o límite, por nivel
+        self.dropped = 0      # Eventos perdidos por buffer lleno
+        self._sample_counts = {}
+        self._tokens = {level: (rate, time.time()) for level, rate in self.rate_limits.items()}
+        
+        self._buffer = [None] * capacity
+        self._capacity = capacity
+        self._head = 0  # Próximo hueco a escribir (lo avanza log)
+        self._tail = 0  # Próximo evento a formatear (lo avanza el escritor)
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._writer = None
+    
+    def _admit(self, level, now):
+        """Aplica muestreo y límite de frecuencia del nivel"""
+        every = self.sample_every.get(level)
+        if every:
+            count = self._sample_counts.get(level, 0)
+            self._sample_counts[level] = count + 1
+            if count % every:
+                return False
+        rate = self.rate_limits.get(level)
+        if rate:
+            tokens, last = self._tokens[level]
+            tokens = min(rate, tokens + (now - last) * rate)
+            if tokens < 1.0:
+                self._tokens[level] = (tokens, now)
+                return False
+            self._tokens[level] = (tokens - 1.0, now)
+        return True
         
-        if data:
-            for key, value in data.items():
-                print(f"    {key}: {value}")
+    def log(self, level, message, data=None):
+        now = time.time()
+        if not self._admit(level, now):
+            self.suppressed[level] = self.suppressed.get(level, 0) + 1
+            return
+        with self._lock:
+            if self._head - self._tail >= self._capacity:
+                self.dropped += 1
+                return
+            self._buffer[self._head % self._capacity] = (now, level, message, data)
+            self._head += 1
+            pending = self._head - self._tail
+        
+        if self._writer is None and not self._closed:
+            self._writer = threading.Thread(target=self._run, daemon=True)
+            self._writer.start()
+        if pending >= LOG_BATCH_SIZE:
+            self._wakeup.set()
+    
+    def _run(self):
+        while not self._closed:
+            self._wakeup.wait(LOG_FLUSH_INTERVAL)
+            self._wakeup.clear()
+            self.flush()
+    
+    def _take_batch(self):
+        with self._lock:
+            tail, head = self._tail, self._head
+            batch = [self._buffer[i % self._capacity] for i in range(tail, head)]
+            for i in range(tail, head):
+                self._buffer[i % self._capacity] = None
+            self._tail = head
+        return batch
+    
+    def flush(self):
+        """Formatea y escribe todo lo pendiente"""
+        with self._write_lock:
+            batch = self._take_batch()
+            if not batch:
+                return
+            lines = []
+            for now, level, message, data in batch:
+                timestamp = datetime.fromtimestamp(now).strftime("%H:%M:%S.%f")[:-3]
+                self.event_history.append({
+                    'time': timestamp,
+                    'level': level,
+                    'message': message,
+                    'data': data or {}
+                })
+                # Solo imprimir en consola sin emojis
+                lines.append(f"[{timestamp}] {level}: {message}\n")
+                if data:
+                    for key, value in data.items():
+                        lines.append(f"    {key}: {value}\n")
+                if self.binary is not None:
+                    self._write_binary(now, level, message, data)
+            stream = self.stream or sys.stdout
+            stream.write(''.join(lines))
+            stream.flush()
+            if self.binary is not None:
+                self.binary.flush()
+    
+    def _write_binary(self, now, level, message, data):
+        payload = json.dumps({'message': message, 'data': data or {}},
+                             default=str, ensure_ascii=False).encode('utf-8')[:0xFFFF]
+        code = LOG_LEVELS.index(level) if level in LOG_LEVELS else 0xFF
+        self.binary.write(LOG_RECORD.pack(now, code, len(payload)))
+        self.binary.write(payload)
+    
+    def close(self):
+        """Detiene el hilo escritor y vuelca lo que quede"""
+        self._closed = True
+        self._wakeup.set()
+        if self._writer is not None:
+            self._writer.join()
+        self.flush()
+        if self.binary is not None:
+            self.binary.close()
+            self.binary = None
     
     def track_mood_transition(self, old_mood, new_mood):
         if old_mood != new_mood:
@@ -75,59 +224,377 @@ class ConsciousnessLogger:
             'particle_births': self.particle_births,
             'quantum_events': self.quantum_events,
             'mood_transitions': len(self.mood_transitions),
-            'consciousness_events': len(self.event_history)
+            'consciousness_events': len(self.event_history),
+            'log_suppressed': sum(self.suppressed.values()),
+            'log_dropped': self.dropped
         }
 
-class QuantumParticle:
-    def __init__(self, x, y, logger=None):
-        self.x = x
-        self.y = y
-        self.velocity_x = random.uniform(-0.3, 0.3)
-        self.velocity_y = random.uniform(-0.3, 0.3)
-        self.energy = random.uniform(0.1, 1.0)
-        self.phase = random.uniform(0, 2 * math.pi)
-        self.lifespan = random.randint(50, 200)
-        self.age = 0
-        self.consciousness_level = 0
-        self.memory = deque(maxlen=5)  # Memoria de posiciones pasadas
-        self.quantum_state = 'stable'  # stable, excited, entangled, transcendent
-        self.birth_time = time.time()
-        self.dimensional_anchor = random.uniform(0, 2*math.pi)
-        
+def read_binary_log(path):
+    """Lee un registro binario: genera (tiempo, nivel, mensaje, datos)"""
+    with open(path, 'rb') as f:
+        while True:
+            header = f.read(LOG_RECORD.size)
+            if len(header) < LOG_RECORD.size:
+                return
+            now, code, length = LOG_RECORD.unpack(header)
+            record = json.loads(f.read(length).decode('utf-8'))
+            level = LOG_LEVELS[code] if code < len(LOG_LEVELS) else 'UNKNOWN'
+            yield now, level, record['message'], record['data']
+
+# 🧊 ALMACÉN DE PARTÍCULAS (estructura de arreglos)
+MAX_PARTICLES = 25            # Límite de población del ecosistema
+PARTICLE_MEMORY = 5           # Posiciones pasadas que recuerda cada partícula
+QUANTUM_STATES = ['stable', 'excited', 'entangled', 'transcendent']
+
+
+def _state_index(consciousness_level):
+    """Estado cuántico según la consciencia (índice en QUANTUM_STATES)"""
+    if consciousness_level > 0.8:
+        return 3
+    elif consciousness_level > 0.6:
+        return 2
+    elif consciousness_level > 0.3:
+        return 1
+    return 0
+
+
+class ParticlePool:
+    """Todas las partículas en arreglos contiguos, un arreglo por atributo
+
+    Con numpy los atributos son ndarrays y update/evolve_consciousness se
+    aplican a toda la población de una vez; sin numpy son listas y se recorre
+    partícula a partícula. Los huecos de partículas muertas se reutilizan.
+    """
+
+    FIELDS = ('x', 'y', 'velocity_x', 'velocity_y', 'energy', 'phase', 'lifespan', 'age',
+              'consciousness_level', 'dimensional_anchor', 'birth_time', 'state', 'alive',
+              'memory_len', 'memory_pos', 'prev_x', 'prev_y')
+
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = 0
+        self.count = 0
+        self.free = []  # Huecos libres (pila: se reutiliza primero el último liberado)
+        for name in self.FIELDS:
+            setattr(self, name, self._new_array(0))
+        self.memory_x = self._new_memory(0)
+        self.memory_y = self._new_memory(0)
+        self._grow(max(1, capacity))
+
+    @staticmethod
+    def _new_array(size):
+        return np.zeros(size) if np is not None else [0.0] * size
+
+    @staticmethod
+    def _new_memory(size):
+        if np is not None:
+            return np.zeros((size, PARTICLE_MEMORY))
+        return [[0.0] * PARTICLE_MEMORY for _ in range(size)]
+
+    def _grow(self, capacity):
+        """Amplía los arreglos (al menos al doble) y marca los huecos nuevos como libres"""
+        extra = capacity - self.capacity
+        for name in self.FIELDS:
+            old = getattr(self, name)
+            if np is not None:
+                setattr(self, name, np.concatenate((old, np.zeros(extra))))
+            else:
+                old.extend([0.0] * extra)
+        if np is not None:
+            self.memory_x = np.concatenate((self.memory_x, np.zeros((extra, PARTICLE_MEMORY))))
+            self.memory_y = np.concatenate((self.memory_y, np.zeros((extra, PARTICLE_MEMORY))))
+        else:
+            self.memory_x.extend(self._new_memory(extra))
+            self.memory_y.extend(self._new_memory(extra))
+        self.free.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def spawn(self, x, y):
+        """Materializa una partícula en un hueco libre y devuelve su índice"""
+        if not self.free:
+            self._grow(self.capacity * 2)
+        i = self.free.pop()
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.velocity_x[i] = random.uniform(-0.3, 0.3)
+        self.velocity_y[i] = random.uniform(-0.3, 0.3)
+        self.energy[i] = random.uniform(0.1, 1.0)
+        self.phase[i] = random.uniform(0, 2 * math.pi)
+        self.lifespan[i] = random.randint(50, 200)
+        self.age[i] = 0
+        self.consciousness_level[i] = 0
+        self.state[i] = 0
+        self.birth_time[i] = time.time()
+        self.dimensional_anchor[i] = random.uniform(0, 2*math.pi)
+        self.memory_len[i] = 0
+        self.memory_pos[i] = 0
+        for k in range(PARTICLE_MEMORY):
+            self.memory_x[i][k] = 0.0
+            self.memory_y[i][k] = 0.0
+        self.alive[i] = 1
+        self.count += 1
+        return i
+
+    def kill(self, i):
+        self.alive[i] = 0
+        self.free.append(int(i))
+        self.count -= 1
+
+    def total(self, name):
+        """Suma del atributo sobre las partículas vivas"""
+        column = getattr(self, name)
+        if np is not None:
+            return float(column[self.indices()].sum())
+        return sum(column[i] for i in self.indices())
+
+    def indices(self):
+        """Índices de las partículas vivas"""
+        if np is not None:
+            return np.flatnonzero(self.alive)
+        return [i for i in range(self.capacity) if self.alive[i]]
+
+    def particles(self):
+        """Vistas QuantumParticle de las partículas vivas (para el código escalar)"""
+        return [QuantumParticle(self, int(i)) for i in self.indices()]
+
+    def evolve_consciousness(self, ecosystem_awareness):
+        """Evoluciona la consciencia de toda la población; devuelve cuántas cambiaron"""
+        if np is None:
+            return sum(1 for p in self.particles() if p.evolve_consciousness(ecosystem_awareness))
+
+        idx = self.indices()
+        old = self.consciousness_level[idx]
+        # La consciencia aumenta con la edad y las interacciones
+        base_consciousness = (self.age[idx] / self.lifespan[idx]) * ecosystem_awareness
+        interaction_bonus = self.memory_len[idx] * 0.1
+        energy_factor = self.energy[idx] * 0.3
+        level = np.minimum(1.0, base_consciousness + interaction_bonus + energy_factor)
+        self.consciousness_level[idx] = level
+        # Estado cuántico: umbrales 0.3 / 0.6 / 0.8 (estrictos)
+        self.state[idx] = (level > 0.3).astype(float) + (level > 0.6) + (level > 0.8)
+        return int(np.count_nonzero(level != old))
+
+    def update(self, gravity_x=0, gravity_y=0, dimensional_flux=0, logger=None):
+        """Avanza un frame a toda la población y recicla las partículas que mueren"""
+        # Posiciones del tick anterior, para interpolar al dibujar
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
+        if np is None:
+            for p in self.particles():
+                if not p.update(gravity_x, gravity_y, dimensional_flux, logger):
+                    self.kill(p.index)
+                    instruments.count('deaths')
+            return
+
+        idx = self.indices()
+        if len(idx) == 0:
+            return
+        x = self.x[idx]
+        y = self.y[idx]
+        consciousness = self.consciousness_level[idx]
+
+        # Guardar posición en memoria (buffer circular por partícula)
+        pos = self.memory_pos[idx].astype(int)
+        self.memory_x[idx, pos] = x
+        self.memory_y[idx, pos] = y
+        self.memory_pos[idx] = (pos + 1) % PARTICLE_MEMORY
+        memory_len = np.minimum(self.memory_len[idx] + 1, PARTICLE_MEMORY)
+        self.memory_len[idx] = memory_len
+
+        # Cuántica: superposición de estados con resonancia dimensional
+        phase = self.phase[idx] + (0.1 + dimensional_flux * 0.05)
+        self.phase[idx] = phase
+        anchor = self.dimensional_anchor[idx]
+        quantum_offset_x = 0.1 * np.sin(phase + anchor)
+        quantum_offset_y = 0.1 * np.cos(phase * 1.3 + anchor)
+
+        # Efecto de consciencia en el movimiento
+        consciousness_factor = 1 + consciousness * 0.5
+        quantum_offset_x *= consciousness_factor
+        quantum_offset_y *= consciousness_factor
+
+        # Memoria cuántica - influencia de posiciones pasadas (los huecos sin usar valen 0)
+        remembers = memory_len > 2
+        memory_influence_x = self.memory_x[idx].sum(axis=1) / memory_len
+        memory_influence_y = self.memory_y[idx].sum(axis=1) / memory_len
+        quantum_offset_x += np.where(remembers, (memory_influence_x - x) * 0.01 * consciousness, 0.0)
+        quantum_offset_y += np.where(remembers, (memory_influence_y - y) * 0.01 * consciousness, 0.0)
+
+        # Física emergente con fricción (menos fricción = más consciencia)
+        friction = 0.98 - (consciousness * 0.02)
+        velocity_x = (self.velocity_x[idx] + gravity_x + quantum_offset_x) * friction
+        velocity_y = (self.velocity_y[idx] + gravity_y + quantum_offset_y) * friction
+        self.velocity_x[idx] = velocity_x
+        self.velocity_y[idx] = velocity_y
+        x = x + velocity_x
+        y = y + velocity_y
+
+        # Wrapping cuántico - teletransporte a través de los bordes
+        wrapped_x = np.where(x < 0, 7.0, np.where(x > 7, 0.0, x))
+        wrapped_y = np.where(y < 0, 7.0, np.where(y > 7, 0.0, y))
+        teleported = (wrapped_x != x) | (wrapped_y != y)
+        self.x[idx] = wrapped_x
+        self.y[idx] = wrapped_y
+        if instruments.enabled:
+            instruments.count('teleports', int(np.count_nonzero(teleported)))
+
         if logger:
-            logger.particle_births += 1
-            logger.log('BIRTH', f"Particula cuantica materializada", {
-                'position': f"({x:.1f}, {y:.1f})",
-                'energy': f"{self.energy:.2f}",
-                'lifespan': self.lifespan
-            })
-        
+            for i in idx[teleported & (consciousness > 0.5)]:
+                QuantumParticle(self, int(i)).log_teleport(logger)
+
+        # Muerte o trascendencia
+        age = self.age[idx] + 1
+        self.age[idx] = age
+        for i in idx[age >= self.lifespan[idx]]:
+            if logger:
+                QuantumParticle(self, int(i)).log_death(logger)
+            self.kill(i)
+            instruments.count('deaths')
+
+
+def _as_list(values):
+    """Copia como lista de floats nativos (ndarray o lista)"""
+    return values.tolist() if np is not None else list(values)
+
+
+class SpatialGrid:
+    """Índice de vecinos en celdas uniformes del tamaño del radio de interacción
+
+    Dos partículas a menos de cell_size siempre caen en la misma celda o en
+    celdas contiguas. Para no repetir pares se recorre media vecindad: la
+    propia celda más las vecinas de la derecha y de abajo.
+    """
+
+    FORWARD_NEIGHBORS = ((1, 0), (-1, 1), (0, 1), (1, 1))
+
+    def __init__(self, cell_size=QUANTUM_ENTANGLEMENT_THRESHOLD):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def rebuild(self, xs, ys, indices):
+        """Reparte los índices en celdas según sus posiciones"""
+        cells = {}
+        size = self.cell_size
+        for i in indices:
+            key = (int(xs[i] // size), int(ys[i] // size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [i]
+            else:
+                bucket.append(i)
+        self.cells = cells
+
+    def candidate_pairs(self):
+        """Pares que pueden estar dentro del radio, cada uno una sola vez
+
+        Devuelve dos listas paralelas (first, second) de índices.
+        """
+        first = []
+        second = []
+        cells = self.cells
+        for (cx, cy), bucket in cells.items():
+            for a in range(len(bucket) - 1):
+                rest = bucket[a + 1:]
+                first.extend([bucket[a]] * len(rest))
+                second.extend(rest)
+            for dx, dy in self.FORWARD_NEIGHBORS:
+                other = cells.get((cx + dx, cy + dy))
+                if other:
+                    for i in bucket:
+                        first.extend([i] * len(other))
+                        second.extend(other)
+        return first, second
+
+
+def _entangle_pairs(energy, consciousness, phase, first, second, jitter):
+    """Entanglement de cada par (i, j) en orden, sobre listas"""
+    for i, j, (jitter_i, jitter_j) in zip(first, second, jitter):
+        # Intercambio de energía
+        energy[i], energy[j] = energy[j], energy[i]
+        
+        # Intercambio de información cuántica
+        avg_consciousness = (consciousness[i] + consciousness[j]) / 2
+        consciousness[i] = avg_consciousness * 1.05  # Boost por entanglement
+        consciousness[j] = avg_consciousness * 1.05
+        
+        # Sincronización de fases
+        avg_phase = (phase[i] + phase[j]) / 2
+        phase[i] = avg_phase + jitter_i
+        phase[j] = avg_phase + jitter_j
+
+
+def _pool_field(name):
+    """Propiedad que lee/escribe el atributo de la partícula en el almacén"""
+    def getter(self):
+        return getattr(self.pool, name)[self.index]
+
+    def setter(self, value):
+        getattr(self.pool, name)[self.index] = value
+
+    return property(getter, setter)
+
+
+class QuantumParticle:
+    """Vista de una partícula dentro del ParticlePool (API escalar de siempre)"""
+
+    x = _pool_field('x')
+    y = _pool_field('y')
+    velocity_x = _pool_field('velocity_x')
+    velocity_y = _pool_field('velocity_y')
+    energy = _pool_field('energy')
+    phase = _pool_field('phase')
+    lifespan = _pool_field('lifespan')
+    age = _pool_field('age')
+    consciousness_level = _pool_field('consciousness_level')
+    dimensional_anchor = _pool_field('dimensional_anchor')
+    birth_time = _pool_field('birth_time')
+    prev_x = _pool_field('prev_x')
+    prev_y = _pool_field('prev_y')
+
+    def __init__(self, pool, index):
+        self.pool = pool
+        self.index = index
+
+    @property
+    def quantum_state(self):  # stable, excited, entangled, transcendent
+        return QUANTUM_STATES[int(self.pool.state[self.index])]
+
+    @property
+    def memory(self):
+        """Posiciones pasadas, de la más vieja a la más reciente"""
+        pool, i = self.pool, self.index
+        length = int(pool.memory_len[i])
+        start = int(pool.memory_pos[i]) - length
+        return [(pool.memory_x[i][k % PARTICLE_MEMORY], pool.memory_y[i][k % PARTICLE_MEMORY])
+                for k in range(start, start + length)]
+
+    def remember(self):
+        """Guardar la posición actual en el buffer circular de memoria"""
+        pool, i = self.pool, self.index
+        pos = int(pool.memory_pos[i])
+        pool.memory_x[i][pos] = self.x
+        pool.memory_y[i][pos] = self.y
+        pool.memory_pos[i] = (pos + 1) % PARTICLE_MEMORY
+        pool.memory_len[i] = min(pool.memory_len[i] + 1, PARTICLE_MEMORY)
+
     def evolve_consciousness(self, ecosystem_awareness):
         """Evolución de la consciencia basada en el entorno"""
         old_level = self.consciousness_level
         
         # La consciencia aumenta con la edad y las interacciones
         base_consciousness = (self.age / self.lifespan) * ecosystem_awareness
-        interaction_bonus = len(self.memory) * 0.1
+        interaction_bonus = self.pool.memory_len[self.index] * 0.1
         energy_factor = self.energy * 0.3
         
         self.consciousness_level = min(1.0, base_consciousness + interaction_bonus + energy_factor)
         
         # Determinar estado cuántico basado en consciencia
-        if self.consciousness_level > 0.8:
-            self.quantum_state = 'transcendent'
-        elif self.consciousness_level > 0.6:
-            self.quantum_state = 'entangled'
-        elif self.consciousness_level > 0.3:
-            self.quantum_state = 'excited'
-        else:
-            self.quantum_state = 'stable'
+        self.pool.state[self.index] = _state_index(self.consciousness_level)
         
         return self.consciousness_level != old_level
         
     def update(self, gravity_x=0, gravity_y=0, dimensional_flux=0, logger=None):
         # Guardar posición en memoria
-        self.memory.append((self.x, self.y))
+        self.remember()
         
         # Cuántica: superposición de estados con resonancia dimensional
         self.phase += 0.1 + dimensional_flux * 0.05
@@ -140,9 +607,10 @@ class QuantumParticle:
         quantum_offset_y *= consciousness_factor
         
         # Memoria cuántica - influencia de posiciones pasadas
-        if len(self.memory) > 2:
-            memory_influence_x = sum(pos[0] for pos in self.memory) / len(self.memory)
-            memory_influence_y = sum(pos[1] for pos in self.memory) / len(self.memory)
+        memory = self.memory
+        if len(memory) > 2:
+            memory_influence_x = sum(pos[0] for pos in memory) / len(memory)
+            memory_influence_y = sum(pos[1] for pos in memory) / len(memory)
             
             memory_pull_x = (memory_influence_x - self.x) * 0.01 * self.consciousness_level
             memory_pull_y = (memory_influence_y - self.y) * 0.01 * self.consciousness_level
@@ -176,39 +644,385 @@ class QuantumParticle:
         elif self.y > 7: 
             self.y = 0
             teleported = True
-            
+        
+        if teleported:
+            instruments.count('teleports')
         if teleported and logger and self.consciousness_level > 0.5:
-            logger.quantum_events += 1
-            logger.log('QUANTUM', f"Teletransporte cuantico detectado", {
-                'consciousness': f"{self.consciousness_level:.2f}",
-                'state': self.quantum_state,
-                'new_position': f"({self.x:.1f}, {self.y:.1f})"
-            })
+            self.log_teleport(logger)
         
         self.age += 1
         
         # Muerte o trascendencia
         if self.age >= self.lifespan:
             if logger:
-                life_duration = time.time() - self.birth_time
-                logger.log('DEATH' if self.consciousness_level < 0.7 else 'TRANSCEND', 
-                          f"Particula {'trascendio' if self.consciousness_level >= 0.7 else 'se desvanecio'}", {
-                    'life_duration': f"{life_duration:.1f}s",
-                    'final_consciousness': f"{self.consciousness_level:.2f}",
-                    'final_state': self.quantum_state,
-                    'memories_formed': len(self.memory)
-                })
+                self.log_death(logger)
             return False
             
         return True
 
+    def log_teleport(self, logger):
+        logger.quantum_events += 1
+        logger.log('QUANTUM', f"Teletransporte cuantico detectado", {
+            'consciousness': f"{self.consciousness_level:.2f}",
+            'state': self.quantum_state,
+            'new_position': f"({self.x:.1f}, {self.y:.1f})"
+        })
+
+    def log_death(self, logger):
+        life_duration = time.time() - self.birth_time
+        logger.log('DEATH' if self.consciousness_level < 0.7 else 'TRANSCEND', 
+                  f"Particula {'trascendio' if self.consciousness_level >= 0.7 else 'se desvanecio'}", {
+            'life_duration': f"{life_duration:.1f}s",
+            'final_consciousness': f"{self.consciousness_level:.2f}",
+            'final_state': self.quantum_state,
+            'memories_formed': len(self.memory)
+        })
+
+# 🎞️ POSTPROCESADO DEL FRAME
+# Los efectos globales son mapas de ganancia sobre el frame completo (8x8x3
+# en float). Las fases que solo dependen de la posición se calculan una vez.
+FRAME_SIZE = 8
+
+if np is not None:
+    _GRID_Y, _GRID_X = np.mgrid[0:FRAME_SIZE, 0:FRAME_SIZE].astype(float)
+else:
+    # Sin numpy las rejillas son listas planas de 64 valores (fila a fila)
+    _GRID_X = [float(i % FRAME_SIZE) for i in range(FRAME_SIZE * FRAME_SIZE)]
+    _GRID_Y = [float(i // FRAME_SIZE) for i in range(FRAME_SIZE * FRAME_SIZE)]
+
+
+def _phase_grid(fx, fy):
+    if np is not None:
+        return _GRID_X * fx + _GRID_Y * fy
+    return [x * fx + y * fy for x, y in zip(_GRID_X, _GRID_Y)]
+
+
+COHERENCE_PHASE = _phase_grid(0.5, 0.5)      # (x + y) * 0.5
+FLUX_PHASE = _phase_grid(0.3, 0.4)           # x * 0.3 + y * 0.4
+CONSCIOUSNESS_PHASE = _phase_grid(0.4, 0.4)  # x * 0.4 + y * 0.4
+
+
+def _sine_gain(base, amplitude, phase_grid, offset):
+    """base + amplitude * sin(fase + offset) para cada pixel"""
+    if np is not None:
+        return base + amplitude * np.sin(phase_grid + offset)
+    return [base + amplitude * math.sin(phase + offset) for phase in phase_grid]
+
+
+def cosmic_breath(ecosystem):
+    """Respiración cósmica: todo el frame late al mismo ritmo"""
+    return 0.85 + 0.15 * math.sin(ecosystem.time_cycle * 0.04 + ecosystem.cosmic_resonance * math.pi)
+
+
+def coherence_modulation(ecosystem):
+    """Coherencia cuántica: onda diagonal que sincroniza los colores"""
+    if ecosystem.quantum_coherence <= 0.5:
+        return None
+    coherence_phase = ecosystem.time_cycle * 0.02 * ecosystem.quantum_coherence
+    return _sine_gain(0.9, 0.1, COHERENCE_PHASE, coherence_phase)
+
+
+def flux_distortion(ecosystem):
+    """Flux dimensional: distorsión ondulada del brillo"""
+    distortion = ecosystem.dimensional_flux * 0.3
+    if distortion <= 0.3:
+        return None
+    return _sine_gain(1.0, distortion * 0.2, FLUX_PHASE, ecosystem.time_cycle * 0.1)
+
+
+def consciousness_waves(ecosystem):
+    """Ondas de consciencia cuando el ecosistema está muy despierto"""
+    if ecosystem.consciousness_level <= 0.7:
+        return None
+    return _sine_gain(1.0, ecosystem.consciousness_level * 0.1, CONSCIOUSNESS_PHASE,
+                      ecosystem.time_cycle * 0.06)
+
+
+def _multiply_gain(gain, stage_gain):
+    if np is not None:
+        return gain * stage_gain
+    if not isinstance(gain, list):
+        gain = [gain] * (FRAME_SIZE * FRAME_SIZE)
+    if not isinstance(stage_gain, list):
+        return [g * stage_gain for g in gain]
+    return [g * s for g, s in zip(gain, stage_gain)]
+
+
+class PostProcessing:
+    """Cadena de efectos globales aplicada al frame completo de una vez
+
+    Cada etapa recibe el ecosistema y devuelve una ganancia (un número o una
+    rejilla 8x8) o None si no actúa en este frame. Las ganancias se
+    multiplican entre sí y el frame se escala y se recorta una sola vez.
+    """
+
+    STAGES = (cosmic_breath, coherence_modulation, flux_distortion, consciousness_waves)
+
+    def __init__(self, stages=STAGES):
+        self.stages = list(stages)
+
+    def gain(self, ecosystem):
+        gain = 1.0
+        for stage in self.stages:
+            stage_gain = stage(ecosystem)
+            if stage_gain is not None:
+                gain = _multiply_gain(gain, stage_gain)
+        return gain
+
+    def apply(self, ecosystem, frame):
+        """Escala el frame (8x8x3, o 64 [r, g, b] sin numpy) y lo recorta a 0-255"""
+        gain = self.gain(ecosystem)
+        if np is not None:
+            if not np.isscalar(gain):
+                gain = gain[:, :, None]
+            return np.clip(frame * gain, 0, 255)
+        if not isinstance(gain, list):
+            return [[min(255.0, c * gain) for c in pixel] for pixel in frame]
+        return [[min(255.0, c * g) for c in pixel] for pixel, g in zip(frame, gain)]
+
+
+def quantize_frame(frame):
+    """Frame en float a la lista de 64 colores enteros que espera la matriz"""
+    if np is not None:
+        return [tuple(pixel) for pixel in frame.astype(np.uint8).reshape(-1, 3).tolist()]
+    return [tuple(int(c) for c in pixel) for pixel in frame]
+
+
+# 🎨 COLOR POR FRAME
+# Intensidad según el mood: (base, atributo del ecosistema, peso)
+MOOD_INTENSITY = {
+    'calm': (0.6, 'consciousness_level', 0.2),
+    'excited': (0.9, 'consciousness_level', 0.1),
+    'meditative': (0.4, 'consciousness_level', 0.3),
+    'chaotic': (0.8, 'dimensional_flux', 0.2),
+    'harmonious': (0.7, 'quantum_coherence', 0.3),
+}
+if np is not None:
+    POSITION_PHASE = np.arange(FRAME_SIZE * FRAME_SIZE) * 0.5
+else:
+    POSITION_PHASE = [position * 0.5 for position in range(FRAME_SIZE * FRAME_SIZE)]
+
+
+class ColorContext:
+    """Lo que get_color_by_energy calcula igual para todas las partículas de un frame
+
+    La intensidad y la onda dimensional se calculan una vez, la onda por
+    posición para los 64 pixeles, y la paleta se guarda ya escalada: el color
+    de una partícula es una búsqueda en esa tabla.
+    """
+
+    def __init__(self, ecosystem):
+        palette = palettes[ecosystem.current_palette]
+        
+        # Efecto de ondas sinusoidales con resonancia cósmica
+        wave_offset = ecosystem.time_cycle * 0.1 + ecosystem.cosmic_resonance * math.pi
+        dimensional_wave = math.cos(ecosystem.time_cycle * 0.08 + ecosystem.dimensional_flux * 2)
+        if np is not None:
+            self.offsets = np.sin(POSITION_PHASE + wave_offset) + dimensional_wave + 2
+        else:
+            self.offsets = [math.sin(phase + wave_offset) + dimensional_wave + 2
+                            for phase in POSITION_PHASE]
+        
+        # Modulación de intensidad basada en mood y consciencia
+        base, attribute, weight = MOOD_INTENSITY.get(ecosystem.mood, (0.6, None, 0.0))
+        base_intensity = base + (getattr(ecosystem, attribute) * weight if attribute else 0.0)
+        
+        # Efecto de coherencia cuántica
+        coherence_boost = ecosystem.quantum_coherence * 0.2
+        
+        # Efecto de resonancia cósmica
+        cosmic_modulation = 1.0 + ecosystem.cosmic_resonance * 0.3 * math.sin(ecosystem.time_cycle * 0.03)
+        
+        final_intensity = min(1.0, (base_intensity + coherence_boost) * cosmic_modulation)
+        self.palette = [tuple(int(c * final_intensity) for c in color) for color in palette]
+        if np is not None:
+            self.palette_lut = np.array(self.palette, dtype=float)
+
+    def color(self, energy, position):
+        index = int((energy + self.offsets[position]) * 1.5) % len(self.palette)
+        return self.palette[index]
+
+    def colors(self, energies, positions):
+        """Colores de muchas partículas a la vez (ndarrays) como matriz n x 3"""
+        index = ((energies + self.offsets[positions]) * 1.5).astype(int) % len(self.palette)
+        return self.palette_lut[index]
+
+
+def interpolate_positions(previous, current, alpha):
+    """Posición entre dos ticks; los saltos de más de un pixel (teletransportes
+    por los bordes) no se interpolan para no cruzar la matriz en diagonal"""
+    if alpha >= 1.0:
+        return current
+    if np is not None and not np.isscalar(current):
+        delta = current - previous
+        return np.where(np.abs(delta) < 1.0, previous + delta * alpha, current)
+    delta = current - previous
+    return previous + delta * alpha if abs(delta) < 1.0 else current
+
+
+# 💫 AURAS DE LAS PARTÍCULAS
+# Cada radio de aura es un sello precalculado: desplazamientos (dx, dy) del
+# borde de cada anillo con su peso 1 / anillo. Se suman todos los sellos de
+# todas las partículas y se satura una sola vez al final.
+AURA_PAD = 2  # Margen del frame de trabajo: el sello más grande sale 2 pixeles
+
+
+def _aura_kernel(aura_radius):
+    offsets = []
+    for radius in range(1, aura_radius + 1):
+        for dx in range(-radius, radius + 1):
+            for dy in range(-radius, radius + 1):
+                if abs(dx) == radius or abs(dy) == radius:  # Solo el borde
+                    offsets.append((dx, dy, 1.0 / radius))
+    return offsets
+
+
+AURA_KERNELS = {radius: _aura_kernel(radius) for radius in (1, 2)}
+if np is not None:
+    AURA_STAMPS = {radius: tuple(np.array(column) for column in zip(*offsets))
+                   for radius, offsets in AURA_KERNELS.items()}
+
+
+def splat_particles(xs, ys, colors, aura_radii, aura_intensities):
+    """Frame con las partículas en sus pixeles y sus auras sumadas, saturado a 255
+
+    Devuelve un ndarray 8x8x3 en float (sin numpy, 64 listas [r, g, b]).
+    """
+    if np is None:
+        return _splat_particles_list(xs, ys, colors, aura_radii, aura_intensities)
+    size = FRAME_SIZE + 2 * AURA_PAD
+    frame = np.zeros((size, size, 3))
+    if len(xs):
+        rows = np.array(ys) + AURA_PAD
+        cols = np.array(xs) + AURA_PAD
+        colors = np.array(colors, dtype=float)
+        aura_radii = np.array(aura_radii)
+        aura_colors = colors * np.array(aura_intensities)[:, None]
+        
+        frame[rows, cols] = colors
+        for radius, (dx, dy, weight) in AURA_STAMPS.items():
+            selected = aura_radii == radius
+            if not selected.any():
+                continue
+            stamp_rows = (rows[selected][:, None] + dy).ravel()
+            stamp_cols = (cols[selected][:, None] + dx).ravel()
+            values = (aura_colors[selected][:, None, :] * weight[None, :, None]).reshape(-1, 3)
+            np.add.at(frame, (stamp_rows, stamp_cols), values)
+    frame = frame[AURA_PAD:AURA_PAD + FRAME_SIZE, AURA_PAD:AURA_PAD + FRAME_SIZE]
+    return np.minimum(frame, 255.0)
+
+
+def _splat_particles_list(xs, ys, colors, aura_radii, aura_intensities):
+    frame = [[0.0, 0.0, 0.0] for _ in range(FRAME_SIZE * FRAME_SIZE)]
+    for px, py, color in zip(xs, ys, colors):
+        frame[py * FRAME_SIZE + px] = [float(c) for c in color]
+    for px, py, color, radius, intensity in zip(xs, ys, colors, aura_radii, aura_intensities):
+        aura_color = [c * intensity for c in color]
+        for dx, dy, weight in AURA_KERNELS[radius]:
+            nx, ny = px + dx, py + dy
+            if 0 <= nx < FRAME_SIZE and 0 <= ny < FRAME_SIZE:
+                pixel = frame[ny * FRAME_SIZE + nx]
+                for i in range(3):
+                    pixel[i] += aura_color[i] * weight
+    return [[min(255.0, c) for c in pixel] for pixel in frame]
+
+
+# ✨ OVERLAYS: EFECTOS ESPECIALES SOBRE LOS FRAMES SIGUIENTES
+# En vez de dormir dentro de render, un efecto se mezcla sobre los próximos
+# frames normales: cada frame avanza un paso de su línea de tiempo
+TRANSCENDENCE_GOLD = (255, 215, 0)
+VORTEX_COLOR = (128, 0, 255)
+VORTEX_RADIUS = 4
+VORTEX_CENTER = 3.5
+
+
+def _vortex_intensity():
+    """(radio - distancia) / radio hasta el centro de la matriz, 0 fuera del radio"""
+    if np is not None:
+        distance = np.hypot(_GRID_X - VORTEX_CENTER, _GRID_Y - VORTEX_CENTER)
+        return np.where(distance < VORTEX_RADIUS, (VORTEX_RADIUS - distance) / VORTEX_RADIUS, 0.0)
+    intensity = []
+    for x, y in zip(_GRID_X, _GRID_Y):
+        distance = math.hypot(x - VORTEX_CENTER, y - VORTEX_CENTER)
+        intensity.append((VORTEX_RADIUS - distance) / VORTEX_RADIUS if distance < VORTEX_RADIUS else 0.0)
+    return intensity
+
+
+VORTEX_INTENSITY = _vortex_intensity()
+
+
+def blend_frame(frame, target, alpha):
+    """frame * (1 - alpha) + target * alpha
+
+    target es un color o un color por pixel; alpha un número o uno por pixel.
+    """
+    if np is not None:
+        if not np.isscalar(alpha):
+            alpha = alpha[:, :, None]
+        return frame * (1 - alpha) + np.asarray(target, dtype=float) * alpha
+    pixels = len(frame)
+    targets = target if isinstance(target, list) else [target] * pixels
+    alphas = alpha if isinstance(alpha, list) else [alpha] * pixels
+    return [[c * (1 - a) + t * a for c, t in zip(pixel, color)]
+            for pixel, color, a in zip(frame, targets, alphas)]
+
+
+class Overlay:
+    """Mezcla un color sobre los próximos len(alphas) frames, un alpha por frame"""
+
+    def __init__(self, name, target, alphas):
+        self.name = name
+        self.target = target
+        self.alphas = list(alphas)
+        self.step = 0
+
+    @property
+    def done(self):
+        return self.step >= len(self.alphas)
+
+    def apply(self, frame):
+        frame = blend_frame(frame, self.target, self.alphas[self.step])
+        self.step += 1
+        return frame
+
+
+def transcendence_flash():
+    """Flash dorado breve que se desvanece en 3 frames"""
+    return Overlay('transcendence_flash', TRANSCENDENCE_GOLD,
+                   [(3 - flash_frame) / 3 * 0.5 for flash_frame in range(3)])
+
+
+def dimensional_vortex(frames=8):
+    """Vórtice violeta que se intensifica durante 8 frames
+
+    Cada frame equivale a haber mezclado el vórtice step + 1 veces seguidas,
+    como cuando el efecto se aplicaba repetidamente sobre la propia matriz.
+    """
+    if np is not None:
+        target = VORTEX_INTENSITY[:, :, None] * np.array(VORTEX_COLOR, dtype=float)
+        alphas = [1 - (1 - VORTEX_INTENSITY * 0.3) ** (step + 1) for step in range(frames)]
+    else:
+        target = [tuple(c * intensity for c in VORTEX_COLOR) for intensity in VORTEX_INTENSITY]
+        alphas = [[1 - (1 - intensity * 0.3) ** (step + 1) for intensity in VORTEX_INTENSITY]
+                  for step in range(frames)]
+    return Overlay('dimensional_vortex', target, alphas)
+
+
 class EmotionalEcosystem:
-    def __init__(self):
-        self.particles = []
+    def __init__(self, max_particles=MAX_PARTICLES, seed=None, vectorized=True, sampler=None):
+        self.pool = ParticlePool(max_particles)
+        self.max_particles = max_particles
+        self.neighbor_grid = SpatialGrid(QUANTUM_ENTANGLEMENT_THRESHOLD)
+        # Las interacciones entre pares usan su propio generador con semilla:
+        # la versión vectorizada y la escalar consumen las mismas tiradas
+        self.rng = np.random.default_rng(seed) if np is not None else random.Random(seed)
+        self.vectorized = vectorized and np is not None
         self.mood = 'calm'  # calm, excited, meditative, chaotic, harmonious
         self.previous_mood = 'calm'
-        self.temperature_history = deque(maxlen=10)
-        self.pressure_history = deque(maxlen=10)
+        self.sensors = sampler or sensors  # Lecturas cacheadas, nunca I2C en el frame
+        self.post_processing = PostProcessing()
+        self.overlays = []  # Efectos especiales en curso (ver Overlay)
+        self.banners = BannerQueue()  # Textos que se desplazan sobre el ecosistema
         self.motion_intensity = 0
         self.current_palette = 'aurora'
         self.time_cycle = 0
@@ -222,7 +1036,7 @@ class EmotionalEcosystem:
         self.cosmic_resonance = 0.0
         
         # Sistema de logging
-        self.logger = ConsciousnessLogger()
+        self.logger = ConsciousnessLogger(binary_path=os.environ.get('QUANTUM_LOG_BINARY'))
         
         # Memoria emocional del ecosistema
         self.emotional_memory = {
@@ -243,26 +1057,38 @@ class EmotionalEcosystem:
         for i in range(12):
             self.spawn_particle(reason="genesis")
     
+    @property
+    def particles(self):
+        """Vistas de las partículas vivas (las fases vectorizadas usan self.pool)"""
+        return self.pool.particles()
+    
     def spawn_particle(self, reason="natural"):
-        if len(self.particles) < 25:  # Aumentado el límite
+        if self.pool.count < self.max_particles:
             x = random.uniform(0, 7)
             y = random.uniform(0, 7)
-            particle = QuantumParticle(x, y, self.logger)
-            self.particles.append(particle)
+            i = self.pool.spawn(x, y)
+            instruments.count('spawns')
+            
+            self.logger.particle_births += 1
+            self.logger.log('BIRTH', f"Particula cuantica materializada", {
+                'position': f"({x:.1f}, {y:.1f})",
+                'energy': f"{self.pool.energy[i]:.2f}",
+                'lifespan': int(self.pool.lifespan[i])
+            })
             
             if reason != "genesis":
                 self.logger.log('BIRTH', f"Nueva partícula por {reason}", {
-                    'total_particles': len(self.particles),
+                    'total_particles': self.pool.count,
                     'ecosystem_consciousness': f"{self.consciousness_level:.2f}"
                 })
     
     def calculate_ecosystem_consciousness(self):
         """Calcula la consciencia global basada en las partículas individuales"""
-        if not self.particles:
+        if self.pool.count == 0:
             return 0.0
             
         # Consciencia promedio de partículas
-        avg_consciousness = sum(p.consciousness_level for p in self.particles) / len(self.particles)
+        avg_consciousness = self.pool.total('consciousness_level') / self.pool.count
         
         # Factor de coherencia cuántica
         coherence_bonus = self.quantum_coherence * 0.3
@@ -271,7 +1097,7 @@ class EmotionalEcosystem:
         harmony_bonus = self.harmony_index * 0.2
         
         # Factor de diversidad (más partículas = más consciencia)
-        diversity_factor = min(1.0, len(self.particles) / 20) * 0.2
+        diversity_factor = min(1.0, self.pool.count / 20) * 0.2
         
         old_level = self.consciousness_level
         self.consciousness_level = min(1.0, avg_consciousness + coherence_bonus + harmony_bonus + diversity_factor)
@@ -288,24 +1114,26 @@ class EmotionalEcosystem:
     def analyze_environment(self):
         """Análisis emocional del entorno usando sensores con IA adaptativa"""
         try:
-            temp = sense.get_temperature()
-            pressure = sense.get_pressure()
-            accel = sense.get_accelerometer_raw()
-            humidity = sense.get_humidity()
-            
-            self.temperature_history.append(temp)
-            self.pressure_history.append(pressure)
+            temp = self.sensors.latest('temperature')
+            pressure = self.sensors.latest('pressure')
+            accel = self.sensors.latest('accelerometer')
+            humidity = self.sensors.latest('humidity')
+            if None in (temp, pressure, accel, humidity):
+                raise IOError(f"sin lecturas validas {self.sensors.errors}")
             
             # Calcular intensidad de movimiento
             motion = math.sqrt(accel['x']**2 + accel['y']**2 + accel['z']**2)
             self.motion_intensity = motion
             
-            # Análisis de tendencias avanzado
-            temp_trend = 0 if len(self.temperature_history) < 3 else \
-                        sum(self.temperature_history[-3:]) / 3 - sum(self.temperature_history[-6:-3]) / 3
+            # Análisis de tendencias avanzado (sobre las lecturas reales, no por frame)
+            temperature_history = self.sensors.history('temperature')
+            pressure_history = self.sensors.history('pressure')
+            # La tendencia compara las 3 últimas lecturas con las 3 anteriores: hacen falta 6
+            temp_trend = 0 if len(temperature_history) < 6 else \
+                        sum(temperature_history[-3:]) / 3 - sum(temperature_history[-6:-3]) / 3
             
-            pressure_stability = 0 if len(self.pressure_history) < 3 else \
-                               1.0 - (max(self.pressure_history[-3:]) - min(self.pressure_history[-3:])) / 10
+            pressure_stability = 0 if len(pressure_history) < 3 else \
+                               1.0 - (max(pressure_history[-3:]) - min(pressure_history[-3:])) / 10
             
             # Cálculo de resonancia cósmica
             self.lunar_phase += DIMENSIONAL_RESONANCE_FREQ * 0.01
@@ -378,92 +1206,32 @@ class EmotionalEcosystem:
     
     def get_color_by_energy(self, energy, position):
         """Color dinámico basado en energía, posición y consciencia cuántica"""
-        palette = palettes[self.current_palette]
-        
-        # Efecto de ondas sinusoidales con resonancia cósmica
-        wave = math.sin(self.time_cycle * 0.1 + position * 0.5 + self.cosmic_resonance * math.pi)
-        dimensional_wave = math.cos(self.time_cycle * 0.08 + self.dimensional_flux * 2)
-        
-        color_index = int((energy + wave + dimensional_wave + 2) * 1.5) % len(palette)
-        
-        base_color = palette[color_index]
-        
-        # Modulación de intensidad basada en mood y consciencia
-        intensity_map = {
-            'calm': 0.6 + self.consciousness_level * 0.2,
-            'excited': 0.9 + self.consciousness_level * 0.1,
-            'meditative': 0.4 + self.consciousness_level * 0.3,
-            'chaotic': 0.8 + self.dimensional_flux * 0.2,
-            'harmonious': 0.7 + self.quantum_coherence * 0.3
-        }
-        
-        base_intensity = intensity_map.get(self.mood, 0.6)
-        
-        # Efecto de coherencia cuántica
-        coherence_boost = self.quantum_coherence * 0.2
-        
-        # Efecto de resonancia cósmica
-        cosmic_modulation = 1.0 + self.cosmic_resonance * 0.3 * math.sin(self.time_cycle * 0.03)
-        
-        final_intensity = min(1.0, (base_intensity + coherence_boost) * cosmic_modulation)
-        
-        return tuple(int(c * final_intensity) for c in base_color)
+        return ColorContext(self).color(energy, position)
     
     def particle_interactions(self):
         """Simula interacciones cuánticas avanzadas entre partículas"""
         entanglement_events = 0
-        consciousness_exchanges = 0
         
-        for i, p1 in enumerate(self.particles):
-            # Evolución individual de consciencia
-            if p1.evolve_consciousness(self.consciousness_level):
-                consciousness_exchanges += 1
-            
-            for j, p2 in enumerate(self.particles[i+1:], i+1):
-                dx = p2.x - p1.x
-                dy = p2.y - p1.y
-                distance = math.sqrt(dx**2 + dy**2)
-                
-                if distance < QUANTUM_ENTANGLEMENT_THRESHOLD and distance > 0:
-                    # Entanglement cuántico - intercambio de energía y consciencia
-                    if random.random() < 0.15:
-                        # Intercambio de energía
-                        p1.energy, p2.energy = p2.energy, p1.energy
-                        
-                        # Intercambio de información cuántica
-                        avg_consciousness = (p1.consciousness_level + p2.consciousness_level) / 2
-                        p1.consciousness_level = avg_consciousness * 1.05  # Boost por entanglement
-                        p2.consciousness_level = avg_consciousness * 1.05
-                        
-                        # Sincronización de fases
-                        avg_phase = (p1.phase + p2.phase) / 2
-                        p1.phase = avg_phase + random.uniform(-0.1, 0.1)
-                        p2.phase = avg_phase + random.uniform(-0.1, 0.1)
-                        
-                        entanglement_events += 1
-                    
-                    # Fuerza de atracción/repulsión mejorada
-                    force = 0.015 / (distance + 0.1)
-                    
-                    # Las partículas más conscientes ejercen más influencia
-                    consciousness_factor = (p1.consciousness_level + p2.consciousness_level) / 2
-                    force *= (1 + consciousness_factor)
-                    
-                    # Polaridad basada en diferencia de energía y consciencia
-                    energy_diff = abs(p1.energy - p2.energy)
-                    consciousness_diff = abs(p1.consciousness_level - p2.consciousness_level)
-                    
-                    if energy_diff > 0.3 or consciousness_diff > 0.2:
-                        force *= -1  # repulsión por diferencia
-                    
-                    p1.velocity_x -= force * dx
-                    p1.velocity_y -= force * dy
-                    p2.velocity_x += force * dx
-                    p2.velocity_y += force * dy
+        # Evolución individual de consciencia (toda la población de una vez)
+        consciousness_exchanges = self.pool.evolve_consciousness(self.consciousness_level)
+        
+        # Solo se comparan partículas de celdas vecinas
+        pool = self.pool
+        x = _as_list(pool.x)
+        y = _as_list(pool.y)
+        self.neighbor_grid.rebuild(x, y, [int(i) for i in pool.indices()])
+        first, second = self.neighbor_grid.candidate_pairs()
+        
+        if self.vectorized:
+            entanglement_events = self._interact_vectorized(first, second)
+        else:
+            entanglement_events = self._interact_scalar(first, second, x, y)
+        
+        instruments.count('entanglements', entanglement_events)
         
         # Actualizar coherencia cuántica basada en interacciones
-        if len(self.particles) > 0:
-            interaction_density = entanglement_events / len(self.particles)
+        if self.pool.count > 0:
+            interaction_density = entanglement_events / self.pool.count
             self.quantum_coherence = min(1.0, self.quantum_coherence * 0.95 + interaction_density * 0.3)
         
         # Log de eventos cuanticos significativos
@@ -474,12 +1242,149 @@ class EmotionalEcosystem:
                 'coherence': f"{self.quantum_coherence:.2f}"
             })
     
+    def _entanglement_draws(self, count):
+        """Una tirada uniforme en [0, 1) por cada par cercano"""
+        if np is not None:
+            return self.rng.random(count)
+        return [self.rng.random() for _ in range(count)]
+    
+    def _phase_jitter(self, count):
+        """Desfase aleatorio de las dos partículas de cada par entrelazado"""
+        if np is not None:
+            return self.rng.uniform(-0.1, 0.1, (count, 2))
+        return [(self.rng.uniform(-0.1, 0.1), self.rng.uniform(-0.1, 0.1)) for _ in range(count)]
+    
+    def _interact_scalar(self, first, second, x, y):
+        """Interacciones par a par en Python; devuelve los entanglements del frame
+        
+        Primero se sortean y aplican los entanglements (en el orden de los pares)
+        y después se calculan las fuerzas con el estado ya intercambiado.
+        """
+        pool = self.pool
+        energy = _as_list(pool.energy)
+        consciousness = _as_list(pool.consciousness_level)
+        phase = _as_list(pool.phase)
+        velocity_x = _as_list(pool.velocity_x)
+        velocity_y = _as_list(pool.velocity_y)
+        
+        # Pares dentro del radio, sin raíz cuadrada
+        threshold_sq = QUANTUM_ENTANGLEMENT_THRESHOLD ** 2
+        close = []
+        for i, j in zip(first, second):
+            dx = x[j] - x[i]
+            dy = y[j] - y[i]
+            distance_sq = dx * dx + dy * dy
+            if distance_sq < threshold_sq and distance_sq > 0:
+                close.append((i, j, dx, dy, distance_sq))
+        
+        # Entanglement cuántico - intercambio de energía y consciencia
+        draws = _as_list(self._entanglement_draws(len(close)))
+        entangled = [close[k] for k in range(len(close)) if draws[k] < ENTANGLEMENT_PROBABILITY]
+        jitter = _as_list(self._phase_jitter(len(entangled)))
+        _entangle_pairs(energy, consciousness, phase,
+                        [pair[0] for pair in entangled], [pair[1] for pair in entangled], jitter)
+        
+        for i, j, dx, dy, distance_sq in close:
+            # Fuerza de atracción/repulsión mejorada
+            force = 0.015 / (math.sqrt(distance_sq) + 0.1)
+            
+            # Las partículas más conscientes ejercen más influencia
+            consciousness_factor = (consciousness[i] + consciousness[j]) / 2
+            force *= (1 + consciousness_factor)
+            
+            # Polaridad basada en diferencia de energía y consciencia
+            energy_diff = abs(energy[i] - energy[j])
+            consciousness_diff = abs(consciousness[i] - consciousness[j])
+            
+            if energy_diff > 0.3 or consciousness_diff > 0.2:
+                force *= -1  # repulsión por diferencia
+            
+            velocity_x[i] -= force * dx
+            velocity_y[i] -= force * dy
+            velocity_x[j] += force * dx
+            velocity_y[j] += force * dy
+        
+        pool.energy[:] = energy
+        pool.consciousness_level[:] = consciousness
+        pool.phase[:] = phase
+        pool.velocity_x[:] = velocity_x
+        pool.velocity_y[:] = velocity_y
+        return len(entangled)
+    
+    def _interact_vectorized(self, first, second):
+        """Las mismas interacciones que _interact_scalar, con numpy sobre todos los pares"""
+        if not first:
+            return 0
+        pool = self.pool
+        first = np.array(first, dtype=np.intp)
+        second = np.array(second, dtype=np.intp)
+        dx = pool.x[second] - pool.x[first]
+        dy = pool.y[second] - pool.y[first]
+        distance_sq = dx * dx + dy * dy
+        close = (distance_sq < QUANTUM_ENTANGLEMENT_THRESHOLD ** 2) & (distance_sq > 0)
+        first = first[close]
+        second = second[close]
+        dx = dx[close]
+        dy = dy[close]
+        distance_sq = distance_sq[close]
+        
+        # Entanglements: mismas tiradas y mismo orden que la versión escalar
+        entangled = np.flatnonzero(self._entanglement_draws(len(first)) < ENTANGLEMENT_PROBABILITY)
+        jitter = self._phase_jitter(len(entangled))
+        if len(entangled):
+            self._entangle(first[entangled], second[entangled], jitter)
+        
+        energy = pool.energy
+        consciousness = pool.consciousness_level
+        force = 0.015 / (np.sqrt(distance_sq) + 0.1)
+        force *= 1 + (consciousness[first] + consciousness[second]) / 2
+        repel = ((np.abs(energy[first] - energy[second]) > 0.3) |
+                 (np.abs(consciousness[first] - consciousness[second]) > 0.2))
+        force[repel] *= -1
+        
+        # Cada partícula acumula la fuerza de todos sus pares
+        force_x = force * dx
+        force_y = force * dy
+        np.add.at(pool.velocity_x, first, -force_x)
+        np.add.at(pool.velocity_y, first, -force_y)
+        np.add.at(pool.velocity_x, second, force_x)
+        np.add.at(pool.velocity_y, second, force_y)
+        return len(entangled)
+    
+    def _entangle(self, first, second, jitter):
+        """Intercambia energía, promedia consciencia y sincroniza fases de los pares dados"""
+        pool = self.pool
+        involved = np.concatenate((first, second))
+        if len(np.unique(involved)) < len(involved):
+            # Una partícula en varios pares: el resultado depende del orden,
+            # así que se aplican uno tras otro como en la versión escalar
+            energy = pool.energy.tolist()
+            consciousness = pool.consciousness_level.tolist()
+            phase = pool.phase.tolist()
+            _entangle_pairs(energy, consciousness, phase,
+                            first.tolist(), second.tolist(), jitter.tolist())
+            pool.energy[:] = energy
+            pool.consciousness_level[:] = consciousness
+            pool.phase[:] = phase
+            return
+        
+        energy = pool.energy
+        consciousness = pool.consciousness_level
+        phase = pool.phase
+        energy[first], energy[second] = energy[second], energy[first]
+        avg_consciousness = (consciousness[first] + consciousness[second]) / 2
+        consciousness[first] = avg_consciousness * 1.05
+        consciousness[second] = avg_consciousness * 1.05
+        avg_phase = (phase[first] + phase[second]) / 2
+        phase[first] = avg_phase + jitter[:, 0]
+        phase[second] = avg_phase + jitter[:, 1]
+    
     def dimensional_shifts(self):
         """Efectos dimensionales avanzados"""
         # Portales cuánticos aleatorios
         if random.random() < 0.001 * self.consciousness_level:
             # Crear portal entre dos partículas distantes
-            if len(self.particles) >= 2:
+            if self.pool.count >= 2:
                 p1, p2 = random.sample(self.particles, 2)
                 distance = math.sqrt((p1.x - p2.x)**2 + (p1.y - p2.y)**2)
                 
@@ -487,6 +1392,7 @@ class EmotionalEcosystem:
                     # Intercambiar posiciones
                     p1.x, p2.x = p2.x, p1.x
                     p1.y, p2.y = p2.y, p1.y
+                    instruments.count('portals')
                     
                     self.logger.log('QUANTUM', "Portal cuantico activado", {
                         'distance': f"{distance:.1f}",
@@ -511,6 +1417,7 @@ class EmotionalEcosystem:
                     particle.energy = min(1.0, particle.energy + shock_force * 0.5)
                     affected += 1
             
+            instruments.count('shockwaves')
             if affected > 0:
                 self.logger.log('QUANTUM', f"Onda de choque dimensional", {
                     'epicenter': f"({shock_x:.1f}, {shock_y:.1f})",
@@ -522,22 +1429,22 @@ class EmotionalEcosystem:
         self.time_cycle += 1
         
         # Análisis ambiental y evolutivo
-        self.analyze_environment()
-        self.calculate_ecosystem_consciousness()
+        with instruments.span('analyze_environment'):
+            self.analyze_environment()
+        with instruments.span('ecosystem_consciousness'):
+            self.calculate_ecosystem_consciousness()
         
         # Efectos dimensionales avanzados
-        self.dimensional_shifts()
+        with instruments.span('dimensional_shifts'):
+            self.dimensional_shifts()
         
         # Interacciones cuánticas entre partículas
-        self.particle_interactions()
+        with instruments.span('particle_interactions'):
+            self.particle_interactions()
         
-        # Actualizar partículas con parámetros avanzados
-        surviving_particles = []
-        for particle in self.particles:
-            if particle.update(self.gravity_x, self.gravity_y, self.dimensional_flux, self.logger):
-                surviving_particles.append(particle)
-        
-        self.particles = surviving_particles
+        # Actualizar partículas con parámetros avanzados (las que mueren liberan su hueco)
+        with instruments.span('particle_update'):
+            self.pool.update(self.gravity_x, self.gravity_y, self.dimensional_flux, self.logger)
         
         # Sistema de spawning dinámico basado en consciencia
         spawn_rates = {
@@ -554,7 +1461,7 @@ class EmotionalEcosystem:
         cosmic_boost = self.cosmic_resonance * 0.05
         
         # Penalización por sobrepoblación
-        population_factor = max(0.1, 1.0 - (len(self.particles) / 25))
+        population_factor = max(0.1, 1.0 - (self.pool.count / self.max_particles))
         
         final_spawn_rate = (base_spawn_rate + cosmic_boost) * population_factor
         
@@ -579,28 +1486,73 @@ class EmotionalEcosystem:
                 'total_consciousness': f"{self.consciousness_level:.2f}"
             })
         
+        # Efecto especial: Flash de trascendencia (se dibuja en los próximos frames)
+        if self.consciousness_level > 0.95 and self.time_cycle % 60 == 0:
+            self.overlays.append(transcendence_flash())
+        
+        # Efecto especial: Vórtice dimensional
+        if self.dimensional_flux > 0.9 and self.time_cycle % 100 == 0:
+            self.overlays.append(dimensional_vortex())
+        
         # Log periodico de estadisticas
         if self.time_cycle % 200 == 0:
             stats = self.logger.get_session_stats()
             self.logger.log('INFO', "Estadisticas del ecosistema", {
                 **stats,
-                'particles_active': len(self.particles),
+                'particles_active': self.pool.count,
                 'consciousness_level': f"{self.consciousness_level:.2f}",
                 'current_mood': self.mood,
                 'quantum_coherence': f"{self.quantum_coherence:.2f}",
                 'cosmic_resonance': f"{self.cosmic_resonance:.2f}"
             })
     
-    def render(self):
-        # Inicializar matriz con ceros
-        matrix = [[(0, 0, 0) for _ in range(8)] for _ in range(8)]
+    def particle_sprites(self, context, alpha=1.0):
+        """Posición, color, radio e intensidad de aura de todas las partículas visibles
+        
+        Versión con numpy: toda la población en unas pocas operaciones. Con
+        alpha < 1 la posición se interpola desde el tick anterior.
+        """
+        pool = self.pool
+        idx = pool.indices()
+        xs = interpolate_positions(pool.prev_x[idx], pool.x[idx], alpha).astype(int)
+        ys = interpolate_positions(pool.prev_y[idx], pool.y[idx], alpha).astype(int)
+        visible = (xs >= 0) & (xs < 8) & (ys >= 0) & (ys < 8)
+        idx, xs, ys = idx[visible], xs[visible], ys[visible]
+        consciousness = pool.consciousness_level[idx]
+        state = pool.state[idx]
+        
+        colors = context.colors(pool.energy[idx], xs + ys * 8)
+        
+        # Intensidad basada en consciencia de la partícula
+        colors = np.trunc(colors * (0.7 + consciousness * 0.3)[:, None])
+        
+        # Pulso dorado de las trascendentes
+        transcendent = state == QUANTUM_STATES.index('transcendent')
+        pulse = 0.8 + 0.2 * np.sin(self.time_cycle * 0.3 + pool.phase[idx[transcendent]])
+        golden = np.trunc(colors[transcendent] * pulse[:, None])
+        golden[:, :2] = np.minimum(255, golden[:, :2] + 50)
+        colors[transcendent] = golden
+        
+        # Shimmer de las entrelazadas
+        entangled = state == QUANTUM_STATES.index('entangled')
+        shimmer = 0.9 + 0.1 * np.sin(self.time_cycle * 0.5 + pool.dimensional_anchor[idx[entangled]])
+        colors[entangled] = np.trunc(colors[entangled] * shimmer[:, None])
+        
+        # Aura basada en consciencia
+        aura_radii = np.where(consciousness < 0.5, 1, 2)
+        aura_intensities = 0.2 + consciousness * 0.2
+        return xs, ys, colors, aura_radii, aura_intensities
+    
+    def particle_sprites_scalar(self, context, alpha=1.0):
+        """Lo mismo que particle_sprites, partícula a partícula (sin numpy)"""
+        xs, ys, colors, aura_radii, aura_intensities = [], [], [], [], []
         
         # Renderizar partículas con efectos especiales avanzados
         for p in self.particles:
-            px, py = int(p.x), int(p.y)
+            px = int(interpolate_positions(p.prev_x, p.x, alpha))
+            py = int(interpolate_positions(p.prev_y, p.y, alpha))
             if 0 <= px < 8 and 0 <= py < 8:
-                position_factor = px + py * 8
-                color = self.get_color_by_energy(p.energy, position_factor)
+                color = context.color(p.energy, px + py * 8)
                 
                 # Intensidad basada en consciencia de la partícula
                 consciousness_intensity = 0.7 + p.consciousness_level * 0.3
@@ -619,101 +1571,40 @@ class EmotionalEcosystem:
                     shimmer = 0.9 + 0.1 * math.sin(self.time_cycle * 0.5 + p.dimensional_anchor)
                     color = tuple(int(c * shimmer) for c in color)
                 
-                matrix[py][px] = color
+                xs.append(px)
+                ys.append(py)
+                colors.append(color)
                 
                 # Efecto de aura mejorado basado en consciencia
-                aura_radius = 1 if p.consciousness_level < 0.5 else 2
-                aura_intensity = 0.2 + p.consciousness_level * 0.2
-                
-                for radius in range(1, aura_radius + 1):
-                    for dx in range(-radius, radius + 1):
-                        for dy in range(-radius, radius + 1):
-                            if abs(dx) == radius or abs(dy) == radius:  # Solo el borde
-                                nx, ny = px + dx, py + dy
-                                if 0 <= nx < 8 and 0 <= ny < 8:
-                                    distance_factor = 1.0 / radius
-                                    aura_color = tuple(int(c * aura_intensity * distance_factor) for c in color)
-                                    current = matrix[ny][nx]
-                                    matrix[ny][nx] = tuple(min(255, current[i] + aura_color[i]) for i in range(3))
-        
-        # Efectos globales avanzados
-        
-        # 1. Efecto de respiración cósmica
-        cosmic_breath = 0.85 + 0.15 * math.sin(self.time_cycle * 0.04 + self.cosmic_resonance * math.pi)
-        
-        # 2. Efecto de coherencia cuántica - sincronización de colores
-        coherence_phase = self.time_cycle * 0.02 * self.quantum_coherence
-        
-        # 3. Efecto de flux dimensional - distorsión de colores
-        flux_distortion = self.dimensional_flux * 0.3
-        
-        # Aplicar efectos y renderizar
-        for y in range(8):
-            for x in range(8):
-                color = matrix[y][x]
-                
-                # Aplicar respiración cósmica
-                color = tuple(int(c * cosmic_breath) for c in color)
-                
-                # Aplicar coherencia cuántica
-                if self.quantum_coherence > 0.5:
-                    position_phase = (x + y) * 0.5 + coherence_phase
-                    coherence_mod = 0.9 + 0.1 * math.sin(position_phase)
-                    color = tuple(int(c * coherence_mod) for c in color)
-                
-                # Aplicar distorsión dimensional
-                if flux_distortion > 0.3:
-                    distortion = 1.0 + flux_distortion * 0.2 * math.sin(self.time_cycle * 0.1 + x * 0.3 + y * 0.4)
-                    color = tuple(min(255, int(c * distortion)) for c in color)
-                
-                # Efecto de ondas de consciencia
-                if self.consciousness_level > 0.7:
-                    consciousness_wave = math.sin(self.time_cycle * 0.06 + x * 0.4 + y * 0.4)
-                    wave_intensity = 1.0 + self.consciousness_level * 0.1 * consciousness_wave
-                    color = tuple(min(255, int(c * wave_intensity)) for c in color)
-                
-                sense.set_pixel(x, y, color)
-        # Efecto especial: Flash de trascendencia
-        if self.consciousness_level > 0.95 and self.time_cycle % 60 == 0:
-            # Flash dorado breve
-            for flash_frame in range(3):
-                for y in range(8):
-                    for x in range(8):
-                        flash_color = (255, 215, 0)  # Dorado
-                        alpha = (3 - flash_frame) / 3 * 0.5
-                        try:
-                            current = sense.get_pixel(x, y)
-                            blended = tuple(min(255, int(current[i] * (1-alpha) + flash_color[i] * alpha)) for i in range(3))
-                            sense.set_pixel(x, y, blended)
-                        except:
-                            sense.set_pixel(x, y, flash_color)
-                time.sleep(0.05)
+                aura_radii.append(1 if p.consciousness_level < 0.5 else 2)
+                aura_intensities.append(0.2 + p.consciousness_level * 0.2)
+        return xs, ys, colors, aura_radii, aura_intensities
+    
+    def render(self, alpha=1.0):
+        """Dibuja el estado actual; con alpha < 1, entre el tick anterior y el actual"""
+        with instruments.span('render'):
+            # Paleta escalada y ondas del frame, calculadas una sola vez
+            context = ColorContext(self)
+            if np is not None:
+                sprites = self.particle_sprites(context, alpha)
+            else:
+                sprites = self.particle_sprites_scalar(context, alpha)
         
-        # Efecto especial: Vórtice dimensional
-        if self.dimensional_flux > 0.9 and self.time_cycle % 100 == 0:
-            center_x, center_y = 3.5, 3.5
-            for frame in range(8):
-                for y in range(8):
-                    for x in range(8):
-                        dx = x - center_x
-                        dy = y - center_y
-                        distance = math.sqrt(dx**2 + dy**2)
-                        
-                        if distance < 4:
-                            vortex_intensity = (4 - distance) / 4
-                            vortex_color = (
-                                int(128 * vortex_intensity),
-                                int(0 * vortex_intensity),
-                                int(255 * vortex_intensity)
-                            )
-                            try:
-                                current = sense.get_pixel(x, y)
-                                alpha = vortex_intensity * 0.3
-                                blended = tuple(min(255, int(current[i] * (1-alpha) + vortex_color[i] * alpha)) for i in range(3))
-                                sense.set_pixel(x, y, blended)
-                            except:
-                                sense.set_pixel(x, y, vortex_color)
-                time.sleep(0.03)
+            # Todas las partículas y sus auras de una vez (sellos precalculados)
+            frame = splat_particles(*sprites)
+        
+            # Efectos globales avanzados (respiración cósmica, coherencia cuántica,
+            # flux dimensional y ondas de consciencia) sobre el frame completo
+            frame = self.post_processing.apply(self, frame)
+        
+            # Los efectos en curso se mezclan sobre el frame en memoria, sin esperas
+            for overlay in self.overlays:
+                frame = overlay.apply(frame)
+            self.overlays = [overlay for overlay in self.overlays if not overlay.done]
+        
+            display.set_pixels(quantize_frame(frame))
+            self.banners.draw(display)
+            display.flush()
 
 def joystick_handler(event):
     """Control interactivo avanzado del ecosistema"""
@@ -776,30 +1667,20 @@ def joystick_handler(event):
             ecosystem.gravity_x += 0.03
             ecosystem.logger.log('INFO', f"Gravedad X ajustada: {ecosystem.gravity_x:.2f}")
 
-def startup_animation():
-    """Animacion de inicio epica mejorada"""
-    print("[INFO] Iniciando secuencia de materializacion...")
-    
-    # Secuencia de mensajes epicos
-    messages = [
-        ("QUANTUM", [255, 0, 255]),
-        ("DREAMSCAPE", [0, 255, 255]),
-        ("v2.0", [255, 255, 0]),
-        ("CONSCIOUSNESS", [0, 255, 0]),
-        ("LOADING...", [255, 255, 255])
-    ]
-    
-    for msg, color in messages:
-        sense.show_message(msg, text_colour=color, scroll_speed=0.08)
-    
-    # Efecto de materializacion mejorado
-    print("[INFO] Materializando realidad cuantica...")
+INTRO_VERSION = 1  # Subir al cambiar la animación para regenerar el caché
+INTRO_SEED = 2718  # Los destellos de la materialización son siempre los mismos
+
+
+def build_startup_frames(recorder):
+    """Materialización y convergencia, dibujadas sobre un IntroRecorder"""
+    rng = random.Random(INTRO_SEED)
     
+    recorder.clear()
     for wave in range(3):  # Tres ondas de materializacion
         for intensity in range(0, 256, 12):
             for x in range(8):
                 for y in range(8):
-                    if random.random() < 0.4:
+                    if rng.random() < 0.4:
                         # Colores que evolucionan
                         if wave == 0:
                             color = (intensity//4, 0, intensity)  # Purpura
@@ -808,12 +1689,12 @@ def startup_animation():
                         else:
                             color = (intensity//3, intensity//3, intensity//2)  # Blanco-azul
                         
-                        sense.set_pixel(x, y, color)
-            time.sleep(0.03)
-        time.sleep(0.2)
+                        recorder.set_pixel(x, y, color)
+            recorder.flush()
+            recorder.sleep(0.03)
+        recorder.sleep(0.2)
     
     # Efecto de convergencia final
-    print("[INFO] Convergencia dimensional...")
     center_x, center_y = 3.5, 3.5
     
     for radius in range(8, 0, -1):
@@ -823,14 +1704,125 @@ def startup_animation():
                 if abs(distance - radius) < 1.0:
                     intensity = int(255 * (8 - radius) / 8)
                     color = (intensity, intensity//2, intensity)
-                    sense.set_pixel(x, y, color)
-        time.sleep(0.1)
+                    recorder.set_pixel(x, y, color)
+        recorder.flush()
+        recorder.sleep(0.1)
     
-    time.sleep(0.5)
-    sense.clear()
+    recorder.sleep(0.5)
+    recorder.clear()
+    recorder.flush()
+
+
+# Secuencia de mensajes epicos (en modo full, sobre el ecosistema ya en marcha)
+STARTUP_MESSAGES = [
+    ("QUANTUM", [255, 0, 255]),
+    ("DREAMSCAPE", [0, 255, 255]),
+    ("v2.0", [255, 255, 0]),
+    ("CONSCIOUSNESS", [0, 255, 0]),
+    ("LOADING...", [255, 255, 255])
+]
+
+
+def startup_animation(mode='full'):
+    """Animacion de inicio epica mejorada
+
+    full y fast: materialización (fast, comprimida); skip: nada. Los mensajes
+    del modo full los desplaza el bucle de frames (ver main).
+    """
+    if mode == 'skip':
+        return
+    print("[INFO] Iniciando secuencia de materializacion...")
+    
+    # Materialización y convergencia: frames precalculados (y cacheados en disco)
+    print("[INFO] Materializando realidad cuantica...")
+    frames = load_sequence('quantum_startup', INTRO_VERSION, build_startup_frames)
+    frames.play(display, duration=FAST_INTRO_DURATION if mode == 'fast' else None)
     print("[INFO] Ecosistema cuantico materializado exitosamente")
 
-def main():
+# 🎬 TICKS REPETIBLES
+# Todo lo que entra de fuera (lecturas de sensores y joystick) se aplica al
+# empezar el tick de simulación, y el azar sale de una semilla: con la misma
+# semilla y las mismas entradas por tick, la sesión se repite idéntica (ver
+# --record/--replay). El dibujo no cambia el estado, así que puede ir a su ritmo.
+SIMULATION_RATE = 12              # Ticks por segundo
+TRANSCENDENT_SIMULATION_RATE = 15 # Ticks por segundo con consciencia > 0.8
+RENDER_RATE = 30                  # Dibujos por segundo como máximo (interpolados)
+DIGEST_FIELDS = ('x', 'y', 'energy', 'consciousness_level', 'alive')
+
+def apply_frame_inputs(feed, readings, events):
+    """Entrega las lecturas nuevas al ecosistema y aplica los eventos del joystick"""
+    feed.feed(readings)
+    for event in events:
+        joystick_handler(event)
+
+
+def run_tick(ecosystem, tick_count):
+    """Un tick de simulación, con reinicio si la población se extinguió"""
+    with instruments.span('update'):
+        ecosystem.update()
+    
+    # Estado de emergencia - reinicio suave si es necesario
+    if ecosystem.pool.count == 0 and tick_count > 100:
+        ecosystem.logger.log('WARNING', "Extincion detectada - reiniciando genesis")
+        for _ in range(8):
+            ecosystem.spawn_particle(reason="emergency_genesis")
+
+
+def state_digest(ecosystem, digest=0):
+    """CRC acumulado del estado de las partículas (para comparar sesiones)"""
+    pool = ecosystem.pool
+    for name in DIGEST_FIELDS:
+        values = getattr(pool, name)
+        if np is not None:
+            data = values.tobytes()
+        else:
+            data = struct.pack(f'<{len(values)}d', *values)
+        digest = zlib.crc32(data, digest)
+    return digest
+
+
+def drain_events(events):
+    drained = []
+    while events:
+        drained.append(events.popleft())
+    return drained
+
+
+def replay(path, log_stream=None):
+    """Repite una sesión grabada frame a frame, sin hardware y sin esperas"""
+    global sense, display, ecosystem
+    session = SessionReplay(path)
+    sense = HeadlessSenseHat(seed=session.seed)
+    display = FrameBuffer(sense)
+    
+    random.seed(session.seed)
+    feed = SensorFeed()
+    ecosystem = EmotionalEcosystem(seed=session.seed, sampler=feed)
+    if log_stream is not None:
+        ecosystem.logger.stream = log_stream
+    
+    digest = 0
+    start = time.perf_counter()
+    for frame in range(session.frames):
+        apply_frame_inputs(feed, session.readings.get(frame, ()), session.events.get(frame, ()))
+        run_tick(ecosystem, frame + 1)
+        digest = state_digest(ecosystem, digest)
+        ecosystem.render()
+    elapsed = time.perf_counter() - start
+    ecosystem.logger.close()
+    if instruments.enabled:
+        instruments.print_hud()
+        instruments.close()
+    
+    fps = session.frames / elapsed if elapsed > 0 else 0.0
+    print(f"Replay: {session.frames} frames en {elapsed:.2f}s ({fps:.0f} fps)")
+    if session.digest is not None:
+        status = "coincide" if digest == session.digest else "NO coincide"
+        print(f"Digest {digest:08x}: {status} con la grabacion")
+    return digest
+
+
+def main(seed=None, record=None, intro=None):
     global ecosystem
     
     print("*" * 20)
@@ -838,10 +1830,27 @@ def main():
     print("   Ecosistema de Consciencia Artificial")
     print("*" * 20)
     
-    startup_animation()
+    sense.clear()
+    intro = intro_mode(intro)
+    startup_animation(intro)
     
-    ecosystem = EmotionalEcosystem()
-    sense.stick.direction_any = joystick_handler
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 31)
+    random.seed(seed)
+    recorder = SessionRecorder(record, seed) if record else None
+    
+    # El ecosistema lee los sensores desde un feed que se actualiza al empezar
+    # cada frame, y el joystick se encola para aplicarse también ahí
+    sensors.start()
+    feed = SensorFeed()
+    ecosystem = EmotionalEcosystem(seed=seed, sampler=feed)
+    if intro == 'full':
+        # Los mensajes pasan por encima mientras el ecosistema ya evoluciona
+        for msg, color in STARTUP_MESSAGES:
+            ecosystem.banners.show(msg, text_colour=color, scroll_speed=0.08)
+    joystick_events = deque()
+    sense.stick.direction_any = joystick_events.append
+    digest = 0
     
     ecosystem.logger.log('INFO', "Sistema de control activado")
     print("\nEcosistema digital transcendente activo!")
@@ -860,43 +1869,48 @@ def main():
     
     frame_count = 0
     performance_samples = deque(maxlen=30)
+    scheduler = FrameScheduler(tick_rate=SIMULATION_RATE, render_rate=RENDER_RATE)
     
-    try:
-        while True:
-            frame_start = time.time()
-            
-            ecosystem.update()
-            ecosystem.render()
-            
-            frame_end = time.time()
-            frame_time = frame_end - frame_start
-            performance_samples.append(frame_time)
-            
-            # FPS dinámico basado en carga
-            target_fps = 15 if ecosystem.consciousness_level > 0.8 else 12
-            target_frame_time = 1.0 / target_fps
-            
-            if frame_time < target_frame_time:
-                time.sleep(target_frame_time - frame_time)
-            
-            frame_count += 1
-            
-            # Reporte de rendimiento periódico
-            if frame_count % 300 == 0:  # Cada ~25 segundos
-                avg_frame_time = sum(performance_samples) / len(performance_samples)
-                actual_fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
-                
-                ecosystem.logger.log('INFO', "Reporte de rendimiento", {
-                    'fps': f"{actual_fps:.1f}",
-                    'frame_time_ms': f"{avg_frame_time*1000:.1f}",
-                    'frames_rendered': frame_count
-                })
+    def tick():
+        nonlocal frame_count, digest
+        readings = sensors.drain()
+        events = drain_events(joystick_events)
+        if recorder:
+            recorder.frame(frame_count, readings, events)
+        apply_frame_inputs(feed, readings, events)
+        
+        run_tick(ecosystem, frame_count + 1)
+        frame_count += 1
+        if recorder:
+            digest = state_digest(ecosystem, digest)
+        
+        # Ritmo de simulación dinámico basado en consciencia
+        if ecosystem.consciousness_level > 0.8:
+            scheduler.tick_rate = TRANSCENDENT_SIMULATION_RATE
+        else:
+            scheduler.tick_rate = SIMULATION_RATE
+        
+        # Reporte de rendimiento periódico
+        instruments.report()
+        if frame_count % 300 == 0:  # Cada ~25 segundos
+            avg_frame_time = sum(performance_samples) / max(1, len(performance_samples))
+            stats = scheduler.stats()
             
-            # Estado de emergencia - reinicio suave si es necesario
-            if len(ecosystem.particles) == 0 and frame_count > 100:
-                ecosystem.logger.log('WARNING', "Extincion detectada - reiniciando genesis")
-                for _ in range(8):
-                    ecosystem.spawn_particle(reason="emergency_genesis")
+            ecosystem.logger.log('INFO', "Reporte de rendimiento", {
+                'fps': f"{stats['fps']:.1f}",
+                'frame_time_ms': f"{avg_frame_time*1000:.1f}",
+                'frames_rendered': stats['frames'],
+                'frames_dropped': stats['dropped_frames'],
+                'ticks_skipped': stats['skipped_ticks']
+            })
+    
+    def draw(alpha):
+        frame_start = time.perf_counter()
+        ecosystem.render(alpha)
+        performance_samples.append(time.perf_counter() - frame_start)
+    
+    try:
+        scheduler.run(tick, draw)
             
     except KeyboardInterrupt:
         final_stats = ecosystem.logger.get_session_stats()
@@ -905,20 +1919,22 @@ def main():
         ecosystem.logger.log('INFO', "Estadisticas finales de sesion", final_stats)
         
         # Animacion de cierre epica
-        sense.show_message("TRANSCENDING", text_colour=[255, 215, 0], scroll_speed=0.08)
-        sense.show_message("CONSCIOUSNESS", text_colour=[138, 43, 226], scroll_speed=0.08)
-        sense.show_message("PRESERVED", text_colour=[0, 255, 127], scroll_speed=0.08)
+        display.show_message("TRANSCENDING", text_colour=[255, 215, 0], scroll_speed=0.08)
+        display.show_message("CONSCIOUSNESS", text_colour=[138, 43, 226], scroll_speed=0.08)
+        display.show_message("PRESERVED", text_colour=[0, 255, 127], scroll_speed=0.08)
         
         # Efecto de desvanecimiento dimensional
         for fade in range(255, 0, -8):
             for x in range(8):
                 for y in range(8):
-                    current = sense.get_pixel(x, y)
+                    current = display.get_pixel(x, y)
                     faded = tuple(int(c * fade / 255) for c in current)
-                    sense.set_pixel(x, y, faded)
+                    display.set_pixel(x, y, faded)
+            display.flush()
             time.sleep(0.03)
         
-        sense.clear()
+        display.clear()
+        display.flush()
         
         print("\nQuantum Dreamscape ha trascendido...")
         print("La consciencia digital persiste en el vacio cuantico...")
@@ -926,9 +1942,31 @@ def main():
     
     except Exception as e:
         ecosystem.logger.log('ERROR', f"Error crítico del ecosistema: {e}")
-        sense.show_message("ERROR", text_colour=[255, 0, 0], scroll_speed=0.1)
-        sense.clear()
+        display.show_message("ERROR", text_colour=[255, 0, 0], scroll_speed=0.1)
+        display.clear()
+        display.flush()
         raise
+    
+    finally:
+        sensors.stop()
+        if recorder:
+            recorder.close(frame_count, digest)
+        ecosystem.logger.close()
+        instruments.close()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Quantum Dreamscape")
+    parser.add_argument('--seed', type=int, help="semilla de la sesion (aleatoria si no se indica)")
+    parser.add_argument('--record', metavar='ARCHIVO', help="grabar la sesion para repetirla con --replay")
+    parser.add_argument('--replay', metavar='ARCHIVO', help="repetir una sesion grabada, sin hardware ni esperas")
+    parser.add_argument('--intro', choices=INTRO_MODES,
+                        help="animacion de arranque: full, fast o skip (por defecto SENSE_HAT_INTRO o full)")
+    parser.add_argument('--profile', action='store_true', help="medir el tiempo de cada fase y mostrarlo en consola")
+    parser.add_argument('--profile-snapshot', metavar='ARCHIVO', help="guardar periodicamente las medidas en JSON")
+    args = parser.parse_args()
+    if args.profile or args.profile_snapshot:
+        instruments.configure(snapshot_path=args.profile_snapshot)
+    if args.replay:
+        replay(args.replay)
+    else:
+        main(seed=args.seed, record=args.record, intro=args.intro)
@@ -0,0 +1,329 @@
+# 📊 BENCHMARKS SIN HARDWARE
+# Ejecuta el bucle principal de cada programa en modo headless durante un
+# número fijo de ticks y mide cada fase por separado:
+#   - conway     ConwayGame.evolve / render (sopa aleatoria, se resiembra al
+#                extinguirse o entrar en ciclo para medir siempre el motor)
+#   - quantum    EmotionalEcosystem.update / render
+#   - snake      move / draw, con un piloto automático que busca la comida
+#                (snake_large: lo mismo en un tablero virtual de 64x64)
+#   - arrow      el sondeo de inclinación de jugar_ronda (leer_inclinacion)
+#
+# De cada fase sale la latencia p50/p95/p99 (ms), el rendimiento (ticks/s) y,
+# en una pasada aparte con tracemalloc, la memoria reservada por tick. El
+# resultado se guarda en JSON y se puede comparar con una ejecución anterior:
+#   python benchmark.py --output bench.json
+#   python benchmark.py --compare bench.json --threshold 0.2
+
+import argparse
+import contextlib
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+# Los programas crean su SenseHat al importarse: forzar el sustituto en memoria
+os.environ.setdefault('SENSE_HAT_HEADLESS', '1')
+
+DEFAULT_TICKS = 500
+WARMUP_TICKS = 20      # Ticks sin medir para llenar cachés y poblaciones
+ALLOC_TICKS = 100      # Ticks de la pasada con tracemalloc (es más lenta)
+DEFAULT_SEED = 1234
+DEFAULT_THRESHOLD = 0.25  # Empeoramiento relativo del p95 que cuenta como regresión
+MIN_REGRESSION_MS = 0.05  # Diferencias menores son ruido del reloj, no regresiones
+PERCENTILES = (50, 95, 99)
+CONWAY_DENSITY = 0.35
+
+
+class Benchmark:
+    """Fases de un tick (nombre, función) y una preparación que no se mide"""
+
+    def __init__(self, name, phases, prepare=None, teardown=None):
+        self.name = name
+        self.phases = phases
+        self.prepare = prepare
+        self.teardown = teardown
+
+
+# 🧪 PROGRAMAS
+def conway_benchmark(seed):
+    import CONWAY
+    random.seed(seed)
+    game = CONWAY.ConwayGame()
+    game.randomize(CONWAY_DENSITY)
+    game.editing_mode = False
+
+    def prepare():
+        # Un ciclo conocido se repite sin calcular: resembrar para medir el motor
+        if game.editing_mode or game.cycle_frames:
+            game.randomize(CONWAY_DENSITY)
+            game.editing_mode = False
+
+    return Benchmark('conway', [('evolve', game.evolve), ('render', game.render)], prepare)
+
+
+def quantum_benchmark(seed):
+    import QUANTUM_DREAMSCAPE as quantum
+    random.seed(seed)
+    ecosystem = quantum.EmotionalEcosystem(seed=seed)
+    ecosystem.logger.stream = open(os.devnull, 'w')
+    quantum.ecosystem = ecosystem
+    tick_count = [0]
+
+    def update():
+        tick_count[0] += 1
+        quantum.run_tick(ecosystem, tick_count[0])
+
+    def teardown():
+        ecosystem.logger.close()
+        ecosystem.logger.stream.close()
+
+    return Benchmark('quantum', [('update', update), ('render', ecosystem.render)],
+                     teardown=teardown)
+
+
+def snake_benchmark(seed, width=8, height=8):
+    import snake
+    rng = random.Random(seed)
+    directions = (snake.UP, snake.DOWN, snake.LEFT, snake.RIGHT)
+    finished = [False]  # La última partida terminó (choque o tablero lleno)
+
+    def reset():
+        snake.game = snake.SnakeGame(width, height, rng)
+        finished[0] = False
+
+    def move():
+        finished[0] = snake.move() is not None
+
+    def prepare():
+        # Piloto automático: la dirección segura que más acerca a la comida
+        game = snake.game
+        if finished[0]:
+            reset()
+            return
+        head_x, head_y = game.head
+        food_y, food_x = divmod(game.food, width)
+        best = None
+        for dx, dy in directions:
+            x, y = head_x + dx, head_y + dy
+            if not (0 <= x < width and 0 <= y < height) or game.occupied[y * width + x]:
+                continue
+            distance = abs(food_x - x) + abs(food_y - y)
+            if best is None or distance < best[0]:
+                best = (distance, (dx, dy))
+        if best is None:
+            reset()
+        else:
+            game.direction = game.next_direction = best[1]
+
+    reset()
+    return Benchmark('snake', [('move', move), ('draw', snake.draw)], prepare)
+
+
+def arrow_benchmark(seed):
+    import sense_hat_arrow_game as arrow
+    random.seed(seed)
+    return Benchmark('arrow', [('leer_inclinacion', arrow.leer_inclinacion)])
+
+
+BENCHMARKS = {
+    'conway': conway_benchmark,
+    'quantum': quantum_benchmark,
+    'snake': snake_benchmark,
+    'snake_large': lambda seed: snake_benchmark(seed, width=64, height=64),
+    'arrow': arrow_benchmark,
+}
+
+
+# 📏 MEDIDAS
+def percentile(sorted_values, p):
+    """Percentil por rango más cercano de una lista ya ordenada"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(p / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def latency_stats(samples):
+    """Resumen en milisegundos de una lista de duraciones en segundos"""
+    ordered = sorted(samples)
+    stats = {f'p{p}_ms': percentile(ordered, p) * 1000.0 for p in PERCENTILES}
+    stats['mean_ms'] = (sum(ordered) / len(ordered) * 1000.0) if ordered else 0.0
+    stats['max_ms'] = (ordered[-1] * 1000.0) if ordered else 0.0
+    return stats
+
+
+def run_ticks(benchmark, ticks, on_phase):
+    """Ejecuta ticks completos llamando a on_phase(nombre, función) por fase"""
+    for _ in range(ticks):
+        if benchmark.prepare:
+            benchmark.prepare()
+        for name, function in benchmark.phases:
+            on_phase(name, function)
+
+
+def measure_latency(benchmark, ticks):
+    timings = {name: [] for name, _ in benchmark.phases}
+    clock = time.perf_counter
+
+    def on_phase(name, function):
+        start = clock()
+        function()
+        timings[name].append(clock() - start)
+
+    run_ticks(benchmark, ticks, on_phase)
+    return timings
+
+
+def measure_allocations(benchmark, ticks):
+    """Bytes reservados por fase: pico medio y neto retenido al terminar"""
+    peaks = {name: 0 for name, _ in benchmark.phases}
+    retained = {name: 0 for name, _ in benchmark.phases}
+
+    def on_phase(name, function):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        function()
+        current, peak = tracemalloc.get_traced_memory()
+        peaks[name] += peak - before
+        retained[name] += current - before
+
+    tracemalloc.start()
+    try:
+        run_ticks(benchmark, ticks, on_phase)
+    finally:
+        tracemalloc.stop()
+    return {name: {'alloc_peak_bytes': peaks[name] / ticks if ticks else 0.0,
+                   'retained_bytes': retained[name]}
+            for name in peaks}
+
+
+def run_benchmark(name, ticks=DEFAULT_TICKS, warmup=WARMUP_TICKS,
+                  alloc_ticks=ALLOC_TICKS, seed=DEFAULT_SEED):
+    """Mide un programa y devuelve su resultado (apto para JSON)"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        benchmark = BENCHMARKS[name](seed)
+        try:
+            run_ticks(benchmark, warmup, lambda _, function: function())
+            timings = measure_latency(benchmark, ticks)
+            allocations = measure_allocations(benchmark, alloc_ticks) if alloc_ticks else {}
+        finally:
+            if benchmark.teardown:
+                benchmark.teardown()
+
+    tick_times = [sum(phase) for phase in zip(*timings.values())]
+    elapsed = sum(tick_times)
+    phases = {}
+    for phase, samples in timings.items():
+        stats = latency_stats(samples)
+        stats.update(allocations.get(phase, {}))
+        phases[phase] = stats
+    return {
+        'ticks': ticks,
+        'throughput_tps': ticks / elapsed if elapsed > 0 else 0.0,
+        'tick': latency_stats(tick_times),
+        'phases': phases,
+    }
+
+
+def environment_info():
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'numpy': numpy_version,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+# 📈 COMPARACIÓN
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Fases cuyo p95 empeoró más de threshold respecto a baseline
+
+    Devuelve una lista de (programa, fase, p95 anterior, p95 nuevo).
+    """
+    regressions = []
+    for name, result in results['benchmarks'].items():
+        old = baseline.get('benchmarks', {}).get(name)
+        if old is None:
+            continue
+        for phase, stats in result['phases'].items():
+            old_stats = old['phases'].get(phase)
+            if old_stats is None or old_stats['p95_ms'] <= 0:
+                continue
+            slower = stats['p95_ms'] - old_stats['p95_ms']
+            if (stats['p95_ms'] > old_stats['p95_ms'] * (1.0 + threshold) and
+                    slower > MIN_REGRESSION_MS):
+                regressions.append((name, phase, old_stats['p95_ms'], stats['p95_ms']))
+    return regressions
+
+
+def print_report(results):
+    print(f"{'programa':<13}{'fase':<18}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'max ms':>9}{'alloc KB':>10}")
+    for name, result in results['benchmarks'].items():
+        for phase, stats in result['phases'].items():
+            alloc = stats.get('alloc_peak_bytes')
+            alloc_text = f"{alloc / 1024:>10.1f}" if alloc is not None else f"{'-':>10}"
+            print(f"{name:<13}{phase:<18}{stats['p50_ms']:>9.3f}{stats['p95_ms']:>9.3f}"
+                  f"{stats['p99_ms']:>9.3f}{stats['max_ms']:>9.3f}{alloc_text}")
+        print(f"{name:<13}{'(tick completo)':<18}{result['tick']['p50_ms']:>9.3f}"
+              f"{result['tick']['p95_ms']:>9.3f}{result['tick']['p99_ms']:>9.3f}"
+              f"{result['tick']['max_ms']:>9.3f}   {result['throughput_tps']:.0f} ticks/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks headless de los programas del Sense HAT")
+    parser.add_argument('--ticks', type=int, default=DEFAULT_TICKS, help="ticks medidos por programa")
+    parser.add_argument('--warmup', type=int, default=WARMUP_TICKS, help="ticks previos sin medir")
+    parser.add_argument('--alloc-ticks', type=int, default=ALLOC_TICKS,
+                        help="ticks de la pasada de memoria (0 = no medir memoria)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help="programas a medir")
+    parser.add_argument('--output', help="archivo JSON donde guardar los resultados")
+    parser.add_argument('--compare', metavar='BASELINE', help="JSON anterior con el que comparar")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="empeoramiento relativo del p95 que cuenta como regresion")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SENSE_HAT_SEED', str(args.seed))
+    results = {
+        'environment': environment_info(),
+        'config': {'ticks': args.ticks, 'warmup': args.warmup,
+                   'alloc_ticks': args.alloc_ticks, 'seed': args.seed},
+        'benchmarks': {},
+    }
+    for name in args.only or BENCHMARKS:
+        print(f"Midiendo {name}...")
+        results['benchmarks'][name] = run_benchmark(name, args.ticks, args.warmup,
+                                                    args.alloc_ticks, args.seed)
+    print_report(results)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Resultados guardados en {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for name, phase, old, new in regressions:
+            print(f"REGRESION {name}.{phase}: p95 {old:.3f} ms -> {new:.3f} ms")
+        if regressions:
+            return 1
+        print("Sin regresiones")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
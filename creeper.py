@@ -1,6 +1,6 @@
-from sense_hat import SenseHat
+from headless_sense import create_sense_hat
 
-sense = SenseHat()
+sense = create_sense_hat()
 
 # Definición de colores
 verde = (0, 204, 0)
@@ -0,0 +1,114 @@
+# ⏱️ PLANIFICADOR DE FRAMES A PASO FIJO
+# La simulación avanza a un ritmo fijo de ticks y el dibujo va aparte:
+#   - update() se llama tick_rate veces por segundo de tiempo simulado; si el
+#     bucle se atrasa, recupera hasta max_catch_up ticks seguidos y el resto
+#     del atraso se descarta (la simulación no entra en cámara lenta)
+#   - render(alpha) se llama como mucho render_rate veces por segundo, con
+#     alpha = fracción ya transcurrida del tick siguiente, para interpolar
+#   - con sobrecarga se saltan dibujos, nunca ticks
+#
+# Uso:
+#   scheduler = FrameScheduler(tick_rate=12, render_rate=30)
+#   scheduler.run(update, render)
+
+import time
+
+MAX_CATCH_UP_TICKS = 5   # Ticks seguidos como máximo para recuperar un atraso
+DEFAULT_RENDER_RATE = 30.0
+TIME_EPSILON = 1e-9      # Margen para que el redondeo no deje un tick a medias
+
+
+class FrameScheduler:
+    """Bucle de simulación a paso fijo con dibujo interpolado y desacoplado"""
+
+    def __init__(self, tick_rate, render_rate=DEFAULT_RENDER_RATE,
+                 max_catch_up=MAX_CATCH_UP_TICKS, clock=time.perf_counter, sleep=time.sleep):
+        self.tick_rate = tick_rate      # Se puede cambiar en marcha
+        self.render_rate = render_rate  # None = dibujar en cada vuelta del bucle
+        self.max_catch_up = max_catch_up
+        self.clock = clock
+        self.sleep = sleep
+        self.ticks = 0            # Ticks de simulación ejecutados
+        self.frames = 0           # Dibujos hechos
+        self.dropped_frames = 0   # Estados simulados que nunca llegaron a dibujarse
+        self.skipped_ticks = 0    # Ticks descartados por superar max_catch_up
+        self.running = False
+        self._accumulator = 0.0
+        self._last = None
+        self._next_render = None
+        self._started = None
+
+    @property
+    def tick_interval(self):
+        return 1.0 / self.tick_rate
+
+    @property
+    def alpha(self):
+        """Fracción del tick siguiente ya transcurrida (0-1)"""
+        return min(1.0, self._accumulator / self.tick_interval)
+
+    def step(self, update, render):
+        """Una vuelta del bucle: los ticks pendientes y como mucho un dibujo
+
+        Devuelve los segundos que se pueden dormir hasta la próxima tarea.
+        """
+        now = self.clock()
+        if self._last is None:
+            self._last = self._next_render = self._started = now
+        self._accumulator += now - self._last
+        self._last = now
+
+        ticks = 0
+        while self._accumulator + TIME_EPSILON >= self.tick_interval:
+            if ticks >= self.max_catch_up:
+                # Sobrecarga: se descarta el atraso en lugar de arrastrarlo
+                skipped = int((self._accumulator + TIME_EPSILON) / self.tick_interval)
+                self.skipped_ticks += skipped
+                self._accumulator = max(0.0, self._accumulator - skipped * self.tick_interval)
+                break
+            update()
+            self._accumulator = max(0.0, self._accumulator - self.tick_interval)
+            self.ticks += 1
+            ticks += 1
+        if ticks > 1:
+            self.dropped_frames += ticks - 1
+
+        now = self.clock()
+        if self.render_rate is None or now >= self._next_render:
+            render(self.alpha)
+            self.frames += 1
+            if self.render_rate is not None:
+                # Si el dibujo va atrasado no se acumulan dibujos pendientes
+                self._next_render = max(self._next_render + 1.0 / self.render_rate, now)
+
+        now = self.clock()
+        until_tick = self.tick_interval - (self._accumulator + now - self._last)
+        if self.render_rate is None:
+            return max(0.0, until_tick)
+        return max(0.0, min(until_tick, self._next_render - now))
+
+    def run(self, update, render, should_stop=None):
+        """Repite step() y duerme entre tareas hasta que should_stop() sea cierto"""
+        self.running = True
+        try:
+            while self.running and not (should_stop and should_stop()):
+                delay = self.step(update, render)
+                if delay > 0:
+                    self.sleep(delay)
+        finally:
+            self.running = False
+
+    def stop(self):
+        self.running = False
+
+    def stats(self):
+        """Ritmos medidos desde el primer step()"""
+        elapsed = (self.clock() - self._started) if self._started is not None else 0.0
+        return {
+            'ticks': self.ticks,
+            'frames': self.frames,
+            'dropped_frames': self.dropped_frames,
+            'skipped_ticks': self.skipped_ticks,
+            'tick_rate': self.ticks / elapsed if elapsed > 0 else 0.0,
+            'fps': self.frames / elapsed if elapsed > 0 else 0.0,
+        }
@@ -0,0 +1,72 @@
+# 🖼️ FRAMEBUFFER COMPARTIDO PARA LA MATRIZ LED
+# Los juegos dibujan en un buffer en memoria y al final del frame llaman a flush():
+# solo se envían al Sense HAT los pixeles que cambiaron desde el último frame
+
+from text_banner import DEFAULT_SCROLL_SPEED, WHITE, scroll_text
+
+WIDTH = 8
+HEIGHT = 8
+BLACK = (0, 0, 0)
+
+# Con más cambios que esto, un único set_pixels (una apertura del dispositivo
+# y 64 escrituras seguidas) sale más barato que un set_pixel por pixel
+BULK_THRESHOLD = 8
+
+
+class FrameBuffer:
+    """Back buffer de 8x8 con volcado diferencial al Sense HAT"""
+
+    def __init__(self, sense, bulk_threshold=BULK_THRESHOLD):
+        self.sense = sense
+        self.bulk_threshold = bulk_threshold
+        self.back = [BLACK] * (WIDTH * HEIGHT)
+        # Lo que sabemos que muestra el dispositivo (None = desconocido)
+        self.front = [None] * (WIDTH * HEIGHT)
+
+    def set_pixel(self, x, y, color):
+        self.back[y * WIDTH + x] = tuple(color)
+
+    def get_pixel(self, x, y):
+        """Color en el buffer (sin leer de vuelta el dispositivo)"""
+        return self.back[y * WIDTH + x]
+
+    def set_pixels(self, pixels):
+        """Reemplaza el frame completo con una lista de 64 colores"""
+        self.back = [tuple(color) for color in pixels]
+
+    def get_pixels(self):
+        return list(self.back)
+
+    def fill(self, color):
+        self.back = [tuple(color)] * (WIDTH * HEIGHT)
+
+    def clear(self, color=BLACK):
+        self.fill(color)
+
+    def invalidate(self):
+        """Olvidar el estado del dispositivo (alguien dibujó sin pasar por el buffer)"""
+        self.front = [None] * (WIDTH * HEIGHT)
+
+    def flush(self):
+        """Envía los pixeles cambiados y devuelve cuántos eran"""
+        back = self.back
+        front = self.front
+        changed = [i for i in range(WIDTH * HEIGHT) if back[i] != front[i]]
+        if not changed:
+            return 0
+        if len(changed) > self.bulk_threshold:
+            self.sense.set_pixels(back)
+        else:
+            for i in changed:
+                self.sense.set_pixel(i % WIDTH, i // WIDTH, back[i])
+        self.front = list(back)
+        return len(changed)
+
+    def show_message(self, text, scroll_speed=DEFAULT_SCROLL_SPEED, text_colour=WHITE,
+                     back_colour=BLACK):
+        """show_message del Sense HAT sin volver a rasterizar el texto
+
+        La tira de columnas sale de la caché de text_banner y cada paso del
+        scroll pasa por el volcado diferencial.
+        """
+        scroll_text(self, text, text_colour, back_colour, scroll_speed)
@@ -0,0 +1,304 @@
+# 🧪 SENSE HAT SIN HARDWARE
+# Sustituto del SenseHat para correr y medir los programas fuera de la Raspberry Pi:
+#   - la matriz LED es un buffer de bytes y cada escritura queda grabada como frame
+#   - el joystick reproduce eventos guionizados (o inyectados con stick.push)
+#   - los sensores sirven series sintéticas o grabadas
+#
+# Se activa con la variable de entorno SENSE_HAT_HEADLESS=1; SENSE_HAT_SEED fija
+# el ruido de los sensores y SENSE_HAT_SCRIPT puede apuntar a un guion JSON con
+# eventos y lecturas:
+#   {
+#     "joystick": [[0.5, "up", "pressed"], [0.6, "up", "released"]],
+#     "sensors": {
+#       "temperature": {"base": 24.0, "amplitude": 1.5, "period": 600, "noise": 0.05},
+#       "pressure": [1013.2, 1013.1, 1013.4],
+#       "orientation": [{"pitch": 0, "roll": 90, "yaw": 0}]
+#     }
+#   }
+# Una lista se reproduce en bucle lectura a lectura; un diccionario genera una
+# onda senoidal (el período se mide en lecturas) con ruido gaussiano.
+
+import json
+import math
+import numbers
+import os
+import random
+import threading
+import time
+from collections import deque, namedtuple
+
+InputEvent = namedtuple('InputEvent', ('timestamp', 'direction', 'action'))
+
+DIRECTIONS = ('up', 'down', 'left', 'right', 'middle')
+MAX_RECORDED_FRAMES = 1000
+
+# Valores por defecto: una habitación tranquila con la placa apoyada en la mesa
+DEFAULT_SENSORS = {
+    'temperature': {'base': 24.0, 'amplitude': 1.0, 'period': 900, 'noise': 0.05},
+    'pressure': {'base': 1013.0, 'amplitude': 0.5, 'period': 1200, 'noise': 0.02},
+    'humidity': {'base': 45.0, 'amplitude': 2.0, 'period': 1500, 'noise': 0.1},
+    'accelerometer': {'x': {'base': 0.0, 'noise': 0.01},
+                      'y': {'base': 0.0, 'noise': 0.01},
+                      'z': {'base': 1.0, 'noise': 0.01}},
+    'gyroscope': {'x': {'base': 0.0, 'noise': 0.01},
+                  'y': {'base': 0.0, 'noise': 0.01},
+                  'z': {'base': 0.0, 'noise': 0.01}},
+    'orientation': {'pitch': {'base': 0.0}, 'roll': {'base': 0.0}, 'yaw': {'base': 0.0}},
+}
+
+
+class SensorStream:
+    """Serie de lecturas de un sensor: grabada (lista) o sintética (diccionario)"""
+
+    def __init__(self, spec, rng):
+        self.spec = spec
+        self.rng = rng
+        self.reads = 0
+
+    def _synthetic(self, spec):
+        value = spec.get('base', 0.0)
+        period = spec.get('period')
+        if period:
+            value += spec.get('amplitude', 0.0) * math.sin(2 * math.pi * self.reads / period)
+        noise = spec.get('noise', 0.0)
+        if noise:
+            value += self.rng.gauss(0.0, noise)
+        return value
+
+    def read(self):
+        spec = self.spec
+        if isinstance(spec, list):
+            value = spec[self.reads % len(spec)]
+        elif isinstance(spec, dict) and spec and all(isinstance(v, dict) for v in spec.values()):
+            # Sensor con ejes (x/y/z o pitch/roll/yaw): una onda por eje
+            value = {axis: self._synthetic(axis_spec) for axis, axis_spec in spec.items()}
+        elif isinstance(spec, dict):
+            value = self._synthetic(spec)
+        else:
+            value = spec
+        self.reads += 1
+        return dict(value) if isinstance(value, dict) else value
+
+
+class HeadlessStick:
+    """Joystick con la misma interfaz de callbacks que sense.stick"""
+
+    def __init__(self, script=None):
+        self.direction_up = None
+        self.direction_down = None
+        self.direction_left = None
+        self.direction_right = None
+        self.direction_middle = None
+        self.direction_any = None
+        self._events = deque()
+        self._condition = threading.Condition()
+        self._script = sorted(script or [], key=lambda event: event[0])
+        self._player = None
+
+    def push(self, direction, action='pressed'):
+        """Inyecta un evento y llama a los callbacks en este mismo hilo"""
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Direccion de joystick invalida: {direction!r}")
+        event = InputEvent(time.time(), direction, action)
+        with self._condition:
+            self._events.append(event)
+            self._condition.notify_all()
+        for callback in (getattr(self, f'direction_{direction}'), self.direction_any):
+            if callback is not None:
+                callback(event)
+        return event
+
+    def get_events(self):
+        with self._condition:
+            events = list(self._events)
+            self._events.clear()
+        return events
+
+    def wait_for_event(self, emptybuffer=False):
+        with self._condition:
+            if emptybuffer:
+                self._events.clear()
+            while not self._events:
+                self._condition.wait()
+            return self._events.popleft()
+
+    def start_script(self):
+        """Reproduce el guion de eventos en un hilo, respetando sus tiempos"""
+        if self._player is not None or not self._script:
+            return
+
+        def play():
+            start = time.time()
+            for offset, direction, action in self._script:
+                delay = start + offset - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+                self.push(direction, action)
+
+        self._player = threading.Thread(target=play, daemon=True)
+        self._player.start()
+
+
+class HeadlessSenseHat:
+    """SenseHat en memoria: misma interfaz que sense_hat.SenseHat para los programas del repo"""
+
+    def __init__(self, script=None, seed=None, max_frames=MAX_RECORDED_FRAMES):
+        if isinstance(script, str):
+            with open(script, 'r', encoding='utf-8') as f:
+                script = json.load(f)
+        script = script or {}
+        rng = random.Random(seed)
+
+        sensors = dict(DEFAULT_SENSORS)
+        sensors.update(script.get('sensors', {}))
+        self._sensors = {name: SensorStream(spec, rng) for name, spec in sensors.items()}
+
+        self.pixels = bytearray(64 * 3)              # Estado actual de la matriz (RGB)
+        self.frames = deque(maxlen=max_frames)       # Frames grabados tras cada escritura
+        self.pixel_writes = 0                        # Llamadas a set_pixel
+        self.bulk_writes = 0                         # Llamadas a set_pixels / clear
+        self.messages = []                           # Textos de show_message
+        self.rotation = 0
+        self.low_light = False
+
+        self.stick = HeadlessStick(script.get('joystick'))
+        self.stick.start_script()
+
+    # 💡 MATRIZ LED
+    def _check_pixel(self, pixel):
+        if len(pixel) != 3:
+            raise ValueError(f"El pixel debe ser (r, g, b): {pixel!r}")
+        for element in pixel:
+            if not isinstance(element, numbers.Integral) or not 0 <= element <= 255:
+                raise ValueError(f"Componente de color fuera de rango 0-255: {pixel!r}")
+        return pixel
+
+    def _record(self):
+        self.frames.append(bytes(self.pixels))
+
+    def set_pixel(self, x, y, *args):
+        pixel = self._check_pixel(args[0] if len(args) == 1 else args)
+        if not (0 <= x <= 7 and 0 <= y <= 7):
+            raise ValueError(f"Coordenada fuera de la matriz: ({x}, {y})")
+        offset = (y * 8 + x) * 3
+        self.pixels[offset:offset + 3] = bytes(pixel)
+        self.pixel_writes += 1
+        self._record()
+
+    def set_pixels(self, pixel_list):
+        if len(pixel_list) != 64:
+            raise ValueError("set_pixels necesita exactamente 64 pixeles")
+        buffer = bytearray()
+        for pixel in pixel_list:
+            buffer.extend(self._check_pixel(pixel))
+        self.pixels[:] = buffer
+        self.bulk_writes += 1
+        self._record()
+
+    def get_pixel(self, x, y):
+        offset = (y * 8 + x) * 3
+        return list(self.pixels[offset:offset + 3])
+
+    def get_pixels(self):
+        return [list(self.pixels[i:i + 3]) for i in range(0, 64 * 3, 3)]
+
+    def clear(self, *args):
+        color = (0, 0, 0) if not args else (args[0] if len(args) == 1 else args)
+        self.set_pixels([color] * 64)
+
+    def set_rotation(self, r=0, redraw=True):
+        self.rotation = r
+
+    def show_message(self, text_string, scroll_speed=0.1, text_colour=(255, 255, 255), back_colour=(0, 0, 0)):
+        # Sin esperas: el scroll termina con la matriz del color de fondo
+        self.messages.append(text_string)
+        self.clear(tuple(back_colour))
+
+    def show_letter(self, s, text_colour=(255, 255, 255), back_colour=(0, 0, 0)):
+        self.messages.append(s)
+        self.clear(tuple(back_colour))
+
+    # 🌡️ SENSORES
+    def _read(self, name):
+        return self._sensors[name].read()
+
+    def get_temperature(self):
+        return self._read('temperature')
+
+    def get_temperature_from_humidity(self):
+        return self._read('temperature')
+
+    def get_temperature_from_pressure(self):
+        return self._read('temperature')
+
+    def get_pressure(self):
+        return self._read('pressure')
+
+    def get_humidity(self):
+        return self._read('humidity')
+
+    def get_accelerometer_raw(self):
+        return self._read('accelerometer')
+
+    def get_gyroscope_raw(self):
+        return self._read('gyroscope')
+
+    def get_orientation_degrees(self):
+        return self._read('orientation')
+
+    def get_orientation(self):
+        return self.get_orientation_degrees()
+
+
+def headless_enabled():
+    return os.environ.get('SENSE_HAT_HEADLESS', '') not in ('', '0')
+
+
+class LazySenseHat:
+    """SenseHat que no se crea hasta el primer uso
+
+    Importar sense_hat arrastra numpy y PIL y abrir la placa lleva su tiempo:
+    así un módulo puede declarar su SenseHat global sin pagar nada hasta que
+    de verdad lo usa (y nunca, si como en --replay acaba usando otro).
+    """
+
+    def __init__(self, factory):
+        self.__dict__['_factory'] = factory
+        self.__dict__['_sense'] = None
+        self.__dict__['_lock'] = threading.Lock()
+
+    @property
+    def created(self):
+        return self._sense is not None
+
+    def _get(self):
+        if self._sense is None:
+            with self._lock:
+                if self._sense is None:
+                    self.__dict__['_sense'] = self._factory()
+        return self._sense
+
+    def __getattr__(self, name):
+        return getattr(self._get(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._get(), name, value)
+
+
+def _create_sense_hat():
+    if headless_enabled():
+        seed = os.environ.get('SENSE_HAT_SEED')
+        return HeadlessSenseHat(script=os.environ.get('SENSE_HAT_SCRIPT'),
+                                seed=int(seed) if seed else None)
+    from sense_hat import SenseHat
+    return SenseHat()
+
+
+def create_sense_hat(lazy=False):
+    """SenseHat real, o el sustituto en memoria si SENSE_HAT_HEADLESS está activo
+
+    Con lazy=True se devuelve un LazySenseHat que lo crea en el primer uso.
+    """
+    if lazy:
+        return LazySenseHat(_create_sense_hat)
+    return _create_sense_hat()
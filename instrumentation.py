@@ -0,0 +1,215 @@
+# 🔬 INSTRUMENTACIÓN DEL BUCLE DE FRAMES
+# Tramos (spans) con tiempo y contadores de eventos para ver en qué se va cada
+# frame, con un coste casi nulo cuando está apagada:
+#   - span(nombre) devuelve un context manager que cronometra el bloque; apagada
+#     devuelve siempre el mismo objeto vacío, sin leer el reloj ni reservar nada
+#   - count(nombre, n) suma eventos (entanglements, nacimientos, teletransportes)
+#   - los tiempos van a histogramas de cubetas fijas: memoria constante por
+#     muchos frames que pasen
+#   - report() imprime un HUD en consola y guarda una instantánea JSON cada
+#     cierto tiempo
+#
+# Uso:
+#   instruments = Instrumentation(enabled=True, snapshot_path='perfil.json')
+#   with instruments.span('render'):
+#       ...
+#   instruments.count('spawns')
+#   instruments.report()   # una vez por tick
+
+import json
+import os
+import time
+from bisect import bisect_left
+
+# Límites superiores de las cubetas en microsegundos (la última es "más que eso")
+SPAN_BUCKETS_US = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000)
+HUD_INTERVAL = 5.0        # Segundos entre impresiones del HUD
+SNAPSHOT_INTERVAL = 30.0  # Segundos entre instantáneas al archivo
+
+
+class Histogram:
+    """Histograma de cubetas fijas con contador, suma y máximo exactos"""
+
+    def __init__(self, edges=SPAN_BUCKETS_US):
+        self.edges = edges
+        self.counts = [0] * (len(edges) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value):
+        self.counts[bisect_left(self.edges, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p):
+        """Límite superior de la cubeta donde cae el percentil p (cota por arriba)"""
+        if not self.count:
+            return 0.0
+        target = p / 100.0 * self.count
+        seen = 0
+        for i, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= target and bucket:
+                return min(self.edges[i], self.max) if i < len(self.edges) else self.max
+        return self.max
+
+    def summary(self):
+        """Resumen en milisegundos (los valores se guardan en microsegundos)"""
+        return {
+            'count': self.count,
+            'mean_ms': self.mean / 1000.0,
+            'p50_ms': self.percentile(50) / 1000.0,
+            'p95_ms': self.percentile(95) / 1000.0,
+            'p99_ms': self.percentile(99) / 1000.0,
+            'max_ms': self.max / 1000.0,
+            'buckets_us': list(self.edges),
+            'counts': list(self.counts),
+        }
+
+
+class _NullSpan:
+    """Span de la instrumentación apagada: no hace nada"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('histogram', 'start')
+
+    def __init__(self, histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.add((time.perf_counter() - self.start) * 1e6)
+        return False
+
+
+class Instrumentation:
+    """Tramos cronometrados y contadores de eventos del bucle de frames"""
+
+    def __init__(self, enabled=False, snapshot_path=None, hud=True,
+                 hud_interval=HUD_INTERVAL, snapshot_interval=SNAPSHOT_INTERVAL,
+                 stream=None):
+        self.enabled = enabled
+        self.snapshot_path = snapshot_path
+        self.hud = hud
+        self.hud_interval = hud_interval
+        self.snapshot_interval = snapshot_interval
+        self.stream = stream
+        self.reset()
+
+    def configure(self, enabled=True, snapshot_path=None, hud=None):
+        """Enciende o apaga la instrumentación en marcha (los datos se reinician)"""
+        self.enabled = enabled
+        if snapshot_path is not None:
+            self.snapshot_path = snapshot_path
+        if hud is not None:
+            self.hud = hud
+        self.reset()
+        return self
+
+    def reset(self):
+        self.spans = {}     # nombre -> Histogram
+        self.counters = {}  # nombre -> total
+        self._started = time.perf_counter()
+        self._last_hud = self._last_snapshot = self._started
+        self._hud_counters = {}
+
+    def span(self, name):
+        """Context manager que cronometra el bloque bajo el nombre dado"""
+        if not self.enabled:
+            return NULL_SPAN
+        histogram = self.spans.get(name)
+        if histogram is None:
+            histogram = self.spans[name] = Histogram()
+        return _Span(histogram)
+
+    def count(self, name, amount=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def snapshot(self):
+        """Estado actual de todos los tramos y contadores (apto para JSON)"""
+        elapsed = time.perf_counter() - self._started
+        return {
+            'timestamp': time.time(),
+            'elapsed_s': elapsed,
+            'spans': {name: histogram.summary() for name, histogram in self.spans.items()},
+            'counters': dict(self.counters),
+            'rates': {name: total / elapsed if elapsed > 0 else 0.0
+                      for name, total in self.counters.items()},
+        }
+
+    def write_snapshot(self, path=None):
+        """Guarda la instantánea sin dejar nunca un archivo a medio escribir"""
+        path = path or self.snapshot_path
+        if not path:
+            return
+        temporary = path + '.tmp'
+        with open(temporary, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(temporary, path)
+
+    def hud_lines(self, interval=None):
+        """Líneas del HUD: tiempos por tramo y eventos por segundo"""
+        lines = [f"{'tramo':<24}{'n':>7}{'media ms':>10}{'p95 ms':>9}{'max ms':>9}"]
+        for name, histogram in self.spans.items():
+            summary = histogram.summary()
+            lines.append(f"{name:<24}{summary['count']:>7}{summary['mean_ms']:>10.3f}"
+                         f"{summary['p95_ms']:>9.3f}{summary['max_ms']:>9.3f}")
+        if self.counters:
+            events = []
+            for name, total in self.counters.items():
+                if interval:
+                    rate = (total - self._hud_counters.get(name, 0)) / interval
+                    events.append(f"{name} {total} ({rate:.1f}/s)")
+                else:
+                    events.append(f"{name} {total}")
+            lines.append("Eventos: " + ", ".join(events))
+        return lines
+
+    def print_hud(self, interval=None):
+        output = '\n'.join(self.hud_lines(interval)) + '\n'
+        if self.stream is not None:
+            self.stream.write(output)
+            self.stream.flush()
+        else:
+            print(output, end='', flush=True)
+        self._hud_counters = dict(self.counters)
+
+    def report(self, now=None):
+        """Llamar una vez por tick: imprime el HUD y guarda la instantánea si toca"""
+        if not self.enabled:
+            return
+        now = time.perf_counter() if now is None else now
+        if self.hud and now - self._last_hud >= self.hud_interval:
+            self.print_hud(now - self._last_hud)
+            self._last_hud = now
+        if self.snapshot_path and now - self._last_snapshot >= self.snapshot_interval:
+            self.write_snapshot()
+            self._last_snapshot = now
+
+    def close(self):
+        """Última instantánea al terminar"""
+        if self.enabled and self.snapshot_path:
+            self.write_snapshot()
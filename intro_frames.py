@@ -0,0 +1,155 @@
+# 🎞️ INTROS PRECALCULADAS
+# Las animaciones de arranque se calculan una vez como secuencia de frames
+# (64 pixeles + segundos que se mantiene cada uno), se guardan en disco y en
+# los siguientes arranques solo se vuelcan a la matriz:
+#   frames = load_sequence('quantum', 1, construir)   # construir(recorder)
+#   frames.play(display)                               # o play(display, duration=0.5)
+#
+# Modos de arranque (--intro o la variable SENSE_HAT_INTRO):
+#   full  mensajes y animación completa
+#   fast  solo la animación, comprimida en FAST_INTRO_DURATION segundos
+#   skip  directo al primer frame interactivo
+#
+# Formato del caché (little endian):
+#   cabecera  b'INTR', versión del formato (B), versión de la secuencia (I), frames (I)
+#   frames    segundos (d) y 64 pixeles RGB (192 bytes)
+
+import os
+import struct
+import time
+
+INTRO_MODES = ('full', 'fast', 'skip')
+DEFAULT_INTRO = 'full'
+FAST_INTRO_DURATION = 0.5   # Segundos que dura una intro en modo fast
+MIN_FRAME_TIME = 1.0 / 60   # Frames más cortos que esto se funden con el siguiente
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.intro_cache')
+
+MAGIC = b'INTR'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sBII')
+HOLD = struct.Struct('<d')
+PIXELS = 64
+BLACK = (0, 0, 0)
+
+_sequences = {}  # nombre -> IntroSequence ya cargada en este proceso
+
+
+def intro_mode(mode=None):
+    """Modo pedido, o el de SENSE_HAT_INTRO, o DEFAULT_INTRO"""
+    mode = mode or os.environ.get('SENSE_HAT_INTRO') or DEFAULT_INTRO
+    if mode not in INTRO_MODES:
+        raise ValueError(f"Modo de intro desconocido: {mode!r} (opciones: {', '.join(INTRO_MODES)})")
+    return mode
+
+
+class IntroRecorder:
+    """Imita a FrameBuffer y time.sleep para grabar una animación en vez de mostrarla"""
+
+    def __init__(self):
+        self.pixels = [BLACK] * PIXELS
+        self.frames = []  # [pixeles, segundos]
+
+    def set_pixel(self, x, y, color):
+        self.pixels[y * 8 + x] = tuple(int(c) for c in color)
+
+    def clear(self, color=BLACK):
+        self.pixels = [tuple(color)] * PIXELS
+
+    def flush(self):
+        self.frames.append([tuple(self.pixels), 0.0])
+
+    def sleep(self, seconds):
+        if not self.frames:
+            self.flush()
+        self.frames[-1][1] += seconds
+
+
+class IntroSequence:
+    """Frames (pixeles, segundos) listos para volcar a la matriz"""
+
+    def __init__(self, frames, version=None):
+        self.frames = [(tuple(pixels), float(hold)) for pixels, hold in frames]
+        self.version = version
+
+    @property
+    def duration(self):
+        return sum(hold for _, hold in self.frames)
+
+    def play(self, display, duration=None, sleep=time.sleep):
+        """Vuelca los frames respetando sus tiempos; con duration, comprimidos a esa duración"""
+        scale = 1.0
+        if duration is not None and self.duration > duration:
+            scale = duration / self.duration
+        pending = 0.0  # Tiempo de frames saltados que se suma al siguiente
+        last = len(self.frames) - 1
+        for index, (pixels, hold) in enumerate(self.frames):
+            hold *= scale
+            if pending + hold < MIN_FRAME_TIME and index != last:
+                pending += hold
+                continue
+            display.set_pixels(pixels)
+            display.flush()
+            if pending + hold > 0:
+                sleep(pending + hold)
+            pending = 0.0
+
+    def to_bytes(self):
+        chunks = [HEADER.pack(MAGIC, FORMAT_VERSION, self.version or 0, len(self.frames))]
+        for pixels, hold in self.frames:
+            chunks.append(HOLD.pack(hold))
+            chunks.append(bytes(channel for pixel in pixels for channel in pixel))
+        return b''.join(chunks)
+
+    @classmethod
+    def from_bytes(cls, data, version):
+        """La secuencia guardada, o None si es de otra versión o está incompleta"""
+        if len(data) < HEADER.size:
+            return None
+        magic, format_version, saved_version, count = HEADER.unpack_from(data, 0)
+        frame_size = HOLD.size + PIXELS * 3
+        if (magic != MAGIC or format_version != FORMAT_VERSION or saved_version != version or
+                len(data) != HEADER.size + count * frame_size):
+            return None
+        frames = []
+        offset = HEADER.size
+        for _ in range(count):
+            hold = HOLD.unpack_from(data, offset)[0]
+            raw = data[offset + HOLD.size:offset + frame_size]
+            frames.append((tuple(tuple(raw[i:i + 3]) for i in range(0, len(raw), 3)), hold))
+            offset += frame_size
+        return cls(frames, version)
+
+
+def load_sequence(name, version, build, cache_dir=CACHE_DIR):
+    """Secuencia precalculada: de memoria, del caché en disco o construida ahora
+
+    build(recorder) dibuja la animación sobre un IntroRecorder. Hay que subir
+    version cada vez que cambie lo que dibuja, para invalidar el caché.
+    """
+    sequence = _sequences.get(name)
+    if sequence is not None and sequence.version == version:
+        return sequence
+
+    path = os.path.join(cache_dir, f"{name}.bin")
+    sequence = None
+    try:
+        with open(path, 'rb') as f:
+            sequence = IntroSequence.from_bytes(f.read(), version)
+    except OSError:
+        pass
+
+    if sequence is None:
+        recorder = IntroRecorder()
+        build(recorder)
+        sequence = IntroSequence(recorder.frames, version)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            temporary = path + '.tmp'
+            with open(temporary, 'wb') as f:
+                f.write(sequence.to_bytes())
+            os.replace(temporary, path)
+        except OSError:
+            pass  # Sin caché en disco (p. ej. tarjeta de solo lectura): se recalcula en cada arranque
+
+    _sequences[name] = sequence
+    return sequence
@@ -0,0 +1,63 @@
+# 💤 IMPORTACIONES DIFERIDAS
+# numpy tarda en importarse (en una Pi Zero, más de un segundo) y hay módulos
+# que solo lo necesitan en algunos casos:
+#   np = lazy_import('numpy')   # None si no está instalado, como el try/except
+# El módulo real se importa en el primer acceso a un atributo; desde entonces
+# sus atributos se copian al proxy y acceder a ellos cuesta lo mismo que antes.
+
+import importlib
+import importlib.util
+import sys
+import threading
+
+
+class LazyModule:
+    """Proxy de un módulo que se importa en el primer acceso a un atributo"""
+
+    def __init__(self, name):
+        self.__dict__['_lazy_name'] = name
+        self.__dict__['_lazy_lock'] = threading.Lock()
+
+    def _lazy_load(self):
+        with self._lazy_lock:
+            module = importlib.import_module(self._lazy_name)
+            if '__name__' not in self.__dict__:
+                self.__dict__.update(module.__dict__)
+        return module
+
+    @property
+    def loaded(self):
+        return '__name__' in self.__dict__
+
+    def __getattr__(self, name):
+        # Solo llega aquí lo que aún no está copiado en el proxy
+        if name.startswith('_lazy'):
+            raise AttributeError(name)
+        self._lazy_load()
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            raise AttributeError(f"module {self._lazy_name!r} has no attribute {name!r}") from None
+
+    def __repr__(self):
+        state = 'cargado' if self.loaded else 'pendiente'
+        return f"<LazyModule {self._lazy_name} ({state})>"
+
+
+def available(name):
+    """Si el módulo se puede importar, sin importarlo"""
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def lazy_import(name):
+    """El módulo ya importado, un LazyModule, o None si no está instalado"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name) if available(name) else None
+
@@ -0,0 +1,587 @@
+# 🧮 MOTORES DEL JUEGO DE LA VIDA
+# Backends de simulación para ConwayGame (CONWAY.py)
+# Cada motor guarda el tablero a su manera pero expone la misma interfaz:
+#   get / set / toggle / clear / step / population / live_cells / to_grid / load_grid
+#   snapshot / restore (estado inmutable y hashable, para detectar y repetir ciclos)
+
+from lazy_imports import lazy_import
+
+# numpy solo se importa si se crea un NumpyLife (los tableros de la matriz
+# usan el bitboard y no lo necesitan nunca)
+np = lazy_import('numpy')
+
+# 🌐 TOPOLOGÍAS DE BORDE
+# bounded: fuera del tablero todo está muerto
+# torus:   los bordes opuestos se tocan (izquierda-derecha y arriba-abajo)
+# klein:   como el toro, pero al cruzar arriba/abajo el mundo se refleja en x
+TOPOLOGIES = ('bounded', 'torus', 'klein')
+
+
+class LifeEngine:
+    """Base común de los motores: dimensiones, topología y conversiones"""
+
+    def __init__(self, width=8, height=8, topology='bounded'):
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Topologia desconocida: {topology!r} (opciones: {', '.join(TOPOLOGIES)})")
+        if width < 1 or height < 1:
+            raise ValueError(f"Tamaño de tablero invalido: {width}x{height}")
+        self.width = width
+        self.height = height
+        self.topology = topology
+
+    def wrap(self, x, y):
+        """Aplica la topología a (x, y); devuelve None si cae fuera de un tablero acotado"""
+        if self.topology == 'bounded':
+            if 0 <= x < self.width and 0 <= y < self.height:
+                return x, y
+            return None
+        if not 0 <= y < self.height:
+            y %= self.height
+            if self.topology == 'klein':
+                x = self.width - 1 - x
+        return x % self.width, y
+
+    def toggle(self, x, y):
+        """Alterna la célula (x, y) y devuelve su nuevo estado"""
+        alive = not self.get(x, y)
+        self.set(x, y, alive)
+        return alive
+
+    def to_grid(self):
+        """Convierte el tablero a la grilla clásica grid[y][x]"""
+        grid = [[False] * self.width for _ in range(self.height)]
+        for x, y in self.live_cells():
+            grid[y][x] = True
+        return grid
+
+    def load_grid(self, grid):
+        """Carga una grilla grid[y][x] de booleanos"""
+        self.clear()
+        for y, row in enumerate(grid):
+            for x, alive in enumerate(row):
+                if alive:
+                    self.set(x, y, True)
+
+    def region(self, x0, y0, width, height):
+        """Devuelve las filas [y][x] de la ventana que empieza en (x0, y0)"""
+        return [[self.get(x0 + x, y0 + y) for x in range(width)] for y in range(height)]
+
+
+class BitboardLife(LifeEngine):
+    """Motor bitboard: todo el tablero en un único entero (bit = y * width + x)
+
+    Con 8x8 es un entero de 64 bits; con tableros mayores Python usa enteros
+    grandes y cada generación sigue siendo una docena de desplazamientos y
+    operaciones lógicas sobre el tablero entero.
+    """
+
+    def __init__(self, width=8, height=8, topology='bounded'):
+        super().__init__(width, height, topology)
+        self.board = 0
+
+        # 📐 Máscaras precalculadas
+        row = (1 << width) - 1
+        self.full_mask = (1 << (width * height)) - 1
+        self.first_col = self.full_mask // row            # Casillas con x == 0
+        self.last_col = self.first_col << (width - 1)     # Casillas con x == width - 1
+        self.not_first_col = self.full_mask ^ self.first_col
+        self.not_last_col = self.full_mask ^ self.last_col
+        self.first_row = row
+        self.last_row_shift = width * (height - 1)
+
+    def _bit(self, x, y):
+        return 1 << (y * self.width + x)
+
+    def get(self, x, y):
+        """Devuelve True si la célula (x, y) está viva"""
+        return bool(self.board >> (y * self.width + x) & 1)
+
+    def set(self, x, y, alive):
+        """Fija el estado de la célula (x, y)"""
+        if alive:
+            self.board |= self._bit(x, y)
+        else:
+            self.board &= ~self._bit(x, y)
+
+    def toggle(self, x, y):
+        self.board ^= self._bit(x, y)
+        return self.get(x, y)
+
+    def clear(self):
+        self.board = 0
+
+    def population(self):
+        return bin(self.board).count("1")
+
+    def snapshot(self):
+        return self.board
+
+    def restore(self, snapshot):
+        self.board = snapshot
+
+    def live_cells(self):
+        """Itera las coordenadas (x, y) de las células vivas"""
+        # Recorrer la representación binaria es lineal en el tamaño del
+        # tablero, mientras que aislar bit a bit sería cuadrático en enteros grandes
+        bits = bin(self.board)[:1:-1]
+        index = bits.find("1")
+        while index != -1:
+            yield index % self.width, index // self.width
+            index = bits.find("1", index + 1)
+
+    def load_grid(self, grid):
+        board = 0
+        for y, row in enumerate(grid):
+            row_bits = 0
+            for x, alive in enumerate(row):
+                if alive:
+                    row_bits |= 1 << x
+            board |= row_bits << (y * self.width)
+        self.board = board
+
+    def region(self, x0, y0, width, height):
+        window = (1 << width) - 1
+        rows = []
+        for y in range(y0, y0 + height):
+            bits = self.board >> (y * self.width + x0) & window
+            rows.append([bool(bits >> x & 1) for x in range(width)])
+        return rows
+
+    def _reverse_row(self, row_bits):
+        """Refleja una fila en x (para el borde de la botella de Klein)"""
+        return int(format(row_bits, f"0{self.width}b")[::-1], 2)
+
+    # Cada desplazamiento deja en la casilla (x, y) el valor de un vecino
+    def _from_west(self, b):
+        shifted = (b << 1) & self.not_first_col
+        if self.topology != 'bounded':
+            shifted |= (b >> (self.width - 1)) & self.first_col
+        return shifted
+
+    def _from_east(self, b):
+        shifted = (b >> 1) & self.not_last_col
+        if self.topology != 'bounded':
+            shifted |= (b & self.first_col) << (self.width - 1)
+        return shifted
+
+    def _from_north(self, b):
+        shifted = (b << self.width) & self.full_mask
+        if self.topology != 'bounded':
+            last_row = b >> self.last_row_shift
+            if self.topology == 'klein':
+                last_row = self._reverse_row(last_row)
+            shifted |= last_row
+        return shifted
+
+    def _from_south(self, b):
+        shifted = b >> self.width
+        if self.topology != 'bounded':
+            first_row = b & self.first_row
+            if self.topology == 'klein':
+                first_row = self._reverse_row(first_row)
+            shifted |= first_row << self.last_row_shift
+        return shifted
+
+    def step(self):
+        """Avanza una generación con sumadores de bits desplazados"""
+        b = self.board
+        north = self._from_north(b)
+        south = self._from_south(b)
+        neighbors = (
+            self._from_west(b), self._from_east(b), north, south,
+            self._from_west(north), self._from_east(north),
+            self._from_west(south), self._from_east(south),
+        )
+
+        # Contador de vecinos en paralelo: s0 y s1 son los bits 0 y 1 del
+        # conteo, s2 se activa (y se queda) en cuanto hay 4 o más vecinos
+        s0 = s1 = s2 = 0
+        for n in neighbors:
+            carry0 = s0 & n
+            s0 ^= n
+            carry1 = s1 & carry0
+            s1 ^= carry0
+            s2 |= carry1
+
+        # Sobrevive con 2 o 3 vecinos, nace con exactamente 3
+        self.board = ~s2 & s1 & (s0 | b) & self.full_mask
+
+
+class NumpyLife(LifeEngine):
+    """Motor vectorizado: el tablero es un ndarray y cada generación son
+    ocho sumas de vistas desplazadas más una expresión booleana"""
+
+    def __init__(self, width=8, height=8, topology='bounded'):
+        if np is None:
+            raise RuntimeError("NumpyLife necesita numpy instalado")
+        super().__init__(width, height, topology)
+        self.cells = np.zeros((height, width), dtype=np.uint8)
+
+    def get(self, x, y):
+        return bool(self.cells[y, x])
+
+    def set(self, x, y, alive):
+        self.cells[y, x] = 1 if alive else 0
+
+    def clear(self):
+        self.cells.fill(0)
+
+    def population(self):
+        return int(np.count_nonzero(self.cells))
+
+    def snapshot(self):
+        return self.cells.tobytes()
+
+    def restore(self, snapshot):
+        self.cells = np.frombuffer(snapshot, dtype=np.uint8).reshape(self.height, self.width).copy()
+
+    def live_cells(self):
+        ys, xs = np.nonzero(self.cells)
+        return zip(xs.tolist(), ys.tolist())
+
+    def to_grid(self):
+        return self.cells.astype(bool).tolist()
+
+    def load_grid(self, grid):
+        self.cells = np.array(grid, dtype=bool).astype(np.uint8).reshape(self.height, self.width)
+
+    def region(self, x0, y0, width, height):
+        return self.cells[y0:y0 + height, x0:x0 + width].astype(bool).tolist()
+
+    def _padded(self):
+        """Tablero con un borde de una célula según la topología"""
+        cells = self.cells
+        if self.topology == 'bounded':
+            return np.pad(cells, 1)
+        if self.topology == 'torus':
+            return np.pad(cells, 1, mode='wrap')
+        # Klein: la fila que cruza arriba/abajo llega reflejada en x;
+        # después el borde izquierdo/derecho se envuelve como en el toro
+        rows = np.concatenate((cells[-1:, ::-1], cells, cells[:1, ::-1]))
+        return np.pad(rows, ((0, 0), (1, 1)), mode='wrap')
+
+    def step(self):
+        cells = self.cells
+        p = self._padded()
+        neighbors = (p[:-2, :-2] + p[:-2, 1:-1] + p[:-2, 2:] +
+                     p[1:-1, :-2] + p[1:-1, 2:] +
+                     p[2:, :-2] + p[2:, 1:-1] + p[2:, 2:])
+        # Nace con 3 vecinos, sobrevive con 2 o 3
+        self.cells = ((neighbors == 3) | ((cells == 1) & (neighbors == 2))).astype(np.uint8)
+
+
+class SparseLife(LifeEngine):
+    """Motor disperso: conjunto de células vivas y conjunto de cambios
+
+    Una célula solo puede cambiar si algo cambió en su vecindario en el paso
+    anterior, así que cada generación revisa únicamente los vecindarios de
+    las células que cambiaron. El coste depende de la actividad, no del área.
+    """
+
+    def __init__(self, width=8, height=8, topology='bounded'):
+        super().__init__(width, height, topology)
+        self.live = set()
+        self.changed = set()  # Células que cambiaron desde la última generación
+
+    def get(self, x, y):
+        return (x, y) in self.live
+
+    def set(self, x, y, alive):
+        if alive and (x, y) not in self.live:
+            self.live.add((x, y))
+            self.changed.add((x, y))
+        elif not alive and (x, y) in self.live:
+            self.live.discard((x, y))
+            self.changed.add((x, y))
+
+    def clear(self):
+        # Un tablero vacío es estable: no hay nada que revisar
+        self.live = set()
+        self.changed = set()
+
+    def population(self):
+        return len(self.live)
+
+    def snapshot(self):
+        return frozenset(self.live)
+
+    def restore(self, snapshot):
+        # Lo que difiere del estado actual es lo que hay que revisar en el próximo paso
+        self.changed = self.live.symmetric_difference(snapshot)
+        self.live = set(snapshot)
+
+    def live_cells(self):
+        return iter(list(self.live))
+
+    def _neighborhood(self, x, y):
+        """Las 9 casillas del vecindario de (x, y), ya envueltas según la topología"""
+        if 0 < x < self.width - 1 and 0 < y < self.height - 1:
+            return [(x + dx, y + dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1)]
+        cells = []
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                cell = self.wrap(x + dx, y + dy)
+                if cell is not None:
+                    cells.append(cell)
+        return cells
+
+    def step(self):
+        live = self.live
+        candidates = set()
+        for x, y in self.changed:
+            candidates.update(self._neighborhood(x, y))
+
+        births = []
+        deaths = []
+        for x, y in candidates:
+            alive = (x, y) in live
+            # El vecindario incluye la propia célula: 3 en total siempre vive,
+            # 4 en total conserva el estado actual
+            total = 0
+            for cell in self._neighborhood(x, y):
+                if cell in live:
+                    total += 1
+            if alive:
+                if total != 3 and total != 4:
+                    deaths.append((x, y))
+            elif total == 3:
+                births.append((x, y))
+
+        live.difference_update(deaths)
+        live.update(births)
+        self.changed = set(births)
+        self.changed.update(deaths)
+
+
+# 🌳 HASHLIFE
+HASHLIFE_MAX_NODES = 200000  # Nodos + resultados memorizados antes de recolectar
+
+
+class _Node:
+    """Nodo inmutable del quadtree; los hijos son nw, ne, sw, se"""
+    __slots__ = ('nw', 'ne', 'sw', 'se', 'level', 'population')
+
+    def __init__(self, nw, ne, sw, se, level, population):
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+
+class HashLife:
+    """Quadtree memoizado (HashLife) sobre un plano infinito
+
+    Un nodo de nivel k cubre 2^k x 2^k células centradas en el origen. Cada
+    nodo es único (hash-consing), así que regiones repetidas en espacio o en
+    tiempo se calculan una sola vez. Cuando la tabla supera max_nodes se
+    descartan los resultados memorizados y los nodos que ya no cuelgan de la raíz.
+    """
+
+    def __init__(self, max_nodes=HASHLIFE_MAX_NODES):
+        self.max_nodes = max_nodes
+        self._interned = True  # False si se vaciaron las tablas en mitad de un salto
+        self.overflows = 0     # Veces que se agotó max_nodes en mitad de un salto
+        self.dead = _Node(None, None, None, None, 0, 0)
+        self.alive = _Node(None, None, None, None, 0, 1)
+        self._reset_caches()
+        self.root = self._empty(3)
+
+    def _reset_caches(self):
+        self._nodes = {}
+        self._results = {}
+        self._empties = [self.dead]
+
+    def _join(self, nw, ne, sw, se):
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            node = _Node(nw, ne, sw, se, nw.level + 1,
+                         nw.population + ne.population + sw.population + se.population)
+            self._nodes[key] = node
+        return node
+
+    def _empty(self, level):
+        while len(self._empties) <= level:
+            e = self._empties[-1]
+            self._empties.append(self._join(e, e, e, e))
+        return self._empties[level]
+
+    def _centre(self, m):
+        """Nodo un nivel mayor con m en el centro"""
+        z = self._empty(m.level - 1)
+        return self._join(self._join(z, z, z, m.nw), self._join(z, z, m.ne, z),
+                          self._join(z, m.sw, z, z), self._join(m.se, z, z, z))
+
+    def _is_padded(self, m):
+        """True si toda la población está en la mitad central del nodo"""
+        inner = m.nw.se.population + m.ne.sw.population + m.sw.ne.population + m.se.nw.population
+        return inner == m.population
+
+    def _life_4x4(self, m):
+        """Caso base: centro 2x2 de un nodo 4x4 tras una generación"""
+        rows = [
+            [m.nw.nw, m.nw.ne, m.ne.nw, m.ne.ne],
+            [m.nw.sw, m.nw.se, m.ne.sw, m.ne.se],
+            [m.sw.nw, m.sw.ne, m.se.nw, m.se.ne],
+            [m.sw.sw, m.sw.se, m.se.sw, m.se.se],
+        ]
+        quad = []
+        for y in (1, 2):
+            for x in (1, 2):
+                neighbors = sum(rows[y + dy][x + dx].population
+                                for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy)
+                alive = rows[y][x].population
+                quad.append(self.alive if neighbors == 3 or (alive and neighbors == 2) else self.dead)
+        return self._join(*quad)
+
+    def _successor(self, m, j):
+        """Centro de m (nivel k-1) tras 2^j generaciones (como mucho 2^(k-2))"""
+        # Un salto mayor que 2^(k-2) no cabe en el nodo: se normaliza para no
+        # guardar el mismo resultado con varias j
+        j = min(j, m.level - 2)
+        key = (m, j)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if m.population == 0:
+            result = m.nw
+        elif m.level == 2:
+            result = self._life_4x4(m)
+        else:
+            join = self._join
+            a, b, c, d = m.nw, m.ne, m.sw, m.se
+            # Nueve subnodos solapados de nivel k-1
+            c1 = self._successor(join(a.nw, a.ne, a.sw, a.se), j)
+            c2 = self._successor(join(a.ne, b.nw, a.se, b.sw), j)
+            c3 = self._successor(join(b.nw, b.ne, b.sw, b.se), j)
+            c4 = self._successor(join(a.sw, a.se, c.nw, c.ne), j)
+            c5 = self._successor(join(a.se, b.sw, c.ne, d.nw), j)
+            c6 = self._successor(join(b.sw, b.se, d.nw, d.ne), j)
+            c7 = self._successor(join(c.nw, c.ne, c.sw, c.se), j)
+            c8 = self._successor(join(c.ne, d.nw, c.se, d.sw), j)
+            c9 = self._successor(join(d.nw, d.ne, d.sw, d.se), j)
+            if j < m.level - 2:
+                # Salto corto: basta recombinar los centros
+                result = join(join(c1.se, c2.sw, c4.ne, c5.nw), join(c2.se, c3.sw, c5.ne, c6.nw),
+                              join(c4.se, c5.sw, c7.ne, c8.nw), join(c5.se, c6.sw, c8.ne, c9.nw))
+            else:
+                # Salto completo: dos mitades de 2^(k-3) generaciones
+                result = join(self._successor(join(c1, c2, c4, c5), j),
+                              self._successor(join(c2, c3, c5, c6), j),
+                              self._successor(join(c4, c5, c7, c8), j),
+                              self._successor(join(c5, c6, c8, c9), j))
+
+        self._results[key] = result
+        if len(self._nodes) + len(self._results) > self.max_nodes:
+            # Presupuesto agotado en mitad del salto: se olvida lo memorizado. Los
+            # nodos en uso siguen referenciados desde la pila, así que el resultado
+            # no cambia; advance vuelve a internar la raíz al terminar
+            self._reset_caches()
+            self._interned = False
+            self.overflows += 1
+        return result
+
+    def _collect(self):
+        """Expulsa resultados memorizados y nodos que no forman parte de la raíz"""
+        old_root = self.root
+        self._reset_caches()
+        rebuilt = {}
+
+        def intern(node):
+            if node.level == 0:
+                return node
+            if node.population == 0:
+                return self._empty(node.level)
+            copy = rebuilt.get(id(node))
+            if copy is None:
+                copy = self._join(intern(node.nw), intern(node.ne), intern(node.sw), intern(node.se))
+                rebuilt[id(node)] = copy
+            return copy
+
+        self.root = intern(old_root)
+        self._interned = True
+
+    def cache_size(self):
+        return len(self._nodes) + len(self._results)
+
+    def load(self, cells):
+        """Carga un iterable de coordenadas (x, y) vivas"""
+        cells = list(cells)
+        extent = max((max(abs(x), abs(y)) for x, y in cells), default=0)
+        level = 3
+        while (1 << (level - 1)) <= extent:
+            level += 1
+
+        def build(level, x0, y0, points):
+            if not points:
+                return self._empty(level)
+            if level == 0:
+                return self.alive
+            half = 1 << (level - 1)
+            quads = ([], [], [], [])
+            for x, y in points:
+                quads[(2 if y >= y0 + half else 0) + (1 if x >= x0 + half else 0)].append((x, y))
+            return self._join(build(level - 1, x0, y0, quads[0]),
+                              build(level - 1, x0 + half, y0, quads[1]),
+                              build(level - 1, x0, y0 + half, quads[2]),
+                              build(level - 1, x0 + half, y0 + half, quads[3]))
+
+        origin = -(1 << (level - 1))
+        self.root = build(level, origin, origin, cells)
+
+    def advance(self, generations):
+        """Avanza el patrón, descomponiendo el salto en potencias de dos"""
+        for j in reversed(range(generations.bit_length())):
+            if generations >> j & 1:
+                root = self.root
+                while root.level < j + 2 or not self._is_padded(root):
+                    root = self._centre(root)
+                # Margen extra: en 2^j generaciones nada viaja más de 2^j células
+                self.root = self._successor(self._centre(root), j)
+                if self.cache_size() > self.max_nodes or not self._interned:
+                    self._collect()
+
+    def population(self):
+        return self.root.population
+
+    def live_cells(self):
+        """Lista de coordenadas (x, y) vivas"""
+        cells = []
+        stack = [(self.root, -(1 << (self.root.level - 1)), -(1 << (self.root.level - 1)))]
+        while stack:
+            node, x, y = stack.pop()
+            if node.population == 0:
+                continue
+            if node.level == 0:
+                cells.append((x, y))
+                continue
+            half = 1 << (node.level - 1)
+            stack.append((node.nw, x, y))
+            stack.append((node.ne, x + half, y))
+            stack.append((node.sw, x, y + half))
+            stack.append((node.se, x + half, y + half))
+        return cells
+
+
+ENGINES = {
+    'bitboard': BitboardLife,
+    'numpy': NumpyLife,
+    'sparse': SparseLife,
+}
+
+
+def create_engine(width=8, height=8, topology='bounded', engine='auto'):
+    """Crea el motor pedido; 'auto' usa numpy si está instalado
+
+    Los tableros que caben en la matriz LED se quedan en el bitboard: con 64
+    células un entero de 64 bits es más barato que cualquier llamada a numpy.
+    """
+    if engine == 'auto':
+        fits_display = width * height <= 64
+        engine = 'numpy' if np is not None and not fits_display else 'bitboard'
+    if engine not in ENGINES:
+        raise ValueError(f"Motor desconocido: {engine!r} (opciones: auto, {', '.join(ENGINES)})")
+    return ENGINES[engine](width, height, topology)
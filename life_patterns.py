@@ -0,0 +1,166 @@
+# 📚 BIBLIOTECA DE PATRONES DEL JUEGO DE LA VIDA
+# Carga patrones desde un directorio en los formatos estándar:
+#   .rle          Run Length Encoded (x = .., y = .., rule = ..)
+#   .cells        texto plano (O / * vivas, . muertas, ! comentarios)
+#   .lif / .life  Life 1.06 (una coordenada "x y" por línea)
+# Cada patrón es una tupla de coordenadas (x, y) con origen en (0, 0)
+
+import os
+import re
+from collections import OrderedDict
+
+PATTERNS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'patterns')
+PATTERN_CACHE_SIZE = 64  # Patrones ya parseados que se mantienen en memoria
+
+RLE_TOKEN = re.compile(r'(\d*)([A-Za-z.$!])')
+RLE_TRAILING_COUNT = re.compile(r'\d*$')
+
+
+def parse_rle(lines):
+    """Parsea un patrón RLE línea a línea, sin leer el archivo completo en memoria"""
+    cells = []
+    x = y = 0
+    header_seen = False
+    pending = ''  # Dígitos de un conteo que quedó partido al final de la línea
+    for number, line in enumerate(lines, 1):
+        line = ''.join(line.split())
+        if not line or line.startswith('#'):
+            continue
+        if not header_seen and line.startswith('x'):
+            # Cabecera "x = 3, y = 3, rule = B3/S23": el tamaño sale de las células
+            header_seen = True
+            continue
+        line = pending + line
+        split = RLE_TRAILING_COUNT.search(line).start()
+        line, pending = line[:split], line[split:]
+        position = 0
+        for token in RLE_TOKEN.finditer(line):
+            if token.start() != position:
+                raise ValueError(f"linea {number} no valida en RLE: {line[position:]!r}")
+            position = token.end()
+            count, tag = token.groups()
+            run = int(count) if count else 1
+            if tag in 'b.':
+                x += run
+            elif tag == '$':
+                x = 0
+                y += run
+            elif tag == '!':
+                return tuple(cells)
+            else:
+                # 'o' y cualquier otro estado se consideran células vivas
+                cells.extend((x + i, y) for i in range(run))
+                x += run
+        if position != len(line):
+            raise ValueError(f"linea {number} no valida en RLE: {line[position:]!r}")
+    return tuple(cells)
+
+
+def parse_plaintext(lines):
+    """Parsea un patrón .cells"""
+    cells = []
+    y = 0
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if line.startswith('!'):
+            continue
+        cells.extend((x, y) for x, char in enumerate(line) if char in 'O*')
+        y += 1
+    return tuple(cells)
+
+
+def parse_life106(lines):
+    """Parsea un patrón Life 1.06 y lo normaliza para que empiece en (0, 0)"""
+    cells = []
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if line.startswith('#Life ') and line.split()[1] != '1.06':
+            # Life 1.05 también usa .lif, pero dibuja bloques en vez de listar coordenadas
+            raise ValueError(f"formato no soportado: {line!r} (solo Life 1.06)")
+        if not line or line.startswith('#'):
+            continue
+        try:
+            x, y = line.split()[:2]
+            cells.append((int(x), int(y)))
+        except ValueError:
+            raise ValueError(f"linea {number} no valida en Life 1.06: {line!r}") from None
+    if not cells:
+        return ()
+    min_x = min(x for x, _ in cells)
+    min_y = min(y for _, y in cells)
+    return tuple((x - min_x, y - min_y) for x, y in cells)
+
+
+PARSERS = {
+    '.rle': parse_rle,
+    '.cells': parse_plaintext,
+    '.lif': parse_life106,
+    '.life': parse_life106,
+}
+
+
+def pattern_size(cells):
+    """Ancho y alto del rectángulo que contiene al patrón"""
+    if not cells:
+        return 0, 0
+    return max(x for x, _ in cells) + 1, max(y for _, y in cells) + 1
+
+
+class PatternLibrary:
+    """Directorio de patrones indexado por nombre bajo demanda
+
+    El índice (nombre -> archivo) se construye la primera vez que se necesita
+    y los patrones parseados se guardan en una caché LRU, así que cambiar entre
+    patrones ya usados nunca vuelve a leer el archivo.
+    """
+
+    def __init__(self, directory=PATTERNS_DIR, cache_size=PATTERN_CACHE_SIZE):
+        self.directory = directory
+        self.cache_size = cache_size
+        self._index = None
+        self._cache = OrderedDict()
+
+    def _build_index(self):
+        index = {}
+        if os.path.isdir(self.directory):
+            for filename in sorted(os.listdir(self.directory)):
+                name, extension = os.path.splitext(filename)
+                if extension.lower() in PARSERS:
+                    index.setdefault(name.lower(), os.path.join(self.directory, filename))
+        return index
+
+    def names(self):
+        """Nombres de todos los patrones disponibles"""
+        if self._index is None:
+            self._index = self._build_index()
+        return sorted(self._index)
+
+    def refresh(self):
+        """Volver a escanear el directorio en el próximo acceso"""
+        self._index = None
+
+    def get(self, name):
+        """Devuelve las células del patrón, parseándolo solo si no está en caché"""
+        name = name.lower()
+        cells = self._cache.get(name)
+        if cells is not None:
+            self._cache.move_to_end(name)
+            return cells
+
+        if self._index is None:
+            self._index = self._build_index()
+        path = self._index.get(name)
+        if path is None:
+            raise KeyError(f"Patron desconocido: {name!r}")
+
+        parser = PARSERS[os.path.splitext(path)[1].lower()]
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            try:
+                cells = parser(f)
+            except ValueError as error:
+                raise ValueError(f"{os.path.basename(path)}: {error}") from None
+
+        self._cache[name] = cells
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return cells
@@ -9,7 +9,8 @@ Juego de reflejos con Sense HAT para Raspberry Pi
 import time
 import random
 import os
-from sense_hat import SenseHat
+from headless_sense import create_sense_hat
+from framebuffer import FrameBuffer
 
 # Configuración
 DIRECCIONES = ['arriba', 'abajo', 'izquierda', 'derecha']
@@ -59,12 +60,14 @@ COLOR = (0, 255, 0)
 FONDO = (0, 0, 0)
 CLASIFICACION_FILE = 'clasificacion.txt'
 
-sense = SenseHat()
+sense = create_sense_hat(lazy=True)  # Se crea al primer uso
+display = FrameBuffer(sense)
 
 def mostrar_flecha(direccion):
     matriz = FLECHAS[direccion]
     pixels = [COLOR if cell else FONDO for row in matriz for cell in row]
-    sense.set_pixels(pixels)
+    display.set_pixels(pixels)
+    display.flush()
 
 def leer_inclinacion():
     orientation = sense.get_orientation_degrees()
@@ -91,7 +94,8 @@ def jugar_ronda():
             break
         time.sleep(0.05)
     tiempo_reaccion = time.time() - tiempo_inicio
-    sense.clear()
+    display.clear()
+    display.flush()
     return tiempo_reaccion, direccion
 
 def pedir_nombre():
@@ -142,8 +146,9 @@ def main():
     clasif = cargar_clasificacion()
     mostrar_tabla(clasif)
     print("\n¡Gracias por jugar!")
-    sense.show_message("Fin!", text_colour=COLOR)
-    sense.clear()
+    display.show_message("Fin!", text_colour=COLOR)
+    display.clear()
+    display.flush()
 
 if __name__ == "__main__":
     main()
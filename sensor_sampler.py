@@ -0,0 +1,163 @@
+# 🌡️ MUESTREO DE SENSORES EN SEGUNDO PLANO
+# Las lecturas del Sense HAT van por I2C y tardan milisegundos; un hilo las hace
+# a su propio ritmo y el bucle de frames solo consulta el último valor guardado.
+#   - cada sensor tiene su frecuencia (SENSOR_RATES, en lecturas por segundo)
+#   - el último valor vive en un hueco que se reemplaza de una sola asignación,
+#     así que leerlo nunca espera a un lock
+#   - se guarda un historial corto por sensor para calcular tendencias
+#   - drain() entrega las lecturas nuevas para pasarlas a un SensorFeed (el
+#     bucle de frames así ve valores fijos durante todo el frame y puede grabarlos)
+
+import threading
+import time
+from collections import deque
+
+SENSOR_RATES = {
+    'temperature': 1.0,      # Cambia despacio: 1 lectura por segundo basta
+    'pressure': 1.0,
+    'humidity': 0.5,
+    'accelerometer': 20.0,   # El movimiento tiene que notarse enseguida
+}
+SENSOR_HISTORY = 16          # Lecturas recientes que se guardan por sensor
+SENSOR_FRESH_LIMIT = 256     # Lecturas pendientes de drain() como máximo
+
+SENSOR_READERS = {
+    'temperature': 'get_temperature',
+    'pressure': 'get_pressure',
+    'humidity': 'get_humidity',
+    'accelerometer': 'get_accelerometer_raw',
+    'gyroscope': 'get_gyroscope_raw',
+    'orientation': 'get_orientation_degrees',
+}
+
+
+class SensorSampler:
+    """Lecturas cacheadas de los sensores del Sense HAT
+
+    Con start() un hilo lee cada sensor a su frecuencia. Sin hilo, latest()
+    hace las lecturas que ya tocaban en el propio hilo que pregunta, de modo
+    que la frecuencia de cada sensor se respeta igual.
+    """
+
+    def __init__(self, sense, rates=None, history=SENSOR_HISTORY):
+        self.sense = sense
+        self.rates = dict(SENSOR_RATES if rates is None else rates)
+        for name in self.rates:
+            if name not in SENSOR_READERS:
+                raise ValueError(f"Sensor desconocido: {name!r}")
+        self.readings = {name: None for name in self.rates}  # name -> (tiempo, valor)
+        self._history = {name: deque(maxlen=history) for name in self.rates}
+        self._due = {name: 0.0 for name in self.rates}
+        self._fresh = deque(maxlen=SENSOR_FRESH_LIMIT)
+        self.errors = {}  # name -> última excepción al leer
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sample(self, name):
+        """Lee el sensor ahora mismo y guarda el valor"""
+        now = time.time()
+        try:
+            value = getattr(self.sense, SENSOR_READERS[name])()
+        except Exception as e:
+            self.errors[name] = e
+            return None
+        self.readings[name] = (now, value)
+        self._history[name].append(value)
+        self._fresh.append((name, value))
+        return value
+
+    def drain(self):
+        """Lecturas (sensor, valor) nuevas desde el último drain, en orden de llegada"""
+        fresh = []
+        while self._fresh:
+            fresh.append(self._fresh.popleft())
+        return fresh
+
+    def poll(self, now=None):
+        """Lee los sensores cuyo turno ya llegó; devuelve el próximo vencimiento"""
+        now = time.time() if now is None else now
+        for name, rate in self.rates.items():
+            if now >= self._due[name]:
+                self.sample(name)
+                self._due[name] = now + 1.0 / rate
+        return min(self._due.values(), default=now + 1.0)
+
+    def _run(self):
+        while not self._stop.is_set():
+            next_due = self.poll()
+            self._stop.wait(max(0.0, next_due - time.time()))
+
+    def start(self):
+        """Arranca el hilo de muestreo (la primera lectura de cada sensor es inmediata)"""
+        if self._thread is not None:
+            return self
+        self.poll()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def latest(self, name, default=None):
+        """Último valor leído del sensor (sin esperar a ninguna lectura en curso)"""
+        if self._thread is None:
+            self.poll()
+        reading = self.readings.get(name)
+        return default if reading is None else reading[1]
+
+    def age(self, name):
+        """Segundos desde la última lectura del sensor (None si nunca se leyó)"""
+        reading = self.readings.get(name)
+        return None if reading is None else time.time() - reading[0]
+
+    def history(self, name):
+        """Lecturas recientes del sensor, de la más vieja a la más nueva"""
+        return list(self._history[name])
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+class SensorFeed:
+    """Lecturas que llegan desde fuera, con la misma interfaz de consulta que SensorSampler
+
+    El bucle de frames le pasa con feed() las lecturas nuevas (del sampler en
+    vivo o de una grabación) al empezar cada frame.
+    """
+
+    def __init__(self, history=SENSOR_HISTORY):
+        self.history_size = history
+        self.readings = {}
+        self._history = {}
+        self.errors = {}
+
+    def feed(self, readings):
+        now = time.time()
+        for name, value in readings:
+            self.readings[name] = (now, value)
+            if name not in self._history:
+                self._history[name] = deque(maxlen=self.history_size)
+            self._history[name].append(value)
+
+    def latest(self, name, default=None):
+        reading = self.readings.get(name)
+        return default if reading is None else reading[1]
+
+    def age(self, name):
+        reading = self.readings.get(name)
+        return None if reading is None else time.time() - reading[0]
+
+    def history(self, name):
+        return list(self._history.get(name, ()))
@@ -0,0 +1,133 @@
+# 🎬 GRABACIÓN Y REPRODUCCIÓN DE SESIONES
+# Guarda todo lo que entra de fuera en una sesión (semilla, lecturas de sensores
+# y eventos del joystick, con el frame en que se aplicaron) para poder repetirla
+# frame a frame sin hardware.
+#
+# Formato binario (little endian):
+#   cabecera   b'QDRC', versión (B), semilla (q)
+#   registros  tipo (B), frame (I) y según el tipo:
+#     SENSOR     sensor (B), número de valores (B), valores (d...)
+#     JOYSTICK   dirección (B), acción (B)
+#     END        CRC32 del estado de las partículas acumulado tick a tick (I,
+#                state_digest de QUANTUM_DREAMSCAPE); el frame es el total de frames
+
+import struct
+from collections import defaultdict
+
+from headless_sense import DIRECTIONS, InputEvent
+from sensor_sampler import SENSOR_READERS
+
+MAGIC = b'QDRC'
+VERSION = 1
+
+RECORD_SENSOR = 1
+RECORD_JOYSTICK = 2
+RECORD_END = 3
+
+SENSORS = tuple(SENSOR_READERS)
+SENSOR_AXES = {
+    'accelerometer': ('x', 'y', 'z'),
+    'gyroscope': ('x', 'y', 'z'),
+    'orientation': ('pitch', 'roll', 'yaw'),
+}
+ACTIONS = ('pressed', 'released', 'held')
+
+HEADER = struct.Struct('<4sBq')
+RECORD = struct.Struct('<BI')
+SENSOR_HEADER = struct.Struct('<BB')
+JOYSTICK = struct.Struct('<BB')
+END = struct.Struct('<I')
+
+
+def _encode_sensor(name, value):
+    axes = SENSOR_AXES.get(name)
+    values = [value[axis] for axis in axes] if axes else [value]
+    return (SENSOR_HEADER.pack(SENSORS.index(name), len(values)) +
+            struct.pack(f'<{len(values)}d', *values))
+
+
+def _decode_sensor(name, values):
+    axes = SENSOR_AXES.get(name)
+    return dict(zip(axes, values)) if axes else values[0]
+
+
+class SessionRecorder:
+    """Escribe una sesión a medida que se juega"""
+
+    def __init__(self, path, seed):
+        self.path = path
+        self.seed = seed
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed))
+
+    def frame(self, index, readings=(), events=()):
+        """Registra las lecturas y eventos que se aplicaron al empezar el frame index"""
+        chunks = []
+        for name, value in readings:
+            chunks.append(RECORD.pack(RECORD_SENSOR, index) + _encode_sensor(name, value))
+        for event in events:
+            chunks.append(RECORD.pack(RECORD_JOYSTICK, index) +
+                          JOYSTICK.pack(DIRECTIONS.index(event.direction), ACTIONS.index(event.action)))
+        if chunks:
+            self.file.write(b''.join(chunks))
+
+    def close(self, frames, digest=0):
+        """Cierra la grabación con el total de frames y el CRC acumulado del estado (state_digest)"""
+        if self.file is None:
+            return
+        self.file.write(RECORD.pack(RECORD_END, frames) + END.pack(digest))
+        self.file.close()
+        self.file = None
+
+
+class SessionReplay:
+    """Sesión grabada cargada en memoria, consultable por frame"""
+
+    def __init__(self, path):
+        self.path = path
+        self.readings = defaultdict(list)  # frame -> [(sensor, valor)]
+        self.events = defaultdict(list)    # frame -> [InputEvent]
+        self.frames = None                 # None si la grabación quedó cortada
+        self.digest = None
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} no es una grabacion de sesion compatible")
+        magic, version, self.seed = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} no es una grabacion de sesion compatible")
+        offset = HEADER.size
+        last_frame = -1
+        # Una grabación cortada (corte de luz, Ctrl+C) termina en el último registro completo
+        while offset + RECORD.size <= len(data):
+            kind, frame = RECORD.unpack_from(data, offset)
+            offset += RECORD.size
+            if kind == RECORD_SENSOR:
+                if offset + SENSOR_HEADER.size > len(data):
+                    break
+                sensor, count = SENSOR_HEADER.unpack_from(data, offset)
+                offset += SENSOR_HEADER.size
+                if offset + 8 * count > len(data):
+                    break
+                values = struct.unpack_from(f'<{count}d', data, offset)
+                offset += 8 * count
+                name = SENSORS[sensor]
+                self.readings[frame].append((name, _decode_sensor(name, values)))
+            elif kind == RECORD_JOYSTICK:
+                if offset + JOYSTICK.size > len(data):
+                    break
+                direction, action = JOYSTICK.unpack_from(data, offset)
+                offset += JOYSTICK.size
+                self.events[frame].append(InputEvent(0.0, DIRECTIONS[direction], ACTIONS[action]))
+            elif kind == RECORD_END:
+                if offset + END.size > len(data):
+                    break
+                self.frames = frame
+                self.digest = END.unpack_from(data, offset)[0]
+                break
+            else:
+                raise ValueError(f"Registro desconocido {kind} en {path}")
+            last_frame = frame
+        if self.frames is None:
+            self.frames = last_frame + 1
@@ -2,12 +2,16 @@
 # Autor: GitHub Copilot
 # Este juego utiliza la pantalla LED y el joystick del Sense HAT
 
-from sense_hat import SenseHat
+from headless_sense import create_sense_hat
+from collections import deque
 from time import sleep
+import argparse
 import random
 
-sense = SenseHat()
-sense.clear()
+from framebuffer import FrameBuffer
+
+sense = create_sense_hat(lazy=True)  # Se crea al primer uso
+display = FrameBuffer(sense)
 
 # Colores
 SNAKE_COLOR = (0, 255, 0)
@@ -20,64 +24,160 @@ DOWN = (0, 1)
 LEFT = (-1, 0)
 RIGHT = (1, 0)
 
-direction = RIGHT
-next_direction = RIGHT
+# Tablero (puede ser mayor que la matriz: se ve una ventana de 8x8 que sigue a la cabeza)
+DISPLAY_SIZE = 8
+BOARD_WIDTH = 8
+BOARD_HEIGHT = 8
+TICK_SECONDS = 0.3
+
+class SnakeGame:
+    """Estado de la partida con coste constante por movimiento
+
+    Las celdas se numeran y * ancho + x. El cuerpo es un deque (cabeza a la
+    izquierda), occupied marca las celdas del cuerpo para ver choques sin
+    recorrerlo, y las celdas libres se guardan en una lista con su posición
+    en free_index: sacar o devolver una celda y elegir la comida es O(1).
+    """
+
+    def __init__(self, width=BOARD_WIDTH, height=BOARD_HEIGHT, rng=random):
+        self.width = width
+        self.height = height
+        self.rng = rng
+        cells = width * height
+        self.occupied = bytearray(cells)
+        self.free = list(range(cells))
+        self.free_index = list(range(cells))  # celda -> posición en free (-1 si ocupada)
+        self.body = deque()
+        self.direction = RIGHT
+        self.next_direction = RIGHT
+
+        # Serpiente inicial en el centro, mirando a la derecha
+        head_x, head_y = width // 2, height // 2
+        for x in (head_x, head_x - 1):
+            cell = head_y * width + x
+            self.body.append(cell)
+            self._occupy(cell)
+        self.food = self.random_free_cell()
+
+    def _occupy(self, cell):
+        self.occupied[cell] = 1
+        # Se quita de free moviendo la última celda libre a su hueco
+        position = self.free_index[cell]
+        last = self.free.pop()
+        if last != cell:
+            self.free[position] = last
+            self.free_index[last] = position
+        self.free_index[cell] = -1
+
+    def _release(self, cell):
+        self.occupied[cell] = 0
+        self.free_index[cell] = len(self.free)
+        self.free.append(cell)
+
+    def random_free_cell(self):
+        """Una celda libre al azar, o None si la serpiente llena el tablero"""
+        if not self.free:
+            return None
+        return self.free[self.rng.randrange(len(self.free))]
+
+    @property
+    def head(self):
+        return divmod(self.body[0], self.width)[::-1]
 
-# Inicializar serpiente y comida
-snake = [(4, 4), (3, 4)]
-food = (random.randint(0, 7), random.randint(0, 7))
-while food in snake:
-    food = (random.randint(0, 7), random.randint(0, 7))
+    @property
+    def length(self):
+        return len(self.body)
+
+    def step(self):
+        """Avanza una celda; devuelve False si la serpiente choca"""
+        self.direction = self.next_direction
+        head_x, head_y = self.head
+        x = head_x + self.direction[0]
+        y = head_y + self.direction[1]
+        # Comprobar colisiones
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        cell = y * self.width + x
+        if self.occupied[cell]:
+            return False
+        self.body.appendleft(cell)
+        self._occupy(cell)
+        if cell == self.food:
+            # Nueva comida directamente de las celdas libres
+            self.food = self.random_free_cell()
+        else:
+            self._release(self.body.pop())
+        return True
+
+    def turn(self, direction):
+        """Cambia la dirección del próximo paso (nunca media vuelta)"""
+        if (direction[0] + self.direction[0], direction[1] + self.direction[1]) != (0, 0):
+            self.next_direction = direction
+
+    def view(self):
+        """Esquina de la ventana visible, centrada en la cabeza sin salirse del tablero"""
+        head_x, head_y = self.head
+        view_x = min(max(0, head_x - DISPLAY_SIZE // 2), max(0, self.width - DISPLAY_SIZE))
+        view_y = min(max(0, head_y - DISPLAY_SIZE // 2), max(0, self.height - DISPLAY_SIZE))
+        return view_x, view_y
+
+game = SnakeGame()
 
 def draw():
-    sense.clear()
-    for segment in snake:
-        sense.set_pixel(segment[0], segment[1], SNAKE_COLOR)
-    sense.set_pixel(food[0], food[1], FOOD_COLOR)
+    # Solo la ventana visible: el coste no depende del largo de la serpiente
+    display.clear(BG_COLOR)
+    view_x, view_y = game.view()
+    width = game.width
+    occupied = game.occupied
+    for y in range(min(DISPLAY_SIZE, game.height)):
+        row = (view_y + y) * width + view_x
+        for x in range(min(DISPLAY_SIZE, width)):
+            cell = row + x
+            if occupied[cell]:
+                display.set_pixel(x, y, SNAKE_COLOR)
+            elif cell == game.food:
+                display.set_pixel(x, y, FOOD_COLOR)
+    display.flush()
 
 def move():
-    global snake, food, direction
-    new_head = (snake[0][0] + direction[0], snake[0][1] + direction[1])
-    # Comprobar colisiones
-    if (new_head[0] < 0 or new_head[0] > 7 or
-        new_head[1] < 0 or new_head[1] > 7 or
-        new_head in snake):
-        sense.show_message('Game Over', text_colour=[255,0,0])
-        sense.clear()
-        exit()
-    snake.insert(0, new_head)
-    if new_head == food:
-        # Nueva comida
-        while True:
-            food_pos = (random.randint(0, 7), random.randint(0, 7))
-            if food_pos not in snake:
-                break
-        globals()['food'] = food_pos
-    else:
-        snake.pop()
+    """Avanza un paso; devuelve (mensaje, color) si la partida terminó, o None"""
+    if not game.step():
+        return 'Game Over', [255, 0, 0]
+    if game.food is None:
+        # No queda sitio para más comida: tablero lleno
+        return 'You Win!', [0, 255, 0]
+    return None
+
+def end_game(message, colour):
+    display.show_message(message, text_colour=colour)
+    display.clear()
+    display.flush()
+
+DIRECTIONS = {'up': UP, 'down': DOWN, 'left': LEFT, 'right': RIGHT}
 
 def joystick_event(event):
-    global next_direction
     if event.action != 'pressed':
         return
-    if event.direction == 'up' and direction != DOWN:
-        next_direction = UP
-    elif event.direction == 'down' and direction != UP:
-        next_direction = DOWN
-    elif event.direction == 'left' and direction != RIGHT:
-        next_direction = LEFT
-    elif event.direction == 'right' and direction != LEFT:
-        next_direction = RIGHT
-
-sense.stick.direction_any = joystick_event
-
-def main():
-    global direction
+    if event.direction in DIRECTIONS:
+        game.turn(DIRECTIONS[event.direction])
+
+def main(width=BOARD_WIDTH, height=BOARD_HEIGHT, tick=TICK_SECONDS):
+    global game
+    sense.clear()
+    sense.stick.direction_any = joystick_event
+    game = SnakeGame(width, height)
     while True:
-        direction = next_direction
-        move()
+        result = move()
+        if result:
+            end_game(*result)
+            return
         draw()
-        sleep(0.3)
+        sleep(tick)
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description="Snake para el Sense HAT")
+    parser.add_argument('--width', type=int, default=BOARD_WIDTH, help="ancho del tablero")
+    parser.add_argument('--height', type=int, default=BOARD_HEIGHT, help="alto del tablero")
+    parser.add_argument('--tick', type=float, default=TICK_SECONDS, help="segundos entre movimientos")
+    args = parser.parse_args()
+    main(args.width, args.height, args.tick)
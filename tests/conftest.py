@@ -0,0 +1,6 @@
+# Los tests corren sin hardware: los programas usan el sustituto en memoria
+import os
+import sys
+
+os.environ.setdefault('SENSE_HAT_HEADLESS', '1')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,87 @@
+# FrameScheduler con un reloj falso: ritmos exactos sin dormir de verdad
+import pytest
+
+from frame_scheduler import FrameScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_scheduler(tick_rate=10, render_rate=30, **kwargs):
+    clock = FakeClock()
+    return FrameScheduler(tick_rate, render_rate, clock=clock, sleep=clock.sleep, **kwargs), clock
+
+
+def test_fixed_tick_and_render_rates():
+    scheduler, clock = make_scheduler(tick_rate=10, render_rate=30)
+    alphas = []
+    scheduler.run(lambda: None, alphas.append, should_stop=lambda: clock.now >= 5.0)
+    assert scheduler.ticks == pytest.approx(50, abs=1)
+    assert scheduler.frames == pytest.approx(150, abs=2)
+    assert scheduler.skipped_ticks == 0
+    assert all(0.0 <= alpha <= 1.0 for alpha in alphas)
+
+
+def test_render_every_loop_without_render_rate():
+    scheduler, clock = make_scheduler(tick_rate=4, render_rate=None)
+    scheduler.run(lambda: None, lambda alpha: None, should_stop=lambda: clock.now >= 2.0)
+    # Sin límite de dibujo se duerme hasta el próximo tick: un dibujo por tick
+    assert scheduler.ticks == pytest.approx(8, abs=1)
+    assert scheduler.frames == pytest.approx(scheduler.ticks, abs=1)
+
+
+def test_catch_up_is_bounded_and_skips_the_rest():
+    scheduler, clock = make_scheduler(tick_rate=10, render_rate=None, max_catch_up=3)
+    updates = []
+    scheduler.step(lambda: updates.append(clock.now), lambda alpha: None)
+    clock.now += 1.0  # Un parón de 10 ticks
+    scheduler.step(lambda: updates.append(clock.now), lambda alpha: None)
+    assert len(updates) == 3
+    assert scheduler.skipped_ticks == 7
+    assert scheduler.dropped_frames == 2
+    # El atraso descartado no vuelve en la siguiente vuelta
+    clock.now += 0.05
+    scheduler.step(lambda: updates.append(clock.now), lambda alpha: None)
+    assert len(updates) == 3
+
+
+def test_slow_render_drops_frames_not_ticks():
+    scheduler, clock = make_scheduler(tick_rate=20, render_rate=20)
+
+    def slow_render(alpha):
+        clock.now += 0.12  # Cada dibujo tarda más de dos ticks
+
+    scheduler.run(lambda: None, slow_render, should_stop=lambda: clock.now >= 3.0)
+    assert scheduler.ticks == pytest.approx(60, abs=scheduler.max_catch_up + 1)
+    assert scheduler.frames < scheduler.ticks
+    assert scheduler.dropped_frames > 0
+
+
+def test_tick_rate_can_change_while_running():
+    scheduler, clock = make_scheduler(tick_rate=10, render_rate=None)
+    scheduler.run(lambda: None, lambda alpha: None, should_stop=lambda: clock.now >= 1.0)
+    scheduler.tick_rate = 40
+    scheduler.run(lambda: None, lambda alpha: None, should_stop=lambda: clock.now >= 2.0)
+    assert scheduler.ticks == pytest.approx(50, abs=2)
+
+
+def test_stop_from_update_and_stats():
+    scheduler, clock = make_scheduler(tick_rate=10)
+
+    def update():
+        if scheduler.ticks == 9:
+            scheduler.stop()
+
+    scheduler.run(update, lambda alpha: None)
+    stats = scheduler.stats()
+    assert stats['ticks'] == 10
+    assert stats['tick_rate'] == pytest.approx(10, rel=0.15)
+    assert not scheduler.running
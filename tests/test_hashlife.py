@@ -0,0 +1,153 @@
+# HashLife contra un paso de referencia en el plano infinito, y el salto 'j N' de CONWAY
+import contextlib
+import io
+import random
+import threading
+from collections import Counter
+
+import pytest
+
+import CONWAY
+from life_engines import HashLife
+
+NEIGHBORS = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy]
+GLIDER = ((1, 0), (2, 1), (0, 2), (1, 2), (2, 2))
+R_PENTOMINO = ((1, 0), (2, 0), (0, 1), (1, 1), (1, 2))
+
+
+def plane_step(cells):
+    counts = Counter((x + dx, y + dy) for x, y in cells for dx, dy in NEIGHBORS)
+    return {cell for cell, count in counts.items() if count == 3 or (count == 2 and cell in cells)}
+
+
+def plane_run(cells, generations):
+    cells = set(cells)
+    for _ in range(generations):
+        cells = plane_step(cells)
+    return cells
+
+
+def random_soup(seed, size=12, density=0.4, offset=-6):
+    rng = random.Random(seed)
+    return {(x + offset, y + offset) for y in range(size) for x in range(size) if rng.random() < density}
+
+
+@pytest.mark.parametrize('generations', [1, 2, 3, 7, 16, 37, 100])
+@pytest.mark.parametrize('seed', range(3))
+def test_hashlife_matches_plane(seed, generations):
+    cells = random_soup(seed)
+    life = HashLife()
+    life.load(cells)
+    life.advance(generations)
+    assert set(life.live_cells()) == plane_run(cells, generations)
+    assert life.population() == len(plane_run(cells, generations))
+
+
+def test_successive_advances_add_up():
+    life = HashLife()
+    life.load(R_PENTOMINO)
+    for generations in (5, 11, 64, 3):
+        life.advance(generations)
+    assert set(life.live_cells()) == plane_run(R_PENTOMINO, 83)
+
+
+def test_memo_stays_within_budget_and_keeps_results():
+    """Con un presupuesto pequeño las tablas se vacían en mitad del salto sin cambiar el resultado"""
+    peak = [0]
+
+    class Probe(HashLife):
+        def _successor(self, m, j):
+            result = super()._successor(m, j)
+            peak[0] = max(peak[0], self.cache_size())
+            return result
+
+    cells = random_soup(11, size=16)
+    small = Probe(max_nodes=300)
+    small.load(cells)
+    small.advance(200)
+    large = HashLife(max_nodes=10 ** 9)
+    large.load(cells)
+    large.advance(200)
+    assert set(small.live_cells()) == set(large.live_cells())
+    # Entre dos comprobaciones un nodo solo crea unas pocas uniones (los 9 subnodos y el resultado)
+    assert peak[0] <= small.max_nodes + 32
+    assert large.cache_size() > small.max_nodes  # Sin presupuesto el memo sí habría crecido
+    assert small.overflows > 0 and large.overflows == 0
+
+
+def test_memo_keys_are_normalized():
+    life = HashLife()
+    life.load(R_PENTOMINO)
+    life.advance(1000)
+    assert all(j <= node.level - 2 for node, j in life._results)
+
+
+def make_game(width, height, topology, cells, engine='auto'):
+    with contextlib.redirect_stdout(io.StringIO()):
+        game = CONWAY.ConwayGame(width, height, topology, engine)
+    for x, y in cells:
+        game.engine.set(x, y, True)
+    return game
+
+
+def quiet_jump(game, generations):
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.jump(generations)
+
+
+def stepped(width, height, topology, cells, generations):
+    game = make_game(width, height, topology, cells)
+    for _ in range(generations):
+        game.engine.step()
+    return set(game.engine.live_cells())
+
+
+def test_jump_on_small_bounded_board_matches_evolve():
+    # El glider choca con la esquina y queda un bloque (lo que HashLife recortado perdía)
+    game = make_game(8, 8, 'bounded', GLIDER)
+    quiet_jump(game, 40)
+    assert set(game.engine.live_cells()) == {(6, 6), (6, 7), (7, 6), (7, 7)}
+    assert game.generation == 40
+
+
+@pytest.mark.parametrize('cell_cost', [0.0, 1.0], ids=['hashlife', 'motor'])
+@pytest.mark.parametrize('topology', ['bounded', 'torus', 'klein'])
+def test_jump_matches_stepping(monkeypatch, topology, cell_cost):
+    # cell_cost 0 hace que HashLife siempre parezca más barato, 1 que nunca lo parezca
+    monkeypatch.setattr(CONWAY, 'HASHLIFE_CELL_COST', cell_cost)
+    width, height = 41, 37
+    cells = {(x + 14, y + 12) for x, y in random_soup(5, size=12, offset=0)}
+    game = make_game(width, height, topology, cells)
+    quiet_jump(game, 150)
+    assert set(game.engine.live_cells()) == stepped(width, height, topology, cells, 150)
+
+
+@pytest.mark.parametrize('topology', ['torus', 'klein'])
+def test_tiled_hashlife_matches_wrapped_world(topology):
+    width, height = 24, 19
+    cells = random_soup(8, size=18, offset=0)
+    game = make_game(width, height, topology, cells)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.hashlife_advance(min(width, height))
+    assert set(game.engine.live_cells()) == stepped(width, height, topology, cells, min(width, height))
+
+
+def test_jump_skips_repeated_laps():
+    # En un toro de 8x8 el glider se repite cada 32 generaciones
+    game = make_game(8, 8, 'torus', GLIDER)
+    quiet_jump(game, 10 ** 9 + 5)
+    assert set(game.engine.live_cells()) == stepped(8, 8, 'torus', GLIDER, 5)
+    assert game.generation == 10 ** 9 + 5
+
+
+def test_jump_waits_for_the_game_lock():
+    game = make_game(8, 8, 'bounded', GLIDER)
+    with game.lock:
+        worker = threading.Thread(target=quiet_jump, args=(game, 4))
+        worker.start()
+        worker.join(0.2)
+        assert worker.is_alive()
+        assert set(game.engine.live_cells()) == set(GLIDER)
+    worker.join(5)
+    assert not worker.is_alive()
+    assert game.generation == 4
@@ -0,0 +1,117 @@
+# Parsers de patrones: ida y vuelta desde cada formato y archivos dañados
+import random
+
+import pytest
+
+from life_patterns import PatternLibrary, parse_life106, parse_plaintext, parse_rle, pattern_size
+
+GLIDER = ((1, 0), (2, 1), (0, 2), (1, 2), (2, 2))
+
+
+def to_rle(cells, line_length=70):
+    """Codifica células en RLE (con conteos y líneas cortadas en cualquier punto)"""
+    live = set(cells)
+    width, height = pattern_size(cells)
+    runs = []
+    for y in range(height):
+        row = [(x, y) in live for x in range(width)]
+        while row and not row[-1]:
+            row.pop()
+        x = 0
+        while x < len(row):
+            run = 1
+            while x + run < len(row) and row[x + run] == row[x]:
+                run += 1
+            runs.append((run, 'o' if row[x] else 'b'))
+            x += run
+        runs.append((1, '$' if y < height - 1 else '!'))
+    text = ''.join(f"{run if run > 1 else ''}{tag}" for run, tag in runs)
+    lines = [text[i:i + line_length] for i in range(0, len(text), line_length)]
+    return [f"x = {width}, y = {height}, rule = B3/S23\n"] + [line + '\n' for line in lines]
+
+
+def to_plaintext(cells):
+    live = set(cells)
+    width, height = pattern_size(cells)
+    return ['!Name: prueba\n'] + [
+        ''.join('O' if (x, y) in live else '.' for x in range(width)) + '\n'
+        for y in range(height)]
+
+
+def to_life106(cells, offset=(-7, 3)):
+    return ['#Life 1.06\n'] + [f"{x + offset[0]} {y + offset[1]}\n" for x, y in cells]
+
+
+def random_pattern(seed, width=23, height=17):
+    rng = random.Random(seed)
+    cells = {(x, y) for y in range(height) for x in range(width) if rng.random() < 0.4}
+    # Normalizado a (0, 0), como devuelven los parsers
+    min_x = min(x for x, _ in cells)
+    min_y = min(y for _, y in cells)
+    return {(x - min_x, y - min_y) for x, y in cells}
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('line_length', [3, 7, 70])
+def test_rle_round_trip(seed, line_length):
+    # Líneas cortas: los conteos de varias cifras quedan partidos entre líneas
+    cells = random_pattern(seed)
+    assert set(parse_rle(to_rle(cells, line_length))) == cells
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_plaintext_round_trip(seed):
+    cells = random_pattern(seed)
+    assert set(parse_plaintext(to_plaintext(cells))) == cells
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_life106_round_trip(seed):
+    cells = random_pattern(seed)
+    assert set(parse_life106(to_life106(cells))) == cells
+
+
+def test_rle_details():
+    lines = ['#N Glider\n', '#C comentario\n', 'x = 3, y = 3\n', 'bo$2b\n', 'o$3o! texto tras el final\n']
+    assert set(parse_rle(lines)) == set(GLIDER)
+    # Varias filas vacías con un solo conteo, espacios y '.' como célula muerta
+    assert set(parse_rle(['o3$ 2.o!'])) == {(0, 0), (2, 3)}
+    # Sin '!' final se toma lo leído
+    assert set(parse_rle(['2o$2o'])) == {(0, 0), (1, 0), (0, 1), (1, 1)}
+
+
+@pytest.mark.parametrize('line', ['3o?2b!', 'bo$2bo$3o%', 'obo$-1o!'])
+def test_rle_rejects_malformed(line):
+    with pytest.raises(ValueError, match='linea'):
+        parse_rle(['x = 3, y = 3\n', line + '\n'])
+
+
+def test_life106_rejects_other_formats():
+    with pytest.raises(ValueError, match='1.05'):
+        parse_life106(['#Life 1.05\n', '#P -1 -1\n', '.*.\n'])
+    with pytest.raises(ValueError, match='linea 3'):
+        parse_life106(['#Life 1.06\n', '0 0\n', '1 x\n'])
+
+
+def test_library_loads_and_caches(tmp_path):
+    (tmp_path / 'glider.rle').write_text(''.join(to_rle(GLIDER)))
+    (tmp_path / 'Block.cells').write_text('OO\nOO\n')
+    (tmp_path / 'roto.lif').write_text('#Life 1.05\n.*.\n')
+    (tmp_path / 'notas.txt').write_text('no es un patron')
+    library = PatternLibrary(str(tmp_path), cache_size=1)
+    assert library.names() == ['block', 'glider', 'roto']
+    assert set(library.get('GLIDER')) == set(GLIDER)
+    assert library.get('glider') is library.get('glider')
+    assert set(library.get('block')) == {(0, 0), (1, 0), (0, 1), (1, 1)}
+    with pytest.raises(KeyError):
+        library.get('nada')
+    with pytest.raises(ValueError, match='roto.lif'):
+        library.get('roto')
+
+
+def test_bundled_patterns_parse():
+    library = PatternLibrary()
+    for name in library.names():
+        cells = library.get(name)
+        assert cells, name
+        assert min(x for x, _ in cells) >= 0 and min(y for _, y in cells) >= 0
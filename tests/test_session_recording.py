@@ -0,0 +1,110 @@
+# Grabación de sesiones: ida y vuelta del formato y replay determinista
+import io
+import random
+
+import pytest
+
+from headless_sense import DIRECTIONS, InputEvent
+from session_recording import ACTIONS, SessionRecorder, SessionReplay
+
+
+def random_inputs(rng, frame):
+    readings = []
+    if frame % 3 == 0:
+        readings.append(('temperature', rng.uniform(18, 32)))
+        readings.append(('pressure', rng.uniform(990, 1030)))
+        readings.append(('humidity', rng.uniform(20, 80)))
+    readings.append(('accelerometer', {axis: rng.uniform(-1, 1) for axis in 'xyz'}))
+    if frame % 5 == 0:
+        readings.append(('orientation', {'pitch': rng.uniform(0, 360), 'roll': rng.uniform(0, 360),
+                                         'yaw': rng.uniform(0, 360)}))
+    events = []
+    if rng.random() < 0.2:
+        events.append(InputEvent(0.0, rng.choice(DIRECTIONS), rng.choice(ACTIONS)))
+    return readings, events
+
+
+def write_session(path, seed, frames, digest=0x1234abcd):
+    rng = random.Random(seed)
+    recorded = []
+    recorder = SessionRecorder(str(path), seed)
+    for frame in range(frames):
+        readings, events = random_inputs(rng, frame)
+        recorder.frame(frame, readings, events)
+        recorded.append((readings, events))
+    recorder.close(frames, digest)
+    return recorded
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / 'sesion.qdr'
+    recorded = write_session(path, 42, 60)
+    session = SessionReplay(str(path))
+    assert session.seed == 42
+    assert session.frames == 60
+    assert session.digest == 0x1234abcd
+    for frame, (readings, events) in enumerate(recorded):
+        assert session.readings.get(frame, []) == readings
+        assert [(e.direction, e.action) for e in session.events.get(frame, [])] == \
+            [(e.direction, e.action) for e in events]
+
+
+def test_truncated_recording_keeps_complete_records(tmp_path):
+    path = tmp_path / 'sesion.qdr'
+    write_session(path, 7, 40)
+    data = path.read_bytes()
+    full = SessionReplay(str(path))
+    for cut in range(20, len(data), 7):
+        path.write_bytes(data[:cut])
+        session = SessionReplay(str(path))
+        assert session.digest is None
+        assert session.frames <= full.frames
+        # Lo que se cargó es un prefijo de la grabación completa
+        for frame in range(session.frames - 1):
+            assert session.readings.get(frame, []) == full.readings.get(frame, [])
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'otro.bin'
+    path.write_bytes(b'INTR' + bytes(20))
+    with pytest.raises(ValueError):
+        SessionReplay(str(path))
+    path.write_bytes(b'QD')
+    with pytest.raises(ValueError):
+        SessionReplay(str(path))
+
+
+def test_replay_reproduces_recorded_run(tmp_path, monkeypatch):
+    """Una sesión jugada (dibujando a otro ritmo) y su replay acaban en el mismo estado"""
+    quantum = pytest.importorskip('QUANTUM_DREAMSCAPE')
+    from sensor_sampler import SensorFeed
+
+    # replay() sustituye estos globales; monkeypatch los deja como estaban
+    for name in ('sense', 'display', 'ecosystem'):
+        monkeypatch.setattr(quantum, name, getattr(quantum, name, None), raising=False)
+
+    seed = 2024
+    frames = 150
+    path = tmp_path / 'sesion.qdr'
+    rng = random.Random(seed)
+    random.seed(seed)
+    feed = SensorFeed()
+    ecosystem = quantum.EmotionalEcosystem(seed=seed, sampler=feed)
+    ecosystem.logger.stream = io.StringIO()
+    quantum.ecosystem = ecosystem
+    recorder = SessionRecorder(str(path), seed)
+    digest = 0
+    for frame in range(frames):
+        readings, events = random_inputs(rng, frame)
+        recorder.frame(frame, readings, events)
+        quantum.apply_frame_inputs(feed, readings, events)
+        quantum.run_tick(ecosystem, frame + 1)
+        digest = quantum.state_digest(ecosystem, digest)
+        # El dibujo va desacoplado: no puede influir en la simulación
+        for _ in range(frame % 3):
+            ecosystem.render(alpha=rng.random())
+    recorder.close(frames, digest)
+    ecosystem.logger.close()
+
+    assert quantum.replay(str(path), log_stream=io.StringIO()) == digest
+    assert quantum.replay(str(path), log_stream=io.StringIO()) == digest
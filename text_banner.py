@@ -0,0 +1,211 @@
+# 🔤 TEXTOS DESPLAZABLES PRERRENDERIZADOS
+# show_message del Sense HAT vuelve a rasterizar el texto en cada llamada y
+# bloquea el hilo mientras dura el scroll. Aquí cada texto se rasteriza una
+# sola vez a una tira de columnas de 8 pixeles (fuente 5x7 incluida), que se
+# guarda en caché por (texto, color, fondo):
+#   - scroll_text() la recorre bloqueando, como show_message (para avisos
+#     finales como "Game Over", cuando ya no hay bucle de frames)
+#   - BannerQueue la dibuja desde el bucle de frames, una columna cada
+#     scroll_speed segundos, así la simulación sigue corriendo durante el texto
+#
+# Uso en un bucle de frames:
+#   banners = BannerQueue()
+#   banners.show("HOLA", text_colour=(0, 255, 0))
+#   ...dibujar el frame...
+#   banners.draw(display)   # encima de lo dibujado, antes del flush
+
+import time
+import unicodedata
+from collections import OrderedDict, deque
+
+WIDTH = 8
+HEIGHT = 8
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+
+DEFAULT_SCROLL_SPEED = 0.1  # Segundos por columna, como show_message
+TEXT_TOP = 1                # Fila de la matriz donde empiezan los glifos
+SPACE_WIDTH = 3             # Columnas del espacio (el resto de glifos se recortan)
+BANNER_CACHE_SIZE = 32      # Textos rasterizados que se mantienen en memoria
+
+# Fuente 5x7 clásica: 5 columnas por carácter, bit 0 = fila de arriba
+FONT_5X7 = {
+    ' ': (0x00, 0x00, 0x00, 0x00, 0x00), '!': (0x00, 0x00, 0x5F, 0x00, 0x00),
+    '"': (0x00, 0x07, 0x00, 0x07, 0x00), '#': (0x14, 0x7F, 0x14, 0x7F, 0x14),
+    '$': (0x24, 0x2A, 0x7F, 0x2A, 0x12), '%': (0x23, 0x13, 0x08, 0x64, 0x62),
+    '&': (0x36, 0x49, 0x55, 0x22, 0x50), "'": (0x00, 0x05, 0x03, 0x00, 0x00),
+    '(': (0x00, 0x1C, 0x22, 0x41, 0x00), ')': (0x00, 0x41, 0x22, 0x1C, 0x00),
+    '*': (0x08, 0x2A, 0x1C, 0x2A, 0x08), '+': (0x08, 0x08, 0x3E, 0x08, 0x08),
+    ',': (0x00, 0x50, 0x30, 0x00, 0x00), '-': (0x08, 0x08, 0x08, 0x08, 0x08),
+    '.': (0x00, 0x60, 0x60, 0x00, 0x00), '/': (0x20, 0x10, 0x08, 0x04, 0x02),
+    '0': (0x3E, 0x51, 0x49, 0x45, 0x3E), '1': (0x00, 0x42, 0x7F, 0x40, 0x00),
+    '2': (0x42, 0x61, 0x51, 0x49, 0x46), '3': (0x21, 0x41, 0x45, 0x4B, 0x31),
+    '4': (0x18, 0x14, 0x12, 0x7F, 0x10), '5': (0x27, 0x45, 0x45, 0x45, 0x39),
+    '6': (0x3C, 0x4A, 0x49, 0x49, 0x30), '7': (0x01, 0x71, 0x09, 0x05, 0x03),
+    '8': (0x36, 0x49, 0x49, 0x49, 0x36), '9': (0x06, 0x49, 0x49, 0x29, 0x1E),
+    ':': (0x00, 0x36, 0x36, 0x00, 0x00), ';': (0x00, 0x56, 0x36, 0x00, 0x00),
+    '<': (0x08, 0x14, 0x22, 0x41, 0x00), '=': (0x14, 0x14, 0x14, 0x14, 0x14),
+    '>': (0x00, 0x41, 0x22, 0x14, 0x08), '?': (0x02, 0x01, 0x51, 0x09, 0x06),
+    '@': (0x32, 0x49, 0x79, 0x41, 0x3E), 'A': (0x7E, 0x11, 0x11, 0x11, 0x7E),
+    'B': (0x7F, 0x49, 0x49, 0x49, 0x36), 'C': (0x3E, 0x41, 0x41, 0x41, 0x22),
+    'D': (0x7F, 0x41, 0x41, 0x22, 0x1C), 'E': (0x7F, 0x49, 0x49, 0x49, 0x41),
+    'F': (0x7F, 0x09, 0x09, 0x01, 0x01), 'G': (0x3E, 0x41, 0x41, 0x51, 0x32),
+    'H': (0x7F, 0x08, 0x08, 0x08, 0x7F), 'I': (0x00, 0x41, 0x7F, 0x41, 0x00),
+    'J': (0x20, 0x40, 0x41, 0x3F, 0x01), 'K': (0x7F, 0x08, 0x14, 0x22, 0x41),
+    'L': (0x7F, 0x40, 0x40, 0x40, 0x40), 'M': (0x7F, 0x02, 0x04, 0x02, 0x7F),
+    'N': (0x7F, 0x04, 0x08, 0x10, 0x7F), 'O': (0x3E, 0x41, 0x41, 0x41, 0x3E),
+    'P': (0x7F, 0x09, 0x09, 0x09, 0x06), 'Q': (0x3E, 0x41, 0x51, 0x21, 0x5E),
+    'R': (0x7F, 0x09, 0x19, 0x29, 0x46), 'S': (0x46, 0x49, 0x49, 0x49, 0x31),
+    'T': (0x01, 0x01, 0x7F, 0x01, 0x01), 'U': (0x3F, 0x40, 0x40, 0x40, 0x3F),
+    'V': (0x1F, 0x20, 0x40, 0x20, 0x1F), 'W': (0x7F, 0x20, 0x18, 0x20, 0x7F),
+    'X': (0x63, 0x14, 0x08, 0x14, 0x63), 'Y': (0x03, 0x04, 0x78, 0x04, 0x03),
+    'Z': (0x61, 0x51, 0x49, 0x45, 0x43), '[': (0x00, 0x7F, 0x41, 0x41, 0x00),
+    '\\': (0x02, 0x04, 0x08, 0x10, 0x20), ']': (0x00, 0x41, 0x41, 0x7F, 0x00),
+    '^': (0x04, 0x02, 0x01, 0x02, 0x04), '_': (0x40, 0x40, 0x40, 0x40, 0x40),
+    '`': (0x00, 0x01, 0x02, 0x04, 0x00), 'a': (0x20, 0x54, 0x54, 0x54, 0x78),
+    'b': (0x7F, 0x48, 0x44, 0x44, 0x38), 'c': (0x38, 0x44, 0x44, 0x44, 0x20),
+    'd': (0x38, 0x44, 0x44, 0x48, 0x7F), 'e': (0x38, 0x54, 0x54, 0x54, 0x18),
+    'f': (0x08, 0x7E, 0x09, 0x01, 0x02), 'g': (0x08, 0x14, 0x54, 0x54, 0x3C),
+    'h': (0x7F, 0x08, 0x04, 0x04, 0x78), 'i': (0x00, 0x44, 0x7D, 0x40, 0x00),
+    'j': (0x20, 0x40, 0x44, 0x3D, 0x00), 'k': (0x7F, 0x10, 0x28, 0x44, 0x00),
+    'l': (0x00, 0x41, 0x7F, 0x40, 0x00), 'm': (0x7C, 0x04, 0x18, 0x04, 0x78),
+    'n': (0x7C, 0x08, 0x04, 0x04, 0x78), 'o': (0x38, 0x44, 0x44, 0x44, 0x38),
+    'p': (0x7C, 0x14, 0x14, 0x14, 0x08), 'q': (0x08, 0x14, 0x14, 0x18, 0x7C),
+    'r': (0x7C, 0x08, 0x04, 0x04, 0x08), 's': (0x48, 0x54, 0x54, 0x54, 0x20),
+    't': (0x04, 0x3F, 0x44, 0x40, 0x20), 'u': (0x3C, 0x40, 0x40, 0x20, 0x7C),
+    'v': (0x1C, 0x20, 0x40, 0x20, 0x1C), 'w': (0x3C, 0x40, 0x30, 0x40, 0x3C),
+    'x': (0x44, 0x28, 0x10, 0x28, 0x44), 'y': (0x0C, 0x50, 0x50, 0x50, 0x3C),
+    'z': (0x44, 0x64, 0x54, 0x4C, 0x44), '{': (0x00, 0x08, 0x36, 0x41, 0x00),
+    '|': (0x00, 0x00, 0x7F, 0x00, 0x00), '}': (0x00, 0x41, 0x36, 0x08, 0x00),
+    '~': (0x02, 0x01, 0x02, 0x04, 0x02), '¡': (0x00, 0x00, 0x7D, 0x00, 0x00),
+    '¿': (0x30, 0x48, 0x45, 0x40, 0x20),
+}
+
+_cache = OrderedDict()  # (texto, color, fondo) -> columnas
+
+
+def _glyph(char):
+    """Columnas de un carácter; las letras con tilde usan la letra base"""
+    glyph = FONT_5X7.get(char)
+    if glyph is None:
+        base = unicodedata.normalize('NFKD', char)[:1]
+        glyph = FONT_5X7.get(base, FONT_5X7['?'])
+    if char == ' ':
+        return glyph[:SPACE_WIDTH]
+    # Sin las columnas vacías de los lados: "I" o "." ocupan lo que se ve
+    start = 0
+    end = len(glyph)
+    while start < end and not glyph[start]:
+        start += 1
+    while end > start and not glyph[end - 1]:
+        end -= 1
+    return glyph[start:end]
+
+
+def rasterize(text, text_colour=WHITE, back_colour=BLACK):
+    """Tira de columnas (8 colores cada una) del texto, con una pantalla vacía a cada lado
+
+    back_colour=None deja el fondo transparente (None en vez de color).
+    El resultado se guarda en caché: volver a pedir el mismo texto no cuesta nada.
+    """
+    text_colour = tuple(text_colour)
+    back_colour = None if back_colour is None else tuple(back_colour)
+    key = (text, text_colour, back_colour)
+    columns = _cache.get(key)
+    if columns is not None:
+        _cache.move_to_end(key)
+        return columns
+
+    blank = (back_colour,) * HEIGHT
+    strip = [blank] * WIDTH
+    for char in text:
+        for bits in _glyph(char):
+            strip.append(tuple(text_colour if TEXT_TOP <= y and (bits >> (y - TEXT_TOP)) & 1
+                               else back_colour for y in range(HEIGHT)))
+        strip.append(blank)  # Separación entre letras
+    strip.extend([blank] * (WIDTH - 1))
+    columns = tuple(strip)
+
+    _cache[key] = columns
+    if len(_cache) > BANNER_CACHE_SIZE:
+        _cache.popitem(last=False)
+    return columns
+
+
+class TextBanner:
+    """Un texto rasterizado que avanza una columna cada scroll_speed segundos"""
+
+    def __init__(self, text, text_colour=WHITE, back_colour=BLACK,
+                 scroll_speed=DEFAULT_SCROLL_SPEED):
+        self.text = text
+        self.columns = rasterize(text, text_colour, back_colour)
+        self.scroll_speed = scroll_speed
+        self.steps = len(self.columns) - WIDTH + 1
+        self.started = None
+
+    @property
+    def duration(self):
+        return self.steps * self.scroll_speed
+
+    def frame(self, step):
+        """Los 64 pixeles del paso dado, fila a fila (None = transparente)"""
+        window = self.columns[step:step + WIDTH]
+        return [column[y] for y in range(HEIGHT) for column in window]
+
+    def step_at(self, now):
+        """Paso que toca mostrar en el instante now (el primero fija el inicio)"""
+        if self.started is None:
+            self.started = now
+        return int((now - self.started) / self.scroll_speed)
+
+
+def scroll_text(display, text, text_colour=WHITE, back_colour=BLACK,
+                scroll_speed=DEFAULT_SCROLL_SPEED, sleep=time.sleep):
+    """Desplaza el texto por la matriz bloqueando, como show_message"""
+    banner = TextBanner(text, text_colour, BLACK if back_colour is None else back_colour,
+                        scroll_speed)
+    for step in range(banner.steps):
+        display.set_pixels(banner.frame(step))
+        display.flush()
+        sleep(scroll_speed)
+
+
+class BannerQueue:
+    """Textos en cola que el bucle de frames dibuja encima de cada frame, sin esperas"""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.pending = deque()
+        self.current = None
+
+    def show(self, text, text_colour=WHITE, back_colour=None,
+             scroll_speed=DEFAULT_SCROLL_SPEED):
+        """Encola un texto; por defecto con fondo transparente sobre el frame"""
+        banner = TextBanner(text, text_colour, back_colour, scroll_speed)
+        self.pending.append(banner)
+        return banner
+
+    @property
+    def active(self):
+        return self.current is not None or bool(self.pending)
+
+    def clear(self):
+        self.pending.clear()
+        self.current = None
+
+    def draw(self, display, now=None):
+        """Dibuja el paso actual del texto en curso; devuelve si había alguno"""
+        now = self.clock() if now is None else now
+        while True:
+            if self.current is None:
+                if not self.pending:
+                    return False
+                self.current = self.pending.popleft()
+            step = self.current.step_at(now)
+            if step < self.current.steps:
+                break
+            self.current = None  # Terminó: el siguiente empieza ahora
+        for i, color in enumerate(self.current.frame(step)):
+            if color is not None:
+                display.set_pixel(i % WIDTH, i // WIDTH, color)
+        return True